@@ -0,0 +1,262 @@
+"""
+Headless per-tick benchmarks of the More Nodes compute functions.
+
+Runs OgnDynamicMatcher.compute and OgnLoggingNode.compute on the omni_standin graph while sweeping the
+number of dynamic inputs, the payload size and the number of ticks, and reports the mean and p99 compute
+latency plus the allocations made per tick. The extension is started as Kit starts it and the update event
+is pumped after every tick, so the nodes run in their default configuration: dynamic attribute edits are
+committed once per frame and the Logging Nodes write through their console sink. The 'logging_global' kind
+goes through the global aggregator instead. The console output is discarded. The time taken to connect the
+inputs and the end of frame work are reported as well.
+
+    python benchmarks/bench_nodes.py --json bench_output.json
+    python benchmarks/bench_nodes.py --quick --compare baseline.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import omni_standin
+
+# Payload name -> float32 element count, 0 is a scalar double
+PAYLOADS = {
+    "scalar": 0,
+    "1KB": 256,
+    "64KB": 16 * 1024,
+    "1MB": 256 * 1024,
+    "4MB": 1024 * 1024,
+}
+
+
+def _payload_value(payload):
+    count = PAYLOADS[payload]
+    if count == 0:
+        return "double", 1.0
+    return "float[]", np.random.default_rng(0).random(count, dtype=np.float32)
+
+
+def build_matcher(graph, input_count, payload, node_name="DynamicMatcher", **settings):
+    """Source node with input_count outputs wired to a DynamicMatcher"""
+    og = sys.modules["omni.graph.core"]
+    type_name, value = _payload_value(payload)
+    attr_type = og.AttributeType.type_from_ogn_type_name(type_name)
+    source = graph.create_source()
+    node = graph.create_node(node_name)
+    # The free input queued by initialize() exists once the frame ends
+    omni_standin.APP.update()
+    for index in range(input_count):
+        source.create_attribute(f"outputs:value{index}", attr_type, og.AttributePortType.ATTRIBUTE_PORT_TYPE_OUTPUT, value)
+        # The node creates the paired output and a new free input at the end of the frame its last one got connected
+        graph.connect(source.get_attribute(f"outputs:value{index}"), node.get_attribute(f"inputs:data{index}"))
+        omni_standin.APP.update()
+    for name, value in settings.items():
+        node.get_attribute(f"inputs:{name}").set(value)
+    return node
+
+
+def build_logging(graph, input_count, payload, **settings):
+    """Source node with input_count outputs wired to a LoggingNode writing to its default console sink"""
+    og = sys.modules["omni.graph.core"]
+    type_name, value = _payload_value(payload)
+    attr_type = og.AttributeType.type_from_ogn_type_name(type_name)
+    source = graph.create_source()
+    node = graph.create_node("LoggingNode")
+    omni_standin.APP.update()
+    node.get_attribute("inputs:execIn").set(og.ExecutionAttributeState.ENABLED)
+    for index in range(input_count):
+        source.create_attribute(f"outputs:value{index}", attr_type, og.AttributePortType.ATTRIBUTE_PORT_TYPE_OUTPUT, value)
+        # The LoggingNode grows a new free input at the end of the frame its last one got connected
+        graph.connect(source.get_attribute(f"outputs:value{index}"), node.get_attribute(f"inputs:dataIn{index}"))
+        omni_standin.APP.update()
+    for name, value in settings.items():
+        node.get_attribute(f"inputs:{name}").set(value)
+    return node
+
+
+def build_logging_global(graph, input_count, payload, **settings):
+    """LoggingNode batching its records through the global aggregator"""
+    return build_logging(graph, input_count, payload, sink="global", **settings)
+
+
+def build_bundle(graph, input_count, payload, **settings):
+    """DynamicMatcher packing its inputs into its output bundle"""
+    return build_matcher(graph, input_count, payload, packBundle=True, **settings)
+
+
+def build_stack(graph, input_count, payload, **settings):
+    """DynamicMatcher stacking its inputs into one contiguous output"""
+    return build_matcher(graph, input_count, payload, stack=True, **settings)
+
+
+def build_synchronizer(graph, input_count, payload, **settings):
+    """Synchronizer interpolating its inputs one tick in the past"""
+    return build_matcher(
+        graph, input_count, payload, node_name="Synchronizer", interpolation="linear", delay=1.0 / 60.0, **settings
+    )
+
+
+BUILDERS = {
+    "matcher": build_matcher,
+    "bundle": build_bundle,
+    "stack": build_stack,
+    "synchronizer": build_synchronizer,
+    "logging": build_logging,
+    "logging_global": build_logging_global,
+}
+
+
+def _tick(graph, node, timeline):
+    """One frame: the compute of the node, then the end of frame work of the extension. Returns both durations."""
+    start = time.perf_counter_ns()
+    graph.compute(node)
+    computed = time.perf_counter_ns()
+    omni_standin.APP.update()
+    timeline.advance(1.0 / 60.0)
+    return computed - start, time.perf_counter_ns() - computed
+
+
+def run_case(node_kind, input_count, payload, ticks, warmup):
+    """Time one configuration, returns its result record"""
+    from isaacsim.nodes.more_nodes.impl.log_sink import flush_all_sinks
+
+    graph = omni_standin.StandInGraph()
+    timeline = omni_standin.TIMELINE
+
+    # The sinks print every record, only the time taken to produce them matters here
+    with open(os.devnull, "w", encoding="utf-8") as null, contextlib.redirect_stdout(null):
+        start = time.perf_counter_ns()
+        node = BUILDERS[node_kind](graph, input_count, payload)
+        build_ns = time.perf_counter_ns() - start
+
+        for _ in range(warmup):
+            _tick(graph, node, timeline)
+
+        # === Latency pass, without tracing overhead ===
+        latencies = []
+        frame_latencies = []
+        for _ in range(ticks):
+            compute_ns, frame_ns = _tick(graph, node, timeline)
+            latencies.append(compute_ns)
+            frame_latencies.append(frame_ns)
+
+        # === Allocation pass ===
+        allocation_ticks = max(1, min(ticks, 50))
+        tracemalloc.start()
+        blocks_before = sys.getallocatedblocks()
+        peak_bytes = []
+        for _ in range(allocation_ticks):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            graph.compute(node)
+            omni_standin.APP.update()
+            peak_bytes.append(tracemalloc.get_traced_memory()[1] - current)
+            timeline.advance(1.0 / 60.0)
+        blocks_after = sys.getallocatedblocks()
+        tracemalloc.stop()
+
+        graph.release_node(node)
+        omni_standin.APP.update()
+        flush_all_sinks()
+
+    latencies.sort()
+    return {
+        "node": node_kind,
+        "inputs": input_count,
+        "payload": payload,
+        "ticks": ticks,
+        "mean_us": statistics.fmean(latencies) / 1000.0,
+        "p99_us": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] / 1000.0,
+        "frame_end_mean_us": statistics.fmean(frame_latencies) / 1000.0,
+        "build_us": build_ns / 1000.0,
+        "alloc_bytes_per_tick": statistics.fmean(peak_bytes),
+        "retained_blocks_per_tick": (blocks_after - blocks_before) / allocation_ticks,
+    }
+
+
+def compare(results, baseline_path, threshold):
+    """Print the cases slower than the baseline by more than threshold, returns their count"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {
+            (result["node"], result["inputs"], result["payload"]): result
+            for result in json.load(f)["results"]
+        }
+    regressions = 0
+    for result in results:
+        reference = baseline.get((result["node"], result["inputs"], result["payload"]))
+        if reference is None or reference["mean_us"] <= 0.0:
+            continue
+        ratio = result["mean_us"] / reference["mean_us"]
+        if ratio > threshold:
+            regressions += 1
+            print(
+                f"REGRESSION {result['node']} inputs={result['inputs']} payload={result['payload']}: "
+                f"{reference['mean_us']:.1f}us -> {result['mean_us']:.1f}us ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", default="matcher,logging,logging_global", help="Comma separated node kinds: " + ", ".join(BUILDERS))
+    parser.add_argument("--inputs", default="1,10,50,100,128", help="Comma separated dynamic input counts")
+    parser.add_argument("--payloads", default=",".join(PAYLOADS), help="Comma separated payloads: " + ", ".join(PAYLOADS))
+    parser.add_argument("--ticks", default="200", help="Comma separated timed tick counts")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed ticks before each case")
+    parser.add_argument("--quick", action="store_true", help="Small sweep for smoke runs")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to check the results against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.inputs, args.payloads, args.ticks = "1,10", "scalar,64KB", "50"
+
+    extension = omni_standin.start_extension()
+
+    results = []
+    for node_kind in args.nodes.split(","):
+        for input_count in map(int, args.inputs.split(",")):
+            for payload in args.payloads.split(","):
+                for ticks in map(int, args.ticks.split(",")):
+                    result = run_case(node_kind, input_count, payload, ticks, args.warmup)
+                    results.append(result)
+                    print(
+                        f"{node_kind:>8} inputs={input_count:<4} payload={payload:<6} ticks={ticks:<5} "
+                        f"mean={result['mean_us']:9.1f}us p99={result['p99_us']:9.1f}us "
+                        f"frame_end={result['frame_end_mean_us']:8.1f}us build={result['build_us']:9.1f}us "
+                        f"alloc={result['alloc_bytes_per_tick']:12.0f}B/tick"
+                    )
+
+    extension.on_shutdown()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "environment": {
+                        "python": platform.python_version(),
+                        "numpy": np.__version__,
+                        "platform": platform.platform(),
+                    },
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Startup benchmarks of the More Nodes extension.
+
+Imports the extension and runs its on_startup() in fresh interpreters on the omni_standin graph, reporting the time
+taken and the modules it loaded, then creates hundreds of instances of every node type and reports the creation
+time and the memory retained per instance.
+
+    python benchmarks/bench_startup.py --json startup_output.json
+    python benchmarks/bench_startup.py --instances 1000 --repeat 10
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import omni_standin
+
+# Modules the extension should only load once a node needs them
+WATCHED_MODULES = (
+    "ast",
+    "concurrent.futures",
+    "lzma",
+    "socket",
+    "isaacsim.nodes.more_nodes.impl.aggregator",
+    "isaacsim.nodes.more_nodes.impl.predicate",
+    "isaacsim.nodes.more_nodes.impl.rotating_file",
+    "isaacsim.nodes.more_nodes.impl.trace",
+)
+
+# Runs in a fresh interpreter, prints one JSON line
+_STARTUP_SCRIPT = """
+import json, sys, time
+import omni_standin
+omni_standin.install()
+before = set(sys.modules)
+start = time.perf_counter_ns()
+import isaacsim.nodes.more_nodes as extension
+imported = time.perf_counter_ns()
+extension.impl._PublicExtension().on_startup("isaacsim.nodes.more_nodes")
+started = time.perf_counter_ns()
+for node_name in omni_standin.NODE_NAMES:
+    __import__(f"{omni_standin.NODES_MODULE}.Ogn{node_name}")
+nodes_imported = time.perf_counter_ns()
+print(json.dumps({
+    "import_ms": (imported - start) / 1e6,
+    "on_startup_ms": (started - imported) / 1e6,
+    "node_modules_ms": (nodes_imported - started) / 1e6,
+    "modules_loaded": len(set(sys.modules) - before),
+    "watched_loaded": sorted(set(sys.modules) & set(sys.argv[1:]) - before),
+}))
+"""
+
+
+def measure_startup(repeat):
+    """Median startup timings over repeat fresh interpreters"""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _STARTUP_SCRIPT, *WATCHED_MODULES],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    result = {
+        key: statistics.median(run[key] for run in runs)
+        for key in ("import_ms", "on_startup_ms", "node_modules_ms", "modules_loaded")
+    }
+    result["watched_loaded"] = runs[-1]["watched_loaded"]
+    return result
+
+
+def measure_instances(node_name, count):
+    """Create count instances of a node type, returns the creation time and retained memory per instance"""
+    graph = omni_standin.StandInGraph(f"/World/Startup_{node_name}")
+    # The first instance pays for the module import
+    graph.release_node(graph.create_node(node_name))
+
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter_ns()
+    nodes = [graph.create_node(node_name) for _ in range(count)]
+    elapsed = time.perf_counter_ns() - start
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    for node in nodes:
+        graph.release_node(node)
+    return {
+        "node": node_name,
+        "instances": count,
+        "create_us_per_instance": elapsed / count / 1000.0,
+        "retained_bytes_per_instance": (after - before) / count,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--instances", type=int, default=500, help="Node instances created per node type")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters started to time the startup")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    startup = measure_startup(args.repeat)
+    print(
+        f"startup import={startup['import_ms']:.2f}ms on_startup={startup['on_startup_ms']:.2f}ms "
+        f"node_modules={startup['node_modules_ms']:.2f}ms modules_loaded={startup['modules_loaded']:.0f}"
+    )
+    print(f"watched modules loaded at startup: {', '.join(startup['watched_loaded']) or 'none'}")
+
+    omni_standin.install()
+    instances = []
+    for node_name in omni_standin.NODE_NAMES:
+        result = measure_instances(node_name, args.instances)
+        instances.append(result)
+        print(
+            f"{node_name:>16} instances={result['instances']:<5} "
+            f"create={result['create_us_per_instance']:8.1f}us "
+            f"retained={result['retained_bytes_per_instance']:9.0f}B/instance"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "environment": {
+                        "python": platform.python_version(),
+                        "platform": platform.platform(),
+                    },
+                    "startup": startup,
+                    "instances": instances,
+                },
+                f,
+                indent=2,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,763 @@
+"""
+Lightweight in-process stand-in for the parts of omni.graph.core, carb, omni.timeline, omni.kit.app and omni.ext
+used by the More Nodes extension.
+
+It is only meant to drive the node classes headlessly for benchmarks and stress scenarios: attributes
+hold plain Python/NumPy values, connections are pull-based, and callbacks fire synchronously. Nothing
+here tries to reproduce Fabric, graph scheduling or USD.
+
+    import omni_standin
+    omni_standin.install()
+    extension = omni_standin.start_extension()
+    graph = omni_standin.StandInGraph()
+    node = graph.create_node("LoggingNode")
+    omni_standin.APP.update()
+"""
+
+import enum
+import importlib
+import json
+import sys
+import types
+import weakref
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+EXTENSION_ROOT = REPO_ROOT / "exts" / "isaacsim.nodes.more_nodes"
+NODES_DIRECTORY = EXTENSION_ROOT / "isaacsim" / "nodes" / "more_nodes" / "ogn" / "python" / "nodes"
+EXTENSION_NAME = "isaacsim.nodes.more_nodes"
+NODES_MODULE = f"{EXTENSION_NAME}.ogn.python.nodes"
+NODE_NAMES = sorted(path.stem[len("Ogn"):] for path in NODES_DIRECTORY.glob("Ogn*.ogn"))
+
+
+# ======================================================================================================
+# carb
+# ======================================================================================================
+class _CarbLog:
+    """Counts log calls by level, printing errors and warnings only when verbose"""
+
+    def __init__(self):
+        self.counts = {"error": 0, "warn": 0, "info": 0, "verbose": 0}
+        self.verbose = False
+
+    def _log(self, level, message):
+        self.counts[level] += 1
+        if self.verbose or level == "error":
+            print(f"[carb.{level}] {message}", file=sys.stderr)
+
+    def install(self, module):
+        module.log_error = lambda message: self._log("error", message)
+        module.log_warn = lambda message: self._log("warn", message)
+        module.log_info = lambda message: self._log("info", message)
+        module.log_verbose = lambda message: self._log("verbose", message)
+
+
+CARB_LOG = _CarbLog()
+
+
+# ======================================================================================================
+# omni.timeline
+# ======================================================================================================
+class StandInTimeline:
+    """Timeline whose time is advanced explicitly by the caller"""
+
+    def __init__(self):
+        self.current_time = 0.0
+
+    def get_current_time(self):
+        return self.current_time
+
+    def advance(self, seconds):
+        self.current_time += seconds
+
+
+TIMELINE = StandInTimeline()
+
+
+# ======================================================================================================
+# omni.kit.app
+# ======================================================================================================
+class _Subscription:
+    """Update event subscription, unsubscribed once the subscriber drops it"""
+
+    def __init__(self, callback):
+        self.callback = callback
+
+
+class StandInApp:
+    """Application whose update event, the end of a frame, is pumped explicitly by the caller"""
+
+    def __init__(self):
+        self._subscriptions = []
+
+    def get_update_event_stream(self):
+        return self
+
+    def create_subscription_to_pop(self, callback, name=None):
+        subscription = _Subscription(callback)
+        self._subscriptions.append(weakref.ref(subscription))
+        return subscription
+
+    def update(self):
+        """Run every live update subscription once"""
+        self._subscriptions = [reference for reference in self._subscriptions if reference() is not None]
+        for reference in list(self._subscriptions):
+            subscription = reference()
+            if subscription is not None:
+                subscription.callback(None)
+
+
+APP = StandInApp()
+
+
+# ======================================================================================================
+# omni.graph.core
+# ======================================================================================================
+class BaseDataType(enum.IntEnum):
+    UNKNOWN = 0
+    BOOL = 1
+    UCHAR = 2
+    INT = 3
+    UINT = 4
+    INT64 = 5
+    UINT64 = 6
+    HALF = 7
+    FLOAT = 8
+    DOUBLE = 9
+    TOKEN = 10
+    RELATIONSHIP = 11
+    ASSET = 12
+    PRIM = 13
+    CONNECTION = 14
+    TAG = 15
+
+
+class AttributeRole(enum.IntEnum):
+    NONE = 0
+    VECTOR = 1
+    NORMAL = 2
+    POSITION = 3
+    COLOR = 4
+    TEXCOORD = 5
+    QUATERNION = 6
+    TRANSFORM = 7
+    FRAME = 8
+    TIMECODE = 9
+    TEXT = 10
+    APPLIED_SCHEMA = 11
+    PRIM_TYPE_NAME = 12
+    EXECUTION = 13
+    MATRIX = 14
+    OBJECT_ID = 15
+    BUNDLE = 16
+    PATH = 17
+    INSTANCED_ATTRIBUTE = 18
+    ANCESTOR_PRIM_TYPE_NAME = 19
+    TARGET = 20
+    UNKNOWN = 21
+
+
+class AttributePortType(enum.IntEnum):
+    ATTRIBUTE_PORT_TYPE_INPUT = 0
+    ATTRIBUTE_PORT_TYPE_OUTPUT = 1
+    ATTRIBUTE_PORT_TYPE_STATE = 2
+
+
+class ExtendedAttributeType(enum.IntEnum):
+    EXTENDED_ATTR_TYPE_REGULAR = 0
+    EXTENDED_ATTR_TYPE_UNION = 1
+    EXTENDED_ATTR_TYPE_ANY = 2
+
+    REGULAR = 0
+    UNION = 1
+    ANY = 2
+
+
+class ExecutionAttributeState(enum.IntEnum):
+    DISABLED = 0
+    ENABLED = 1
+    ENABLED_AND_PUSH = 2
+    LATENT_PUSH = 3
+    LATENT_FINISH = 4
+
+
+_BASE_TYPE_NAMES = {
+    "bool": BaseDataType.BOOL,
+    "uchar": BaseDataType.UCHAR,
+    "int": BaseDataType.INT,
+    "uint": BaseDataType.UINT,
+    "int64": BaseDataType.INT64,
+    "uint64": BaseDataType.UINT64,
+    "half": BaseDataType.HALF,
+    "float": BaseDataType.FLOAT,
+    "double": BaseDataType.DOUBLE,
+    "token": BaseDataType.TOKEN,
+}
+_ROLE_TYPE_NAMES = {
+    "execution": (BaseDataType.UINT, AttributeRole.EXECUTION, 0),
+    "string": (BaseDataType.UCHAR, AttributeRole.TEXT, 1),
+    "path": (BaseDataType.UCHAR, AttributeRole.PATH, 1),
+    "bundle": (BaseDataType.RELATIONSHIP, AttributeRole.BUNDLE, 0),
+    "target": (BaseDataType.RELATIONSHIP, AttributeRole.TARGET, 0),
+}
+_NUMPY_DTYPES = {
+    BaseDataType.BOOL: np.bool_,
+    BaseDataType.UCHAR: np.uint8,
+    BaseDataType.INT: np.int32,
+    BaseDataType.UINT: np.uint32,
+    BaseDataType.INT64: np.int64,
+    BaseDataType.UINT64: np.uint64,
+    BaseDataType.HALF: np.float16,
+    BaseDataType.FLOAT: np.float32,
+    BaseDataType.DOUBLE: np.float64,
+}
+
+
+class Type:
+    """Resolved attribute type"""
+
+    def __init__(self, base_type=BaseDataType.UNKNOWN, tuple_count=1, array_depth=0, role=AttributeRole.NONE):
+        self.base_type = BaseDataType(base_type)
+        self.tuple_count = tuple_count
+        self.array_depth = array_depth
+        self.role = AttributeRole(role)
+
+    def __eq__(self, other):
+        return isinstance(other, Type) and (
+            (self.base_type, self.tuple_count, self.array_depth, self.role)
+            == (other.base_type, other.tuple_count, other.array_depth, other.role)
+        )
+
+    def __hash__(self):
+        return hash((self.base_type, self.tuple_count, self.array_depth, self.role))
+
+    def __repr__(self):
+        return f"Type({self.get_ogn_type_name()})"
+
+    def get_ogn_type_name(self):
+        for name, (base_type, role, array_depth) in _ROLE_TYPE_NAMES.items():
+            if (self.base_type, self.role, self.array_depth) == (base_type, role, array_depth):
+                return name
+        if self.base_type == BaseDataType.UNKNOWN:
+            return "any"
+        name = self.base_type.name.lower()
+        if self.tuple_count > 1:
+            name += f"[{self.tuple_count}]"
+        return name + "[]" * self.array_depth
+
+    def numpy_dtype(self):
+        return _NUMPY_DTYPES.get(self.base_type)
+
+
+class AttributeType:
+    @staticmethod
+    def type_from_ogn_type_name(type_name: str) -> Type:
+        array_depth = 0
+        while type_name.endswith("[]"):
+            array_depth += 1
+            type_name = type_name[:-2]
+        if type_name in _ROLE_TYPE_NAMES:
+            base_type, role, role_depth = _ROLE_TYPE_NAMES[type_name]
+            return Type(base_type, 1, array_depth + role_depth, role)
+        tuple_count = 1
+        if type_name.endswith("]"):
+            type_name, _, count = type_name[:-1].partition("[")
+            tuple_count = int(count)
+        return Type(_BASE_TYPE_NAMES.get(type_name, BaseDataType.UNKNOWN), tuple_count, array_depth)
+
+
+class RuntimeAttribute:
+    """Child attribute of a bundle"""
+
+    def __init__(self, name, attr_type):
+        self.name = name
+        self.type = attr_type
+        self._value = _default_value(attr_type)
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = np.array(value) if isinstance(value, np.ndarray) else value
+
+
+class BundleContents:
+    """Bundle of named child attributes, held as the value of a bundle attribute"""
+
+    def __init__(self):
+        self._children = {}
+
+    @property
+    def valid(self):
+        return True
+
+    @property
+    def size(self):
+        return len(self._children)
+
+    @property
+    def attribute_names(self):
+        return list(self._children)
+
+    @property
+    def attribute_types(self):
+        return [child.type for child in self._children.values()]
+
+    def attribute_by_name(self, name):
+        return self._children.get(name)
+
+    def insert(self, description):
+        attr_type, name = description
+        child = self._children.get(name)
+        if child is None or child.type != attr_type:
+            child = self._children[name] = RuntimeAttribute(name, attr_type)
+        return child
+
+    def remove(self, name):
+        self._children.pop(name, None)
+
+    def clear(self):
+        self._children.clear()
+
+
+def _default_value(attr_type: Type):
+    """Zero value of a type, arrays start empty"""
+    if attr_type.role == AttributeRole.BUNDLE:
+        return BundleContents()
+    if attr_type.role in (AttributeRole.TEXT, AttributeRole.PATH):
+        return ""
+    if attr_type.base_type == BaseDataType.TOKEN:
+        return [] if attr_type.array_depth else ""
+    dtype = attr_type.numpy_dtype()
+    if dtype is None:
+        return None
+    if attr_type.array_depth:
+        shape = (0,) if attr_type.tuple_count == 1 else (0, attr_type.tuple_count)
+        return np.zeros(shape, dtype=dtype)
+    if attr_type.tuple_count > 1:
+        return np.zeros(attr_type.tuple_count, dtype=dtype)
+    return dtype(0).item()
+
+
+class AttributeData:
+    """Direct access to the value buffer of an attribute"""
+
+    def __init__(self, attribute):
+        self._attribute = attribute
+
+    def get(self, on_gpu=False, reserved_element_count=None):
+        attribute = self._attribute
+        if reserved_element_count is None:
+            return attribute.get()
+        # Outputs hand back their own buffer, only reallocated when the element count changes
+        value = attribute._value
+        if not isinstance(value, np.ndarray) or len(value) != reserved_element_count:
+            dtype = attribute.get_resolved_type().numpy_dtype() or np.float64
+            shape = (reserved_element_count,)
+            if attribute.get_resolved_type().tuple_count > 1:
+                shape += (attribute.get_resolved_type().tuple_count,)
+            value = np.zeros(shape, dtype=dtype)
+            attribute._value = value
+        return value
+
+
+class Attribute:
+    """Attribute of a stand-in node. Inputs read the value of their upstream output when connected."""
+
+    def __init__(self, node, name, attr_type, port_type, extended_type, default=None, dynamic=True):
+        self._node = node
+        self._name = name
+        self._type = attr_type
+        self._port_type = port_type
+        self._extended_type = extended_type
+        self._dynamic = dynamic
+        self._value = _default_value(attr_type) if default is None else default
+        self._upstream = []
+        self._downstream = []
+        self._value_changed_callbacks = []
+        self._valid = True
+
+    def get_name(self):
+        return self._name
+
+    def get_node(self):
+        return self._node
+
+    def get_port_type(self):
+        return self._port_type
+
+    def get_extended_type(self):
+        return self._extended_type
+
+    def get_resolved_type(self):
+        return self._type
+
+    def set_resolved_type(self, attr_type):
+        self._type = attr_type
+
+    def is_dynamic(self):
+        return self._dynamic
+
+    def is_valid(self):
+        return self._valid
+
+    def get_upstream_connection_count(self):
+        return len(self._upstream)
+
+    def get_downstream_connection_count(self):
+        return len(self._downstream)
+
+    def get_upstream_connections(self):
+        return list(self._upstream)
+
+    def get_downstream_connections(self):
+        return list(self._downstream)
+
+    def get(self, on_gpu=False, instance=None):
+        if not self._valid:
+            raise RuntimeError(f"Attribute {self._name} was removed")
+        if self._upstream:
+            return self._upstream[0].get()
+        return self._value
+
+    def set(self, value, on_gpu=False, instance=None):
+        if not self._valid:
+            raise RuntimeError(f"Attribute {self._name} was removed")
+        # Fabric keeps its own copy of the data that is set
+        self._value = np.array(value) if isinstance(value, np.ndarray) else value
+        for callback in self._value_changed_callbacks:
+            callback(self)
+        return True
+
+    def get_attribute_data(self, instance=None):
+        return AttributeData(self)
+
+    def register_value_changed_callback(self, callback):
+        self._value_changed_callbacks.append(callback)
+
+
+class Node:
+    """Stand-in node holding attributes, connection callbacks and the per-node internal state"""
+
+    def __init__(self, graph, path, type_name, node_class=None):
+        self._graph = graph
+        self._path = path
+        self._type_name = type_name
+        self._attributes = {}
+        self._connected_callbacks = []
+        self._disconnected_callbacks = []
+        self.node_class = node_class
+        self.internal_state = None
+        if node_class is not None and hasattr(node_class, "internal_state"):
+            self.internal_state = node_class.internal_state()
+
+    def get_prim_path(self):
+        return self._path
+
+    def is_valid(self):
+        return self._path in StandInGraph.ALL_NODES
+
+    def get_type_name(self):
+        return self._type_name
+
+    def get_graph(self):
+        return self._graph
+
+    def get_attributes(self):
+        return list(self._attributes.values())
+
+    def get_attribute(self, name):
+        return self._attributes[name]
+
+    def get_attribute_exists(self, name):
+        return name in self._attributes
+
+    def create_attribute(self, name, attr_type, port_type=AttributePortType.ATTRIBUTE_PORT_TYPE_INPUT,
+                         default=None, extended_type=ExtendedAttributeType.REGULAR, dynamic=True):
+        if name in self._attributes:
+            return False
+        self._attributes[name] = Attribute(self, name, attr_type, port_type, extended_type, default, dynamic)
+        return True
+
+    def remove_attribute(self, name):
+        attribute = self._attributes.pop(name, None)
+        if attribute is None:
+            return False
+        for upstream in list(attribute._upstream):
+            self._graph.disconnect(upstream, attribute)
+        for downstream in list(attribute._downstream):
+            self._graph.disconnect(attribute, downstream)
+        attribute._valid = False
+        return True
+
+    def register_on_connected_callback(self, callback):
+        self._connected_callbacks.append(callback)
+
+    def register_on_disconnected_callback(self, callback):
+        self._disconnected_callbacks.append(callback)
+
+
+class GraphContext:
+    """Evaluation context handed to initialize and compute"""
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def get_graph(self):
+        return self._graph
+
+
+class Controller:
+    """Subset of og.Controller used by the nodes, callable on the class or on an instance"""
+
+    class Keys:
+        CREATE_ATTRIBUTES = "create_attributes"
+
+    @staticmethod
+    def create_attribute(node, attr_name, attr_type, attr_port=AttributePortType.ATTRIBUTE_PORT_TYPE_INPUT,
+                         attr_default=None, attr_extended_type=ExtendedAttributeType.REGULAR, undoable=True):
+        if isinstance(attr_type, str):
+            attr_type = AttributeType.type_from_ogn_type_name(attr_type)
+        if isinstance(attr_extended_type, tuple):
+            attr_extended_type = attr_extended_type[0]
+        node.create_attribute(attr_name, attr_type, attr_port, attr_default, attr_extended_type)
+        return node.get_attribute(attr_name)
+
+    @staticmethod
+    def remove_attribute(attribute, node=None, undoable=True):
+        if isinstance(attribute, str):
+            return node.remove_attribute(attribute)
+        return attribute.get_node().remove_attribute(attribute.get_name())
+
+    @staticmethod
+    def node(path, graph=None):
+        return StandInGraph.ALL_NODES[path]
+
+
+class Database:
+    """Base of the generated node databases"""
+
+    NODE_TYPE_NAME = None
+
+    @classmethod
+    def per_node_internal_state(cls, node):
+        return node.internal_state
+
+
+class _PortValues:
+    """db.inputs / db.outputs: static attribute values accessed by their short name"""
+
+    def __init__(self, node, prefix):
+        object.__setattr__(self, "_node", node)
+        object.__setattr__(self, "_prefix", prefix)
+
+    def __getattr__(self, name):
+        try:
+            return self._node.get_attribute(f"{self._prefix}{name}").get()
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        self._node.get_attribute(f"{self._prefix}{name}").set(value)
+
+
+class StandInDatabase:
+    """Per-compute database handed to node.compute(db)"""
+
+    def __init__(self, node, context):
+        self.abi_node = node
+        self.abi_context = context
+        self.inputs = _PortValues(node, "inputs:")
+        self.outputs = _PortValues(node, "outputs:")
+        self.state = _PortValues(node, "state:")
+        self.per_instance_state = node.internal_state
+
+    def log_error(self, message):
+        CARB_LOG._log("error", message)
+
+    def log_warning(self, message):
+        CARB_LOG._log("warn", message)
+
+
+# ======================================================================================================
+# Graph driving helpers
+# ======================================================================================================
+def load_ogn(node_name):
+    """Read the .ogn description of a node of the extension"""
+    with open(NODES_DIRECTORY / f"Ogn{node_name}.ogn", encoding="utf-8") as f:
+        return json.load(f)[node_name]
+
+
+def _ogn_attribute_type(description):
+    type_name = description["type"]
+    if isinstance(type_name, list) or type_name in ("any", "union"):
+        return Type(BaseDataType.UNKNOWN), ExtendedAttributeType.ANY
+    return AttributeType.type_from_ogn_type_name(type_name), ExtendedAttributeType.REGULAR
+
+
+class StandInGraph:
+    """Creates extension nodes from their .ogn description and drives connections and computes"""
+
+    ALL_NODES = {}
+
+    def __init__(self, path="/World/ActionGraph"):
+        self.path = path
+        self.context = GraphContext(self)
+        self._node_count = 0
+
+    def create_node(self, node_name, path=None):
+        """Create a node of the extension, running its initialize()"""
+        node_class = getattr(importlib.import_module(f"{NODES_MODULE}.Ogn{node_name}"), f"Ogn{node_name}")
+        path = path or f"{self.path}/{node_name}_{self._node_count}"
+        self._node_count += 1
+        node = Node(self, path, f"{EXTENSION_NAME}.{node_name}", node_class)
+        description = load_ogn(node_name)
+        for port, port_type in (
+            ("inputs", AttributePortType.ATTRIBUTE_PORT_TYPE_INPUT),
+            ("outputs", AttributePortType.ATTRIBUTE_PORT_TYPE_OUTPUT),
+            ("state", AttributePortType.ATTRIBUTE_PORT_TYPE_STATE),
+        ):
+            for name, attribute in description.get(port, {}).items():
+                attr_type, extended_type = _ogn_attribute_type(attribute)
+                default = attribute.get("default")
+                if isinstance(default, list):
+                    default = np.array(default, dtype=attr_type.numpy_dtype())
+                node.create_attribute(f"{port}:{name}", attr_type, port_type, default, extended_type, dynamic=False)
+        StandInGraph.ALL_NODES[path] = node
+        if hasattr(node_class, "initialize"):
+            node_class.initialize(self.context, node)
+        return node
+
+    def create_source(self, path=None):
+        """Create a plain node whose outputs are set directly by the caller"""
+        path = path or f"{self.path}/Source_{self._node_count}"
+        self._node_count += 1
+        node = Node(self, path, "standin.Source")
+        StandInGraph.ALL_NODES[path] = node
+        return node
+
+    def release_node(self, node):
+        """Disconnect every attribute of a node and run its release()"""
+        for attribute in node.get_attributes():
+            for upstream in list(attribute._upstream):
+                self.disconnect(upstream, attribute)
+            for downstream in list(attribute._downstream):
+                self.disconnect(attribute, downstream)
+        if node.node_class is not None and hasattr(node.node_class, "release"):
+            node.node_class.release(node)
+        StandInGraph.ALL_NODES.pop(node.get_prim_path(), None)
+
+    def connect(self, upstream, downstream):
+        upstream._downstream.append(downstream)
+        downstream._upstream.append(upstream)
+        for node in {upstream.get_node(), downstream.get_node()}:
+            for callback in list(node._connected_callbacks):
+                callback(upstream, downstream)
+
+    def disconnect(self, upstream, downstream):
+        if downstream not in upstream._downstream:
+            return
+        upstream._downstream.remove(downstream)
+        downstream._upstream.remove(upstream)
+        for node in {upstream.get_node(), downstream.get_node()}:
+            for callback in list(node._disconnected_callbacks):
+                callback(upstream, downstream)
+
+    def compute(self, node):
+        """Run the compute of a node once, returns its result"""
+        return node.node_class.compute(StandInDatabase(node, self.context))
+
+    def get_nodes(self):
+        return [node for node in StandInGraph.ALL_NODES.values() if node.get_graph() is self]
+
+    def get_subgraphs(self):
+        return []
+
+
+def get_all_graphs():
+    """Graphs holding at least one live node"""
+    graphs = []
+    for node in StandInGraph.ALL_NODES.values():
+        if node.get_graph() not in graphs:
+            graphs.append(node.get_graph())
+    return graphs
+
+
+# ======================================================================================================
+# Installation
+# ======================================================================================================
+def _module(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    sys.modules[name] = module
+    return module
+
+
+def install():
+    """Register the stand-in modules and make the extension importable. Safe to call more than once."""
+    if "omni.graph.core" in sys.modules and getattr(sys.modules["omni.graph.core"], "IS_STAND_IN", False):
+        return
+
+    carb = _module("carb")
+    CARB_LOG.install(carb)
+    carb.settings = _module("carb.settings", get_settings=lambda: None)
+
+    omni = _module("omni")
+    omni.__path__ = []
+    omni.timeline = _module("omni.timeline", get_timeline_interface=lambda: TIMELINE)
+
+    class IExt:
+        def on_startup(self, ext_id):
+            pass
+
+        def on_shutdown(self):
+            pass
+
+    omni.ext = _module("omni.ext", IExt=IExt)
+    omni.kit = _module("omni.kit")
+    omni.kit.__path__ = []
+    omni.kit.app = _module("omni.kit.app", get_app=lambda: APP)
+    omni.graph = _module("omni.graph")
+    omni.graph.__path__ = []
+    omni.graph.core = _module(
+        "omni.graph.core",
+        IS_STAND_IN=True,
+        BaseDataType=BaseDataType,
+        AttributeRole=AttributeRole,
+        AttributePortType=AttributePortType,
+        ExtendedAttributeType=ExtendedAttributeType,
+        ExecutionAttributeState=ExecutionAttributeState,
+        Type=Type,
+        AttributeType=AttributeType,
+        AttributeData=AttributeData,
+        BundleContents=BundleContents,
+        RuntimeAttribute=RuntimeAttribute,
+        Attribute=Attribute,
+        Node=Node,
+        GraphContext=GraphContext,
+        Controller=Controller,
+        Database=Database,
+        get_all_graphs=get_all_graphs,
+    )
+
+    sys.path.insert(0, str(EXTENSION_ROOT))
+
+    # The node databases are generated by the OGN build step, stand in for them too
+    for ogn_file in sorted(NODES_DIRECTORY.glob("Ogn*.ogn")):
+        class_name = f"{ogn_file.stem}Database"
+        database = type(class_name, (Database,), {"NODE_TYPE_NAME": ogn_file.stem[3:]})
+        _module(f"{EXTENSION_NAME}.ogn.{class_name}", **{class_name: database})
+
+
+def start_extension():
+    """Run the on_startup() of the extension the way Kit does, returns the extension object"""
+    install()
+    import isaacsim.nodes.more_nodes as package
+
+    extension = package._PublicExtension()
+    extension.on_startup(EXTENSION_NAME)
+    return extension
@@ -0,0 +1,175 @@
+"""
+Connection churn scenario of the More Nodes extension.
+
+Connects and disconnects the dynamic inputs of every node type with auto-growing inputs thousands of times on the
+omni_standin graph, computing once per connected cycle, and releases and recreates each node at a fixed interval.
+The extension is started and its update event pumped after each edit, so the attribute edits go through the
+deferred topology editor and the Logging Node writes through its default console sink, whose output is
+discarded. Profiling is enabled too. The extension diagnostics are sampled while nothing is connected, so the
+samples are comparable. The scenario checks that the live dynamic attributes come back to their first count, that
+no profile outlives its node, and that the internal state sizes and the traced allocations stay within a bound.
+
+    python benchmarks/scenario_churn.py --cycles 2000
+    python benchmarks/scenario_churn.py --cycles 10000 --json churn_output.json
+
+Exits with status 1 if a bound is exceeded.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+
+import numpy as np
+
+import omni_standin
+
+# Node type -> prefix of its dynamic inputs
+CHURNED_NODES = {
+    "DynamicMatcher": "inputs:data",
+    "LoggingNode": "inputs:dataIn",
+    "SharedMemoryExporter": "inputs:dataIn",
+    "StreamingStats": "inputs:dataIn",
+    "Synchronizer": "inputs:data",
+}
+
+
+def create_node(graph, node_name):
+    og = sys.modules["omni.graph.core"]
+    node = graph.create_node(node_name)
+    if node_name == "LoggingNode":
+        node.get_attribute("inputs:history").set(True)
+        node.get_attribute("inputs:execIn").set(og.ExecutionAttributeState.ENABLED)
+    # The free input queued by initialize() exists once the frame ends
+    omni_standin.APP.update()
+    return node
+
+
+def churn(cycles, input_count, recreate_every, sample_every, seed, out=None):
+    """Run the churn, returns the diagnostics samples. Progress is printed to out, stdout by default."""
+    out = out or sys.stdout
+    started_extension = omni_standin.start_extension()
+    import isaacsim.nodes.more_nodes as extension
+    from isaacsim.nodes.more_nodes.impl.log_sink import flush_all_sinks
+
+    og = sys.modules["omni.graph.core"]
+    rng = np.random.default_rng(seed)
+    graph = omni_standin.StandInGraph("/World/Churn")
+    source = graph.create_source()
+    for index in range(input_count):
+        source.create_attribute(
+            f"outputs:value{index}",
+            og.AttributeType.type_from_ogn_type_name("double[]"),
+            og.AttributePortType.ATTRIBUTE_PORT_TYPE_OUTPUT,
+            np.zeros(index + 1),
+        )
+    nodes = {node_name: create_node(graph, node_name) for node_name in CHURNED_NODES}
+
+    extension.enable_profiling()
+    # The samples are kept here, the extension only needs the last one to compute the deltas
+    extension.enable_diagnostics(history=2)
+    samples = []
+    for cycle in range(1, cycles + 1):
+        for node_name, prefix in CHURNED_NODES.items():
+            if cycle % recreate_every == 0:
+                graph.release_node(nodes[node_name])
+                nodes[node_name] = create_node(graph, node_name)
+            node = nodes[node_name]
+            # === Connect every input, in order since each connection creates the next free input at the frame end ===
+            for index in range(input_count):
+                source.get_attribute(f"outputs:value{index}").set(np.full(index + 1, float(cycle)))
+                graph.connect(source.get_attribute(f"outputs:value{index}"), node.get_attribute(f"{prefix}{index}"))
+                omni_standin.APP.update()
+            graph.compute(node)
+
+            # === Disconnect them in a random order, the removals are committed together ===
+            for index in rng.permutation(input_count):
+                graph.disconnect(source.get_attribute(f"outputs:value{index}"), node.get_attribute(f"{prefix}{index}"))
+        omni_standin.APP.update()
+        omni_standin.TIMELINE.advance(1.0 / 60.0)
+
+        if cycle == 1 or cycle % sample_every == 0:
+            # The sinks write on their own thread, let them catch up so their queues are not counted as growth
+            flush_all_sinks()
+            # Copied, the samples kept here must not count as allocations of the extension
+            result = json.loads(json.dumps(extension.sample_diagnostics()))
+            result["cycle"] = cycle
+            result["profiles"] = len(extension.get_node_profiles())
+            samples.append(result)
+            print(f"cycle={cycle:<7} traced={result['traced_bytes']:>9}B " + " ".join(
+                f"{name}={entry['dynamic_attributes']}/{entry['state_bytes']}B"
+                for name, entry in sorted(result["node_types"].items()) if name in CHURNED_NODES
+            ), file=out)
+
+    for node in nodes.values():
+        graph.release_node(node)
+    omni_standin.APP.update()
+    extension.disable_diagnostics()
+    extension.disable_profiling()
+    started_extension.on_shutdown()
+    return samples
+
+
+def check_bounds(samples, max_state_growth, max_traced_growth):
+    """Growth between the second sample, taken once every code path ran, and the last one"""
+    baseline, last = samples[min(1, len(samples) - 1)], samples[-1]
+    failures = []
+    for node_name in CHURNED_NODES:
+        first = baseline["node_types"][node_name]
+        current = last["node_types"][node_name]
+        if current["instances"] != first["instances"]:
+            failures.append(f"{node_name}: {current['instances']} instances instead of {first['instances']}")
+        if current["dynamic_attributes"] != first["dynamic_attributes"]:
+            failures.append(
+                f"{node_name}: {current['dynamic_attributes']} dynamic attributes instead of {first['dynamic_attributes']}"
+            )
+        if current["state_bytes"] - first["state_bytes"] > max_state_growth:
+            failures.append(f"{node_name}: internal state grew from {first['state_bytes']}B to {current['state_bytes']}B")
+    # Only the live DynamicMatcher and LoggingNode instances are profiled
+    if last["profiles"] > 2:
+        failures.append(f"{last['profiles']} node profiles for 2 profiled nodes")
+    if last["traced_bytes"] - baseline["traced_bytes"] > max_traced_growth:
+        failures.append(f"traced allocations grew from {baseline['traced_bytes']}B to {last['traced_bytes']}B")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cycles", type=int, default=2000, help="Connect and disconnect cycles per node type")
+    parser.add_argument("--inputs", type=int, default=4, help="Inputs connected per cycle")
+    parser.add_argument("--recreate-every", type=int, default=250, help="Cycles between node recreations")
+    parser.add_argument("--sample-every", type=int, default=500, help="Cycles between diagnostics samples")
+    parser.add_argument("--max-state-growth", type=int, default=4096, help="Allowed internal state growth in bytes")
+    parser.add_argument("--max-traced-growth", type=int, default=32 * 1024, help="Allowed traced growth in bytes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Write the samples to this JSON file")
+    args = parser.parse_args(argv)
+
+    # The sink prints every record, only the memory it holds matters here
+    out = sys.stdout
+    with open(os.devnull, "w", encoding="utf-8") as null, contextlib.redirect_stdout(null):
+        samples = churn(args.cycles, args.inputs, args.recreate_every, args.sample_every, args.seed, out)
+    failures = check_bounds(samples, args.max_state_growth, args.max_traced_growth)
+    for failure in failures:
+        print(f"unbounded growth: {failure}")
+    if not failures:
+        print(f"bounded growth over {args.cycles} cycles")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "environment": {"python": platform.python_version(), "platform": platform.platform()},
+                    "samples": samples,
+                    "failures": failures,
+                },
+                f,
+                indent=2,
+            )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
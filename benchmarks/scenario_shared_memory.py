@@ -0,0 +1,147 @@
+"""
+Shared memory export scenario of the More Nodes extension.
+
+Runs a SharedMemoryExporter on the omni_standin graph as fast as it computes, publishing a frame counter and an
+array filled with it, while a child process reads the stream with SharedMemoryReader. The child loads the reader
+module from its path, without the stand-in, like an analysis tool running outside Kit. Every frame the child reads
+without copying is checked for tearing: the array must be filled with the counter of its own frame.
+
+    python benchmarks/scenario_shared_memory.py --seconds 5 --elements 262144
+    python benchmarks/scenario_shared_memory.py --json shared_memory_output.json
+
+Exits with status 1 if a torn frame was read or the child read nothing.
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+import omni_standin
+
+READER_MODULE_PATH = omni_standin.EXTENSION_ROOT / "isaacsim" / "nodes" / "more_nodes" / "impl" / "shared_memory.py"
+
+
+def load_reader_module():
+    """The shared_memory module loaded from its path, without importing the extension package"""
+    spec = importlib.util.spec_from_file_location("more_nodes_shared_memory", READER_MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_reader(segment_name):
+    """Child process side: read until the writer closes the stream, prints one JSON line"""
+    reader = load_reader_module().SharedMemoryReader(segment_name)
+    frames_read = 0
+    torn = 0
+    overrun = 0
+    last_frame = 0
+    start = time.perf_counter()
+    while True:
+        frame = reader.wait(last_frame, timeout=10.0)
+        if frame is None:
+            break
+        counter = frame.values["dataIn0"]
+        payload = frame.values["dataIn1"]
+        consistent = payload.min() == payload.max() == counter
+        # A frame whose slot got overwritten while it was checked is an overrun, not a tear
+        if not frame.is_valid():
+            overrun += 1
+        elif not consistent:
+            torn += 1
+        frames_read += 1
+        last_frame = frame.frame
+    elapsed = time.perf_counter() - start
+    reader.close()
+    print(json.dumps({
+        "frames_read": frames_read,
+        "frames_per_second": frames_read / elapsed if elapsed else 0.0,
+        "last_frame": last_frame,
+        "torn": torn,
+        "overrun": overrun,
+    }))
+
+
+def run_writer(seconds, elements):
+    """Parent side: publish frames for a number of seconds while the child reads them"""
+    omni_standin.install()
+    og = sys.modules["omni.graph.core"]
+    graph = omni_standin.StandInGraph("/World/SharedMemory")
+    source = graph.create_source()
+    node = graph.create_node("SharedMemoryExporter")
+    node.get_attribute("inputs:frameBytes").set(max(4096, elements * 8 + 1024))
+
+    output_port = og.AttributePortType.ATTRIBUTE_PORT_TYPE_OUTPUT
+    source.create_attribute("outputs:counter", og.AttributeType.type_from_ogn_type_name("double"), output_port, 0.0)
+    source.create_attribute("outputs:payload", og.AttributeType.type_from_ogn_type_name("double[]"), output_port,
+                            np.zeros(elements))
+    graph.connect(source.get_attribute("outputs:counter"), node.get_attribute("inputs:dataIn0"))
+    graph.connect(source.get_attribute("outputs:payload"), node.get_attribute("inputs:dataIn1"))
+
+    # === The first frame creates the segment the child opens ===
+    graph.compute(node)
+    segment_name = node.get_attribute("outputs:segmentName").get()
+    child = subprocess.Popen(
+        [sys.executable, __file__, "--reader", segment_name],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+    payload = np.zeros(elements)
+    counter = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        counter += 1
+        payload.fill(counter)
+        source.get_attribute("outputs:counter").set(float(counter))
+        source.get_attribute("outputs:payload").set(payload)
+        graph.compute(node)
+        omni_standin.TIMELINE.advance(1.0 / 60.0)
+    elapsed = time.perf_counter() - start
+    frames_written = node.get_attribute("outputs:frame").get()
+
+    # === Releasing the node closes the stream, the child then exits ===
+    graph.release_node(node)
+    output, _ = child.communicate(timeout=30)
+    result = json.loads(output.strip().splitlines()[-1])
+    result.update({
+        "elements": elements,
+        "frames_written": frames_written,
+        "writes_per_second": frames_written / elapsed,
+    })
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=3.0, help="Time spent publishing frames")
+    parser.add_argument("--elements", type=int, default=64 * 1024, help="float64 elements of the published array")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--reader", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.reader:
+        run_reader(args.reader)
+        return 0
+
+    result = run_writer(args.seconds, args.elements)
+    print(
+        f"written={result['frames_written']} ({result['writes_per_second']:.0f}/s) "
+        f"read={result['frames_read']} ({result['frames_per_second']:.0f}/s) "
+        f"torn={result['torn']} overrun={result['overrun']} elements={result['elements']}"
+    )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"environment": {"python": platform.python_version(), "platform": platform.platform()},
+                       "result": result}, f, indent=2)
+    return 0 if result["torn"] == 0 and result["frames_read"] > 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
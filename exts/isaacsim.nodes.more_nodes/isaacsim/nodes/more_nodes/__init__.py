@@ -1 +1,2 @@
 from .impl import *
+from .impl.extension import _PublicExtension  # noqa: F401
@@ -1 +1,2 @@
 from .extension import *
+from .extension import _PublicExtension  # noqa: F401
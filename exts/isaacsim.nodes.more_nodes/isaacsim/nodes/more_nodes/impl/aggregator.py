@@ -0,0 +1,107 @@
+"""Extension-wide aggregator batching the records of every Logging Node into one write per frame"""
+
+from .log_sink import LogSink, create_writer, SINK_CONSOLE
+from .timeline import get_current_time
+
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+
+def format_frame(frame) -> str:
+    """Format every record submitted during a frame, prefixed with the node path"""
+    frame_time, records = frame
+    lines = []
+    for node_path, record in records:
+        value = record.value if record.formatter is None else record.formatter(record.value)
+        lines.append(f"[Logging Node at {frame_time}] {node_path} {record.name}: {value}\n")
+    return "".join(lines)
+
+
+class LogChannel:
+    """Handle a Logging Node submits its records through, stamped with its path and level"""
+
+    def __init__(self, aggregator, node_path: str, level: str):
+        self._aggregator = aggregator
+        self.node_path = node_path
+        self.level_name = level
+        self.level = LEVELS.get(level, LEVELS["info"])
+
+    @property
+    def enabled(self) -> bool:
+        return self._aggregator.accepts(self.level)
+
+    @property
+    def closed(self) -> bool:
+        """True once the aggregator was closed, by the extension shutting down or reloading"""
+        return self._aggregator.closed
+
+    def frame_time(self) -> float:
+        return self._aggregator.frame_time()
+
+    def submit(self, record) -> bool:
+        return self._aggregator.submit(self.node_path, self.level, record)
+
+
+class LogAggregator:
+    """
+    Collects the records of every Logging Node during a frame.
+    The timeline time is read once per frame, and end_frame() hands the whole frame to the sink as a single write.
+    Until end_frame() has run once, nothing drives the frames: every record goes to the sink as soon as it is
+    submitted, like the Logging Node always printed it. A frame holding max_frame_records is written out early.
+    """
+
+    def __init__(self, kind: str = SINK_CONSOLE, target: str = "", capacity: int = 1024, max_frame_records: int = 4096):
+        self.enabled = True
+        self.min_level = LEVELS["info"]
+        self.max_frame_records = max(1, max_frame_records)
+        self._sink = LogSink(create_writer(kind, target), capacity, formatter=format_frame)
+        self._frame_time = None
+        self._records = []
+        # Set by the first end_frame(), the records are batched per frame from then on
+        self._frame_driven = False
+        self.closed = False
+
+    def set_level(self, level: str):
+        """Drop the records below a level name: debug, info, warning or error"""
+        if level not in LEVELS:
+            raise ValueError(f"Unknown logging level '{level}', expected one of {', '.join(LEVELS)}")
+        self.min_level = LEVELS[level]
+
+    def accepts(self, level: int) -> bool:
+        return self.enabled and level >= self.min_level
+
+    def channel(self, node_path: str, level: str) -> LogChannel:
+        return LogChannel(self, node_path, level)
+
+    def frame_time(self) -> float:
+        """Timeline time of the current frame, read on first use in the frame"""
+        if not self._frame_driven:
+            return get_current_time()
+        if self._frame_time is None:
+            self._frame_time = get_current_time()
+        return self._frame_time
+
+    def submit(self, node_path: str, level: int, record) -> bool:
+        if not self.accepts(level):
+            return False
+        if not self._frame_driven:
+            return self._sink.submit((record.time, [(node_path, record)]))
+        self._records.append((node_path, record))
+        if len(self._records) >= self.max_frame_records:
+            self._flush()
+        return True
+
+    def end_frame(self):
+        """Send the records of the frame to the sink as one batch"""
+        self._frame_driven = True
+        self._flush()
+        self._frame_time = None
+
+    def _flush(self):
+        if self._records:
+            self._sink.submit((self.frame_time(), self._records))
+            self._records = []
+
+    def close(self):
+        self.closed = True
+        self.end_frame()
+        self._sink.close()
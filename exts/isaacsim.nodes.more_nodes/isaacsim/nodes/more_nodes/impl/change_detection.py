@@ -0,0 +1,33 @@
+"""Cheap value fingerprints used to detect unchanged attribute values between ticks"""
+
+import zlib
+
+import numpy as np
+
+# Fingerprint of a value that has never been seen, compares unequal to everything
+UNSET = object()
+
+
+def fingerprint(value):
+    """
+    Return a comparable fingerprint of an attribute value.
+    Arrays are reduced to their shape, dtype and a CRC32 of their bytes so no copy is kept,
+    everything else is kept as an immutable value.
+    """
+    if isinstance(value, np.ndarray):
+        contiguous = np.ascontiguousarray(value)
+        return (contiguous.shape, contiguous.dtype.str, zlib.crc32(contiguous))
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def has_changed(previous, current) -> bool:
+    """Compare two fingerprints returned by fingerprint()"""
+    if previous is UNSET:
+        return True
+    try:
+        return bool(previous != current)
+    except (TypeError, ValueError):
+        # Nested containers of arrays do not compare to a single bool
+        return True
@@ -0,0 +1,277 @@
+"""
+Opt-in memory diagnostics of the More Nodes node instances.
+
+While enabled, the topology editor counts the dynamic attributes it creates and removes per node type, and
+tracemalloc traces the allocations. Each sample walks the graphs once and records, per node type, the live
+instances and dynamic attributes, the bytes held by their internal states and the traced bytes allocated from
+the node and impl modules, so growth over a long session shows up as a trend between samples.
+"""
+
+import gc
+import importlib
+import os
+import sys
+import time
+import types
+from collections import deque
+
+import carb
+import omni.graph.core as og
+
+NODE_TYPE_PREFIX = "isaacsim.nodes.more_nodes."
+
+# Allocations made from the shared modules rather than from a node module
+IMPL_KEY = "impl"
+
+enabled = False
+
+_PACKAGE = __package__.rsplit(".", 1)[0]
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_NODES_DIRECTORY = os.path.join(_PACKAGE_DIRECTORY, "ogn", "python", "nodes")
+
+_samples = deque(maxlen=256)
+_sample_interval = 0.0
+_started = 0.0
+_last_sample = 0.0
+_started_tracing = False
+
+# Node type -> [dynamic attributes created, dynamic attributes removed] since diagnostics were enabled
+_attribute_edits = {}
+
+# Node type -> generated database class, to reach the internal states
+_databases = {}
+
+
+def enable(sample_interval: float = 0.0, history: int = 256, frames: int = 8):
+    """
+    Start the diagnostics, sampling every sample_interval seconds if it is positive.
+    The last history samples are kept. Allocations are attributed through up to frames stack frames.
+    """
+    global enabled, _samples, _sample_interval, _started, _last_sample, _started_tracing
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+        _started_tracing = True
+    enabled = True
+    _samples = deque(_samples, maxlen=max(1, history))
+    _sample_interval = sample_interval
+    _started = _last_sample = time.monotonic()
+
+
+def disable():
+    """Stop the diagnostics, the samples are kept"""
+    global enabled, _started_tracing
+    enabled = False
+    if _started_tracing:
+        import tracemalloc
+
+        tracemalloc.stop()
+        _started_tracing = False
+
+
+def reset():
+    """Clear the samples and the attribute counters"""
+    _samples.clear()
+    _attribute_edits.clear()
+
+
+def node_type_key(node) -> str:
+    """Short node type name, like LoggingNode"""
+    return node.get_type_name().rsplit(".", 1)[-1]
+
+
+def count_attribute_edit(node, created: bool):
+    """Count a dynamic attribute created or removed by the topology editor"""
+    counters = _attribute_edits.get(node_type_key(node))
+    if counters is None:
+        counters = _attribute_edits[node_type_key(node)] = [0, 0]
+    counters[0 if created else 1] += 1
+
+
+def maybe_sample():
+    """Take a sample when the interval elapsed, called once per frame"""
+    global _last_sample
+    if _sample_interval <= 0.0:
+        return
+    now = time.monotonic()
+    if now - _last_sample >= _sample_interval:
+        _last_sample = now
+        sample()
+        carb.log_info(format_summary())
+
+
+def sample() -> dict:
+    """Record and return the current counts and sizes, by node type"""
+    # Released nodes often wait in reference cycles, only what is still reachable is retained
+    gc.collect()
+    node_types = {}
+    seen = set()
+    for node in _extension_nodes():
+        entry = node_types.get(node_type_key(node))
+        if entry is None:
+            entry = node_types[node_type_key(node)] = _new_entry()
+        entry["instances"] += 1
+        entry["dynamic_attributes"] += sum(1 for attr in node.get_attributes() if attr.is_dynamic())
+        state = _internal_state(node)
+        if state is not None:
+            entry["state_bytes"] += deep_size(state, seen)
+
+    for key, (created, removed) in _attribute_edits.items():
+        entry = node_types.setdefault(key, _new_entry())
+        entry["attributes_created"] = created
+        entry["attributes_removed"] = removed
+
+    # === Traced allocations, compared with the previous sample ===
+    traced = _traced_bytes()
+    previous = _samples[-1]["node_types"] if _samples else {}
+    for key, traced_bytes in traced.items():
+        entry = node_types.setdefault(key, _new_entry())
+        entry["traced_bytes"] = traced_bytes
+    for key, entry in node_types.items():
+        entry["traced_delta"] = entry["traced_bytes"] - previous.get(key, {}).get("traced_bytes", 0)
+
+    result = {
+        "time": time.monotonic() - _started,
+        "traced_bytes": sum(traced.values()),
+        "node_types": node_types,
+    }
+    _samples.append(result)
+    return result
+
+
+def get_samples() -> list:
+    """Samples kept so far, oldest first"""
+    return list(_samples)
+
+
+def format_summary() -> str:
+    """Compact text summary of the last sample"""
+    if not _samples:
+        return "More Nodes diagnostics: no sample"
+    last = _samples[-1]
+    lines = [f"More Nodes diagnostics at {last['time']:.1f}s, traced={last['traced_bytes']}B"]
+    for key, entry in sorted(last["node_types"].items()):
+        lines.append(
+            f"  {key}: instances={entry['instances']} dynamic_attributes={entry['dynamic_attributes']}"
+            f" created={entry['attributes_created']} removed={entry['attributes_removed']}"
+            f" state={entry['state_bytes']}B traced={entry['traced_bytes']}B ({entry['traced_delta']:+d}B)"
+        )
+    return "\n".join(lines)
+
+
+def deep_size(obj, seen: set = None) -> int:
+    """
+    Bytes held by an object and everything it references, NumPy buffers included.
+    Objects already in seen are not counted again, so objects shared by several nodes count once.
+    Graph handles, modules, classes and functions are not followed.
+    """
+    import numpy as np
+
+    seen = set() if seen is None else seen
+    skipped = _skipped_types()
+    size = 0
+    pending = [obj]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, skipped):
+            continue
+        seen.add(id(obj))
+        # An array owning its data includes the buffer in its size, a view refers to its base
+        size += sys.getsizeof(obj, 0)
+        if isinstance(obj, np.ndarray):
+            if obj.base is not None:
+                pending.append(obj.base)
+        elif isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            pending.extend(obj)
+        elif not isinstance(obj, (str, bytes, int, float, bool, type(None))):
+            for cls in type(obj).__mro__:
+                slots = cls.__dict__.get("__slots__", ())
+                for name in (slots,) if isinstance(slots, str) else slots:
+                    if name not in ("__weakref__", "__dict__") and hasattr(obj, name):
+                        pending.append(getattr(obj, name))
+            attributes = getattr(obj, "__dict__", None)
+            if attributes is not None:
+                pending.append(attributes)
+    return size
+
+
+# === Internals ===
+def _new_entry() -> dict:
+    return {
+        "instances": 0,
+        "dynamic_attributes": 0,
+        "attributes_created": 0,
+        "attributes_removed": 0,
+        "state_bytes": 0,
+        "traced_bytes": 0,
+        "traced_delta": 0,
+    }
+
+
+def _skipped_types() -> tuple:
+    return (
+        types.ModuleType,
+        type,
+        types.FunctionType,
+        types.BuiltinFunctionType,
+        types.MethodType,
+        og.Node,
+        og.Attribute,
+    )
+
+
+def _extension_nodes():
+    """Every node of the extension in every graph, subgraphs included"""
+    graphs = list(og.get_all_graphs())
+    while graphs:
+        graph = graphs.pop()
+        graphs.extend(graph.get_subgraphs())
+        for node in graph.get_nodes():
+            if node.get_type_name().startswith(NODE_TYPE_PREFIX):
+                yield node
+
+
+def _internal_state(node):
+    key = node_type_key(node)
+    database = _databases.get(key)
+    if database is None:
+        try:
+            module = importlib.import_module(f"{_PACKAGE}.ogn.Ogn{key}Database")
+        except ImportError:
+            return None
+        database = _databases[key] = getattr(module, f"Ogn{key}Database")
+    return database.per_node_internal_state(node)
+
+
+def _traced_bytes() -> dict:
+    """Traced bytes still allocated, by node type for the node modules and under IMPL_KEY for the rest"""
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        return {}
+    nodes_directory = _NODES_DIRECTORY
+    package_directory = _PACKAGE_DIRECTORY
+    by_key = {}
+    # Grouped by traceback so each one is resolved once, and matched by prefix rather than with
+    # Snapshot.filter_traces() which runs fnmatch on every frame of every trace
+    for statistic in tracemalloc.take_snapshot().statistics("traceback"):
+        key = None
+        # === The innermost node module frame owns the allocation, else the innermost package frame ===
+        for frame in reversed(statistic.traceback):
+            filename = frame.filename
+            if filename == __file__:
+                # The samples kept here are not a node allocation
+                key = None
+                break
+            if filename.startswith(nodes_directory):
+                key = os.path.splitext(os.path.basename(filename))[0][len("Ogn"):]
+                break
+            if key is None and filename.startswith(package_directory):
+                key = IMPL_KEY
+        if key is not None:
+            by_key[key] = by_key.get(key, 0) + statistic.size
+    return by_key
@@ -0,0 +1,172 @@
+"""Per-node bookkeeping of auto-growing dynamic inputs like inputs:dataIn0, inputs:dataIn1, ..."""
+
+import bisect
+
+import omni.graph.core as og
+
+from .extension import get_topology_editor
+
+
+class DynamicInputIndex:
+    """
+    Index of the dynamic inputs of one node sharing a name prefix, keyed by their numeric suffix.
+    The connected inputs are kept sorted by suffix so compute can iterate them directly.
+    Inputs waiting for the topology editor to create them are indexed with a None handle.
+    """
+
+    __slots__ = ("prefix", "_attributes", "connected_suffixes", "connected_attributes")
+
+    def __init__(self, prefix: str = "inputs:dataIn"):
+        self.prefix = prefix
+        self._attributes = {}
+        self.connected_suffixes = []
+        self.connected_attributes = []
+
+    def suffix_of(self, attr_name: str):
+        """Numeric suffix of an attribute name, None if it does not belong to this index"""
+        if not attr_name.startswith(self.prefix):
+            return None
+        suffix = attr_name[len(self.prefix):]
+        return int(suffix) if suffix.isdigit() else None
+
+    def name_of(self, suffix: int) -> str:
+        return f"{self.prefix}{suffix}"
+
+    def rebuild(self, node):
+        """Scan the node attributes once, used when the node is initialized"""
+        self._attributes = {}
+        self.connected_suffixes = []
+        self.connected_attributes = []
+        for attr in node.get_attributes():
+            suffix = self.suffix_of(attr.get_name())
+            if suffix is None:
+                continue
+            self._attributes[suffix] = attr
+            if attr.get_upstream_connection_count() > 0:
+                self._insert_connected(suffix, attr)
+
+    @property
+    def last_suffix(self) -> int:
+        """Biggest suffix of the existing inputs, -1 if there are none"""
+        return max(self._attributes, default=-1)
+
+    def __len__(self):
+        return len(self._attributes)
+
+    def get(self, suffix: int):
+        return self._attributes.get(suffix)
+
+    def is_connected(self, suffix: int) -> bool:
+        position = bisect.bisect_left(self.connected_suffixes, suffix)
+        return position < len(self.connected_suffixes) and self.connected_suffixes[position] == suffix
+
+    def reserve(self, suffix: int):
+        """Register an input whose creation is pending"""
+        self._attributes.setdefault(suffix, None)
+
+    def add(self, attr):
+        """Register an input that was just created"""
+        suffix = self.suffix_of(attr.get_name())
+        if suffix is not None:
+            self._attributes[suffix] = attr
+
+    def remove(self, suffix: int):
+        """Forget an input that was just removed"""
+        self._attributes.pop(suffix, None)
+        self.set_connected(suffix, None)
+
+    def set_connected(self, suffix: int, attr):
+        """Mark an input as connected with its handle, or as disconnected with None"""
+        if self.is_connected(suffix):
+            position = bisect.bisect_left(self.connected_suffixes, suffix)
+            del self.connected_suffixes[position]
+            del self.connected_attributes[position]
+        if attr is not None:
+            self._attributes[suffix] = attr
+            self._insert_connected(suffix, attr)
+
+    def _insert_connected(self, suffix, attr):
+        position = bisect.bisect_left(self.connected_suffixes, suffix)
+        self.connected_suffixes.insert(position, suffix)
+        self.connected_attributes.insert(position, attr)
+
+
+def resolve_from_upstream(upstream_attr, downstream_attr):
+    """Resolve an input of extended type to the type of its upstream attribute"""
+    if downstream_attr.get_resolved_type().base_type == og.BaseDataType.UNKNOWN:
+        upstream_resolved_type = upstream_attr.get_resolved_type()
+        if upstream_resolved_type.base_type != og.BaseDataType.UNKNOWN:
+            downstream_attr.set_resolved_type(upstream_resolved_type)
+
+
+def create_paired_output(node, upstream_attr, output_name: str, on_created=None):
+    """
+    Queue the creation of the output paired with a connected input, with the concrete upstream type
+    so compute never has to inspect types. on_created receives its handle once it exists.
+    """
+    resolved_type = upstream_attr.get_resolved_type()
+    if resolved_type.base_type == og.BaseDataType.UNKNOWN:
+        extended_type = og.ExtendedAttributeType.ANY
+    else:
+        extended_type = og.ExtendedAttributeType.REGULAR
+    get_topology_editor().add_attribute(
+        node,
+        output_name,
+        resolved_type,
+        og.AttributePortType.ATTRIBUTE_PORT_TYPE_OUTPUT,
+        extended_type,
+        on_created=on_created
+    )
+
+
+def create_dynamic_input(node, index: DynamicInputIndex, suffix: int):
+    """Queue the creation of the input with the given suffix, the index gets its handle once it exists"""
+    # FIXME: The connected line is not visible in the UI
+    # until we change the window and back again.
+    index.reserve(suffix)
+    get_topology_editor().add_attribute(
+        node,
+        index.name_of(suffix),
+        og.Type(og.BaseDataType.UNKNOWN),
+        og.AttributePortType.ATTRIBUTE_PORT_TYPE_INPUT,
+        og.ExtendedAttributeType.ANY,
+        on_created=index.add
+    )
+
+
+def remove_dynamic_input(node, index: DynamicInputIndex, suffix: int):
+    """Queue the removal of the input with the given suffix and forget it"""
+    get_topology_editor().remove_attribute(node, index.name_of(suffix))
+    index.remove(suffix)
+
+
+def connect_dynamic_input(node, index: DynamicInputIndex, suffix: int, attr):
+    """Mark an input as connected, keeping it if its removal was pending"""
+    get_topology_editor().keep_attribute(node, attr.get_name())
+    index.set_connected(suffix, attr)
+
+
+def remove_extra_inputs(node, index: DynamicInputIndex):
+    """Remove the free inputs at the end, keeping a single one"""
+    last_suffix = index.last_suffix
+    while (
+        last_suffix > 0
+        and not index.is_connected(last_suffix)
+        and not index.is_connected(last_suffix - 1)
+    ):
+        remove_dynamic_input(node, index, last_suffix)
+        last_suffix = index.last_suffix
+
+
+def ensure_free_input(node, index: DynamicInputIndex):
+    """Create a free input after the biggest connected input if there is none"""
+    last_suffix = index.last_suffix
+    if last_suffix < 0 or index.is_connected(last_suffix):
+        create_dynamic_input(node, index, last_suffix + 1)
+
+
+def remove_free_input(node, index: DynamicInputIndex):
+    """Remove the free input after the biggest connected input, used when the node is released"""
+    last_suffix = index.last_suffix
+    if last_suffix >= 0 and not index.is_connected(last_suffix):
+        remove_dynamic_input(node, index, last_suffix)
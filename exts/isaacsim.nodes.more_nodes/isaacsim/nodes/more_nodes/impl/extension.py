@@ -1,25 +1,161 @@
 """Support required by the Carbonite extension loader"""
 
-# from contextlib import suppress
+import sys
+from contextlib import suppress
 
-# import omni.ext
+import omni.ext
 
+from . import diagnostics, profiling
+from .topology import TopologyEditor
 
-# class _PublicExtension(omni.ext.IExt):
-#     """Object that tracks the lifetime of the Python part of the extension loading"""
+# Aggregator shared by every Logging Node, owned by the running extension
+_log_aggregator = None
 
-#     def __init__(self, *args, **kwargs):
-#         super().__init__(*args, **kwargs)
-#         with suppress(ImportError):
-#             import omni.kit.app  # noqa: PLW0621
+# Dynamic attribute edits of every node, committed once per frame while the extension runs
+_topology_editor = TopologyEditor()
 
-#             app = omni.kit.app.get_app()
-#             manager = app.get_extension_manager()
-#             # This is a bit of a hack to make the template directory visible to the OmniGraph UI extension
-#             # if it happens to already be enabled. The "hack" part is that this logic really should be in
-#             # omni.graph.ui, but it would be much more complicated there, requiring management of extensions
-#             # that both do and do not have dependencies on omni.graph.ui.
-#             if manager.is_extension_enabled("omni.graph.ui"):
-#                 import omni.graph.ui  # noqa: PLW0621
 
-#                 omni.graph.ui.ComputeNodeWidget.get_instance().add_template_path(__file__)
+def get_log_aggregator():
+    """Aggregator the Logging Nodes submit their records to, created on first use"""
+    global _log_aggregator
+    if _log_aggregator is None:
+        # The sinks and their writer thread are only loaded once a Logging Node logs something
+        from .aggregator import LogAggregator
+
+        _log_aggregator = LogAggregator()
+    return _log_aggregator
+
+
+def _loaded_module(name: str):
+    """Submodule of the extension if something imported it already, None otherwise"""
+    return sys.modules.get(f"{__package__}.{name}")
+
+
+def get_topology_editor() -> TopologyEditor:
+    """Editor the nodes queue their dynamic attribute creations and removals to"""
+    return _topology_editor
+
+
+def get_signal_history(node_path: str):
+    """Recent input values kept by the Logging Node at a prim path with history enabled, None otherwise"""
+    history = _loaded_module("history")
+    return history.get_history(node_path) if history is not None else None
+
+
+def set_logging_enabled(enabled: bool):
+    """Enable or disable the output of every Logging Node using the global sink"""
+    get_log_aggregator().enabled = enabled
+
+
+def set_logging_level(level: str):
+    """Drop the Logging Node records below a level: debug, info, warning or error, ValueError otherwise"""
+    get_log_aggregator().set_level(level)
+
+
+def enable_profiling(dump_interval: float = 0.0):
+    """Start recording the compute time and counters of every More Nodes node instance"""
+    profiling.enable(dump_interval)
+
+
+def disable_profiling():
+    """Stop recording, the collected statistics stay queryable"""
+    profiling.disable()
+
+
+def reset_profiling():
+    """Clear the collected statistics"""
+    profiling.reset()
+
+
+def get_node_profiles() -> dict:
+    """Compute statistics of every profiled node instance, by prim path"""
+    return profiling.get_profiles()
+
+
+def get_profile_summary() -> str:
+    """Compact text summary of the most expensive node instances"""
+    return profiling.format_summary()
+
+
+def enable_diagnostics(sample_interval: float = 0.0, history: int = 256):
+    """Start tracking the dynamic attributes, internal state sizes and allocations of every node type"""
+    diagnostics.enable(sample_interval, history)
+
+
+def disable_diagnostics():
+    """Stop tracking, the samples taken stay queryable"""
+    diagnostics.disable()
+
+
+def sample_diagnostics() -> dict:
+    """Take a diagnostics sample now and return it"""
+    return diagnostics.sample()
+
+
+def get_diagnostics() -> list:
+    """Diagnostics samples kept so far, oldest first"""
+    return diagnostics.get_samples()
+
+
+def get_diagnostics_summary() -> str:
+    """Compact text summary of the last diagnostics sample"""
+    return diagnostics.format_summary()
+
+
+class _PublicExtension(omni.ext.IExt):
+    """Object that tracks the lifetime of the Python part of the extension loading"""
+
+    # def __init__(self, *args, **kwargs):
+    #     super().__init__(*args, **kwargs)
+    #     with suppress(ImportError):
+    #         import omni.kit.app  # noqa: PLW0621
+
+    #         app = omni.kit.app.get_app()
+    #         manager = app.get_extension_manager()
+    #         # This is a bit of a hack to make the template directory visible to the OmniGraph UI extension
+    #         # if it happens to already be enabled. The "hack" part is that this logic really should be in
+    #         # omni.graph.ui, but it would be much more complicated there, requiring management of extensions
+    #         # that both do and do not have dependencies on omni.graph.ui.
+    #         if manager.is_extension_enabled("omni.graph.ui"):
+    #             import omni.graph.ui  # noqa: PLW0621
+
+    #             omni.graph.ui.ComputeNodeWidget.get_instance().add_template_path(__file__)
+
+    def on_startup(self, ext_id):
+        """Flush the aggregated Logging Node records and commit the attribute edits once per frame"""
+        self._update_subscription = None
+        with suppress(ImportError):
+            import omni.kit.app  # noqa: PLW0621
+
+            self._update_subscription = (
+                omni.kit.app.get_app()
+                .get_update_event_stream()
+                .create_subscription_to_pop(self._on_update, name="isaacsim.nodes.more_nodes.log_aggregator")
+            )
+        # Without a frame to commit at, the edits are applied as soon as they are requested
+        _topology_editor.deferred = self._update_subscription is not None
+
+    def _on_update(self, event):
+        _topology_editor.commit()
+        if _log_aggregator is not None:
+            _log_aggregator.end_frame()
+        if diagnostics.enabled:
+            diagnostics.maybe_sample()
+
+    def on_shutdown(self):
+        """Write out the records and traces still buffered by the Logging Nodes"""
+        global _log_aggregator
+        self._update_subscription = None
+        _topology_editor.commit()
+        _topology_editor.deferred = False
+        diagnostics.disable()
+        if _log_aggregator is not None:
+            _log_aggregator.close()
+            _log_aggregator = None
+        # Nothing was opened by the modules that were never imported
+        log_sink = _loaded_module("log_sink")
+        if log_sink is not None:
+            log_sink.close_all_sinks()
+        trace = _loaded_module("trace")
+        if trace is not None:
+            trace.close_all_traces()
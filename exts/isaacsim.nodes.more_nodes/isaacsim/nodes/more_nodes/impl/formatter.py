@@ -0,0 +1,91 @@
+"""Type-aware value formatting that summarizes large arrays instead of printing them"""
+
+import zlib
+
+import numpy as np
+
+# Elements reduced at once when summarizing, small enough for a block to stay in cache
+_BLOCK_ELEMENTS = 1 << 16
+
+_TEXT_BASE_TYPES = ("token", "string", "path")
+
+
+def _truncate(text: str, max_length: int) -> str:
+    if max_length and len(text) > max_length:
+        return text[:max(0, max_length - 3)] + "..."
+    return text
+
+
+def summarize_array(value: np.ndarray, preview: int = 3, with_hash: bool = False) -> str:
+    """
+    One line summary of an array: shape, dtype, min/max/mean and the first and last elements.
+    Min, max and sum are reduced block by block so the data is only streamed through memory once.
+    """
+    parts = [f"shape={value.shape}", f"dtype={value.dtype}"]
+    flat = value.reshape(-1)
+    if flat.size and (np.issubdtype(flat.dtype, np.number) or flat.dtype == np.bool_):
+        minimum = maximum = None
+        total = 0.0
+        for start in range(0, flat.size, _BLOCK_ELEMENTS):
+            block = flat[start:start + _BLOCK_ELEMENTS]
+            block_min, block_max = block.min(), block.max()
+            minimum = block_min if minimum is None else min(minimum, block_min)
+            maximum = block_max if maximum is None else max(maximum, block_max)
+            total += float(block.sum(dtype=np.float64))
+        parts.append(f"min={minimum}")
+        parts.append(f"max={maximum}")
+        parts.append(f"mean={total / flat.size:.6g}")
+    if preview and value.shape and len(value):
+        if len(value) <= 2 * preview:
+            parts.append(f"values={value.tolist()}")
+        else:
+            parts.append(f"first={value[:preview].tolist()}")
+            parts.append(f"last={value[-preview:].tolist()}")
+    if with_hash:
+        parts.append(f"crc32={zlib.crc32(np.ascontiguousarray(value)):08x}")
+    return f"array({', '.join(parts)})"
+
+
+class ValueFormatter:
+    """
+    Picks a formatting function per resolved attribute type and caches it.
+    The returned functions only capture the settings they were created with, so they can run on a
+    writer thread while the settings change.
+    """
+
+    __slots__ = ("_settings", "_cache")
+
+    def __init__(self, preview: int = 3, max_length: int = 0, with_hash: bool = False, summarize: bool = False):
+        self._settings = None
+        self._cache = {}
+        self.configure(preview, max_length, with_hash, summarize)
+
+    def configure(self, preview: int, max_length: int, with_hash: bool, summarize: bool) -> bool:
+        """Change the settings, dropping the cached functions. Returns True if they changed."""
+        settings = (preview, max_length, with_hash, summarize)
+        if settings == self._settings:
+            return False
+        self._settings = settings
+        self._cache = {}
+        return True
+
+    def for_type(self, ogn_type: str):
+        """Formatting function for values of the given OGN type name"""
+        formatter = self._cache.get(ogn_type)
+        if formatter is None:
+            formatter = self._create(ogn_type)
+            self._cache[ogn_type] = formatter
+        return formatter
+
+    def _create(self, ogn_type: str):
+        preview, max_length, with_hash, summarize = self._settings
+
+        if ogn_type.endswith("[]") and summarize and not ogn_type.startswith(_TEXT_BASE_TYPES):
+            def format_array(value):
+                if not isinstance(value, np.ndarray):
+                    value = np.asarray(value)
+                return _truncate(summarize_array(value, preview, with_hash), max_length)
+            return format_array
+
+        # Printed like the Logging Node always printed them, cut to the maximum length if there is one
+        return lambda value: _truncate(str(value), max_length)
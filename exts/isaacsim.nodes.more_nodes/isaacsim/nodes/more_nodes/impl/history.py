@@ -0,0 +1,219 @@
+"""
+Bounded in-memory history of the values of the Logging Node inputs.
+
+Each input gets a preallocated NumPy ring buffer and a time column. Queries return read-only views on the
+ring, valid until the samples they cover are overwritten, so no Python object is created per sample.
+"""
+
+import weakref
+
+import carb
+import numpy as np
+
+# Shortest ring worth keeping when the memory cap leaves less room than requested
+MIN_CAPACITY = 16
+
+# History of every node keeping one, by prim path
+_histories = weakref.WeakValueDictionary()
+
+
+def _read_only(array, start, end):
+    view = array[start:end]
+    view.flags.writeable = False
+    return view
+
+
+class RingBuffer:
+    """
+    Fixed-capacity ring of samples of one shape and dtype, with their times.
+    Every sample is written twice, capacity slots apart, so the last n samples are always one
+    contiguous slice in chronological order.
+    """
+
+    __slots__ = ("capacity", "shape", "dtype", "_times", "_values", "_head", "_count", "_scratch")
+
+    def __init__(self, capacity: int, shape, dtype):
+        self.capacity = capacity
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self._times = np.zeros(2 * capacity, dtype=np.float64)
+        self._values = np.zeros((2 * capacity, *self.shape), dtype=self.dtype)
+        # Slot the next sample is written to
+        self._head = 0
+        self._count = 0
+        # Interpolated value, reused by every sample_at() call
+        self._scratch = None
+
+    @staticmethod
+    def sample_bytes(shape, dtype) -> int:
+        """Memory taken by one sample and its time, both copies included"""
+        return 2 * (8 + int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize)
+
+    @property
+    def nbytes(self) -> int:
+        return self._times.nbytes + self._values.nbytes
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+
+    def append(self, time: float, value):
+        """Write a sample over the oldest one once the ring is full"""
+        head = self._head
+        capacity = self.capacity
+        if self._count and time < self._times[head + capacity - 1]:
+            # The timeline went back, the older samples no longer describe the past
+            self.clear()
+            head = 0
+        self._times[head] = self._times[head + capacity] = time
+        self._values[head] = value
+        self._values[head + capacity] = value
+        self._head = (head + 1) % capacity
+        if self._count < capacity:
+            self._count += 1
+
+    @property
+    def last_time(self) -> float:
+        """Time of the newest sample, None while the ring is empty"""
+        return float(self._times[self._head + self.capacity - 1]) if self._count else None
+
+    def replace_last(self, value):
+        """Overwrite the value of the newest sample, keeping its time"""
+        slot = (self._head - 1) % self.capacity
+        self._values[slot] = value
+        self._values[slot + self.capacity] = value
+
+    def last(self, n: int = None):
+        """(times, values) views on the last n samples, all of them by default"""
+        n = self._count if n is None else max(0, min(n, self._count))
+        end = self._head + self.capacity
+        return _read_only(self._times, end - n, end), _read_only(self._values, end - n, end)
+
+    def window(self, start: float, end: float):
+        """(times, values) views on the samples recorded between start and end, both included"""
+        times, values = self.last()
+        first = np.searchsorted(times, start, side="left")
+        stop = np.searchsorted(times, end, side="right")
+        return times[first:stop], values[first:stop]
+
+    def sample_at(self, time: float, interpolate: bool = False):
+        """
+        Value at a time: the last sample at or before it, or for floating-point values the linear interpolation
+        between the samples around it. The last sample is held after the end, None is returned before the start.
+        The result is a view valid until the next append() or sample_at() call.
+        """
+        times, values = self.last()
+        after = int(np.searchsorted(times, time, side="right"))
+        if after == 0:
+            return None
+        before = values[after - 1]
+        if not interpolate or after == len(times) or self.dtype.kind != "f":
+            return before
+
+        # === Interpolate every element at once into the reused buffer ===
+        weight = (time - times[after - 1]) / (times[after] - times[after - 1])
+        scratch = self._scratch
+        if scratch is None:
+            scratch = self._scratch = np.empty(self.shape, dtype=self.dtype)
+        np.subtract(values[after], before, out=scratch)
+        scratch *= weight
+        scratch += before
+        return scratch if self.shape else scratch[()]
+
+
+class SignalHistory:
+    """
+    Ring buffers of the inputs of one node, sharing a hard memory cap.
+    Each ring overwrites its oldest samples. A ring that does not fit in what is left of the cap is
+    created shorter, down to MIN_CAPACITY, below which the input is not recorded.
+    Inputs are keyed by their name without the port, like dataIn0.
+    """
+
+    __slots__ = ("node_path", "capacity", "max_bytes", "_rings", "_rejected", "__weakref__")
+
+    def __init__(self, node_path: str, capacity: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.node_path = node_path
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self._rings = {}
+        # Inputs whose values cannot be kept, warned about once
+        self._rejected = set()
+        _histories[node_path] = self
+
+    def configure(self, capacity: int, max_bytes: int):
+        """Change the ring size and the memory cap, dropping the samples if they changed"""
+        if (capacity, max_bytes) != (self.capacity, self.max_bytes):
+            self.capacity = capacity
+            self.max_bytes = max_bytes
+            self._rings = {}
+            self._rejected = set()
+
+    @property
+    def names(self) -> list:
+        return list(self._rings)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(ring.nbytes for ring in self._rings.values())
+
+    def record(self, name: str, time: float, value) -> bool:
+        """Append a sample, returns False if the input is not recorded"""
+        ring = self._rings.get(name)
+        if ring is None or (isinstance(value, np.ndarray) and value.shape != ring.shape):
+            if name in self._rejected:
+                return False
+            # === The ring is created on the first sample and again when the shape changes ===
+            ring = self._create_ring(name, value)
+            if ring is None:
+                return False
+        ring.append(time, value)
+        return True
+
+    def forget(self, name: str):
+        """Drop the samples of an input, for instance because it got disconnected"""
+        self._rings.pop(name, None)
+        self._rejected.discard(name)
+
+    def close(self):
+        """Drop every sample and unregister the history"""
+        self._rings = {}
+        if _histories.get(self.node_path) is self:
+            del _histories[self.node_path]
+
+    def last(self, name: str, n: int = None):
+        """(times, values) views on the last n samples of an input, None if it has no history"""
+        ring = self._rings.get(name)
+        return ring.last(n) if ring is not None else None
+
+    def window(self, name: str, start: float, end: float):
+        """(times, values) views on the samples of an input between start and end, None if it has no history"""
+        ring = self._rings.get(name)
+        return ring.window(start, end) if ring is not None else None
+
+    def _create_ring(self, name, value):
+        array = np.asarray(value)
+        if array.dtype.kind not in "biuf":
+            self._reject(name, f"values of type {array.dtype} are not numeric")
+            return None
+
+        self._rings.pop(name, None)
+        available = self.max_bytes - self.nbytes
+        capacity = min(self.capacity, available // RingBuffer.sample_bytes(array.shape, array.dtype))
+        if capacity < max(1, min(MIN_CAPACITY, self.capacity)):
+            self._reject(name, f"the memory cap of {self.max_bytes} bytes is reached")
+            return None
+
+        ring = self._rings[name] = RingBuffer(capacity, array.shape, array.dtype)
+        return ring
+
+    def _reject(self, name, reason):
+        self._rejected.add(name)
+        carb.log_warn(f"Logging Node {self.node_path} keeps no history of {name}: {reason}")
+
+
+def get_history(node_path: str):
+    """History kept by the node at a prim path, None if it keeps none"""
+    return _histories.get(node_path)
@@ -0,0 +1,194 @@
+"""Buffered log sinks that move record formatting and I/O off the simulation thread"""
+
+import sys
+import threading
+import weakref
+from collections import deque, namedtuple
+
+import carb
+
+# formatter is an optional callable turning the value into text on the writer thread
+LogRecord = namedtuple("LogRecord", ["time", "name", "value", "formatter"], defaults=[None])
+
+SINK_GLOBAL = "global"
+SINK_CONSOLE = "console"
+SINK_FILE = "file"
+SINK_SOCKET = "socket"
+SINK_ROTATING_FILE = "rotatingFile"
+
+# Seconds the socket sink waits for the connection, and then for each write, before giving up
+SOCKET_TIMEOUT = 1.0
+
+OVERFLOW_DROP_OLDEST = "dropOldest"
+OVERFLOW_DROP_NEWEST = "dropNewest"
+OVERFLOW_BLOCK = "block"
+
+# Every sink that has not been closed yet, so they can be flushed on extension shutdown
+_LIVE_SINKS = weakref.WeakSet()
+
+
+def format_record(record: LogRecord) -> str:
+    """Format a record the same way the Logging Node always printed it"""
+    value = record.value if record.formatter is None else record.formatter(record.value)
+    return f"[Logging Node at {record.time}] {record.name}: {value}\n"
+
+
+class ConsoleWriter:
+    """Writes batches of lines to stdout"""
+
+    def write(self, text: str, batch=None):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def close(self):
+        pass
+
+
+class FileWriter:
+    """Appends batches of lines to a text file"""
+
+    def __init__(self, path: str):
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, text: str, batch=None):
+        self._file.write(text)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class SocketWriter:
+    """Streams batches of lines to a local TCP socket given as 'host:port'"""
+
+    def __init__(self, target: str, timeout: float = SOCKET_TIMEOUT):
+        host, _, port = target.rpartition(":")
+        import socket
+
+        # The connection is made on the compute thread, an unreachable host must not stall the graph
+        self._socket = socket.create_connection((host or "127.0.0.1", int(port)), timeout=timeout)
+
+    def write(self, text: str, batch=None):
+        self._socket.sendall(text.encode("utf-8"))
+
+    def close(self):
+        self._socket.close()
+
+
+def create_writer(kind: str, target: str, **options):
+    """
+    Create the writer for a sink kind.
+    Writers receive the formatted text of a batch along with the batch itself.
+    """
+    if kind == SINK_ROTATING_FILE:
+        from .rotating_file import RotatingFileWriter
+
+        return RotatingFileWriter(target, **options)
+    if kind == SINK_FILE:
+        return FileWriter(target)
+    if kind == SINK_SOCKET:
+        return SocketWriter(target)
+    return ConsoleWriter()
+
+
+class LogSink:
+    """
+    Bounded ring buffer of log records drained in batches by a background writer thread.
+    submit() never formats or writes, it only enqueues.
+    """
+
+    def __init__(self, writer, capacity: int = 4096, overflow_policy: str = OVERFLOW_DROP_OLDEST, batch_size: int = 256,
+                 formatter=format_record):
+        self._writer = writer
+        self._formatter = formatter
+        self._capacity = max(1, capacity)
+        self._overflow_policy = overflow_policy
+        self._batch_size = max(1, batch_size)
+
+        self._records = deque()
+        self._condition = threading.Condition()
+        self._pending = 0
+        self._closed = False
+
+        # Records lost to the overflow policy since the sink was created
+        self.dropped = 0
+
+        self._thread = threading.Thread(target=self._run, name="MoreNodesLogSink", daemon=True)
+        self._thread.start()
+        _LIVE_SINKS.add(self)
+
+    def submit(self, record) -> bool:
+        """Enqueue a record, returns False if it was dropped"""
+        with self._condition:
+            if self._closed:
+                return False
+            if len(self._records) >= self._capacity:
+                if self._overflow_policy == OVERFLOW_DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                if self._overflow_policy == OVERFLOW_BLOCK:
+                    self._condition.wait_for(lambda: len(self._records) < self._capacity or self._closed)
+                    if self._closed:
+                        return False
+                else:
+                    self._records.popleft()
+                    self._pending -= 1
+                    self.dropped += 1
+            self._records.append(record)
+            self._pending += 1
+            self._condition.notify_all()
+        return True
+
+    def flush(self, timeout: float = None) -> bool:
+        """Wait until every submitted record has been written"""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: float = None):
+        """Flush the remaining records, stop the writer thread and close the writer"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        self._writer.close()
+        _LIVE_SINKS.discard(self)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._records or self._closed)
+                if not self._records and self._closed:
+                    return
+                count = min(len(self._records), self._batch_size)
+                batch = [self._records.popleft() for _ in range(count)]
+                # Wake up producers blocked on a full buffer
+                self._condition.notify_all()
+
+            try:
+                self._writer.write("".join(map(self._formatter, batch)), batch)
+            except Exception as e:
+                carb.log_error(f"Error writing log records: {e}")
+
+            with self._condition:
+                self._pending -= len(batch)
+                self._condition.notify_all()
+
+
+def create_sink(kind: str, target: str = "", capacity: int = 4096, overflow_policy: str = OVERFLOW_DROP_OLDEST,
+                **options) -> LogSink:
+    """Create a sink writing to the console, a file, rotating compressed files or a local socket"""
+    return LogSink(create_writer(kind, target, **options), capacity, overflow_policy)
+
+
+def flush_all_sinks(timeout: float = None):
+    """Flush every live sink"""
+    for sink in list(_LIVE_SINKS):
+        sink.flush(timeout)
+
+
+def close_all_sinks(timeout: float = None):
+    """Flush and close every live sink"""
+    for sink in list(_LIVE_SINKS):
+        sink.close(timeout)
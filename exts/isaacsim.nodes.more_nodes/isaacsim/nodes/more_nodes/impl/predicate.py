@@ -0,0 +1,135 @@
+"""
+Filter expressions deciding whether a Logging Node logs, like "dataIn0 > 5.0 or norm(dataIn1) > 2".
+
+An expression is parsed and checked once, then compiled into a code object. Only arithmetic, comparisons,
+boolean operators, indexing and the functions in FUNCTIONS are allowed. Boolean operators are rewritten
+into NumPy logical functions so array inputs are compared element-wise; the expression holds when any
+element of the result is true. Powers are computed in floating point, so an expression like 9**9**9**9
+overflows to inf instead of building an unbounded integer on the compute thread.
+"""
+
+import ast
+import functools
+
+import numpy as np
+
+FUNCTIONS = {
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "norm": lambda value: np.linalg.norm(np.asarray(value, dtype=np.float64), axis=-1),
+    "min": np.min,
+    "max": np.max,
+    "mean": np.mean,
+    "sum": np.sum,
+    "size": np.size,
+    "any": np.any,
+    "all": np.all,
+}
+
+# Names of the variables available besides the inputs
+TIME_VARIABLE = "time"
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BoolOp, ast.BinOp, ast.UnaryOp, ast.Compare, ast.Call, ast.Name, ast.Constant,
+    ast.Subscript, ast.Slice, ast.Tuple, ast.Load,
+    ast.And, ast.Or, ast.Not, ast.USub, ast.UAdd,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq,
+)
+
+
+def _logical_and(*values):
+    return functools.reduce(np.logical_and, values)
+
+
+def _logical_or(*values):
+    return functools.reduce(np.logical_or, values)
+
+
+def _power(base, exponent):
+    with np.errstate(over="ignore", invalid="ignore"):
+        return np.float_power(base, exponent)
+
+
+_ENVIRONMENT = {
+    "__builtins__": {},
+    "_and": _logical_and,
+    "_or": _logical_or,
+    "_not": np.logical_not,
+    "_pow": _power,
+    **FUNCTIONS,
+}
+
+
+class _Vectorize(ast.NodeTransformer):
+    """Rewrite and/or/not, powers and chained comparisons into element-wise NumPy calls"""
+
+    @staticmethod
+    def _call(name, args):
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[])
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        return self._call("_and" if isinstance(node.op, ast.And) else "_or", node.values)
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Pow):
+            return self._call("_pow", [node.left, node.right])
+        return node
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return self._call("_not", [node.operand])
+        return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        if len(node.ops) == 1:
+            return node
+        # a < b < c becomes _and(a < b, b < c)
+        operands = [node.left] + node.comparators
+        pairs = [
+            ast.Compare(left=left, ops=[op], comparators=[right])
+            for left, op, right in zip(operands, node.ops, operands[1:])
+        ]
+        return self._call("_and", pairs)
+
+
+class PredicateError(ValueError):
+    """Raised when a filter expression is not valid"""
+
+
+class CompiledPredicate:
+    """A filter expression checked and compiled once, evaluated every tick"""
+
+    def __init__(self, expression: str, input_prefix: str = "dataIn"):
+        self.expression = expression
+        try:
+            tree = ast.parse(expression.strip(), mode="eval")
+        except SyntaxError as e:
+            raise PredicateError(f"Invalid filter '{expression}': {e.msg}") from None
+
+        # === Check every node and collect the referenced inputs ===
+        self.variables = set()
+        for node in ast.walk(tree):
+            if not isinstance(node, _ALLOWED_NODES):
+                raise PredicateError(f"'{type(node).__name__}' is not allowed in filter '{expression}'")
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or node.keywords:
+                    raise PredicateError(f"Only the functions {', '.join(FUNCTIONS)} can be called in filter '{expression}'")
+            elif isinstance(node, ast.Name) and node.id not in FUNCTIONS:
+                name = node.id
+                if name != TIME_VARIABLE and not (
+                    name.startswith(input_prefix) and name[len(input_prefix):].isdigit()
+                ):
+                    raise PredicateError(f"Unknown name '{name}' in filter '{expression}'")
+                self.variables.add(name)
+
+        tree = ast.fix_missing_locations(_Vectorize().visit(tree))
+        self._code = compile(tree, "<filter>", "eval")
+
+    def __call__(self, variables: dict) -> bool:
+        """Evaluate with the values of the referenced variables, True if any element of the result is true"""
+        return bool(np.any(eval(self._code, _ENVIRONMENT, variables)))
@@ -0,0 +1,133 @@
+"""
+Opt-in per-node compute instrumentation.
+
+Nodes only check `profiling.enabled` on their hot path. While it is False no timer is read and nothing
+is formatted; while it is True each compute adds its wall time and counters to the NodeProfile of the
+node instance, keyed by prim path until the node is released.
+"""
+
+import time
+
+import carb
+
+# Upper bounds in microseconds of the compute time histogram buckets, the last bucket is unbounded
+HISTOGRAM_BOUNDS_US = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000)
+
+enabled = False
+
+_profiles = {}
+_dump_interval = 0.0
+_last_dump = 0.0
+
+
+class NodeProfile:
+    """Compute statistics of one node instance"""
+
+    def __init__(self, node_path: str, node_type: str):
+        self.node_path = node_path
+        self.node_type = node_type
+        self.clear()
+
+    def clear(self):
+        self.ticks = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_US) + 1)
+        self.pairs_processed = 0
+        self.records_logged = 0
+        self.bytes_moved = 0
+
+    def add(self, elapsed_ns: int, pairs: int, records: int, bytes_moved: int):
+        self.ticks += 1
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+        elapsed_us = elapsed_ns / 1000.0
+        bucket = 0
+        while bucket < len(HISTOGRAM_BOUNDS_US) and elapsed_us > HISTOGRAM_BOUNDS_US[bucket]:
+            bucket += 1
+        self.histogram[bucket] += 1
+        self.pairs_processed += pairs
+        self.records_logged += records
+        self.bytes_moved += bytes_moved
+
+    def summary(self) -> dict:
+        return {
+            "node_type": self.node_type,
+            "ticks": self.ticks,
+            "mean_us": self.total_ns / self.ticks / 1000.0 if self.ticks else 0.0,
+            "max_us": self.max_ns / 1000.0,
+            "histogram_bounds_us": list(HISTOGRAM_BOUNDS_US),
+            "histogram": list(self.histogram),
+            "pairs_processed": self.pairs_processed,
+            "records_logged": self.records_logged,
+            "bytes_moved": self.bytes_moved,
+        }
+
+
+def enable(dump_interval: float = 0.0):
+    """Start profiling every node, logging a summary every dump_interval seconds if it is positive"""
+    global enabled, _dump_interval, _last_dump
+    enabled = True
+    _dump_interval = dump_interval
+    _last_dump = time.monotonic()
+
+
+def disable():
+    """Stop profiling, the collected statistics are kept"""
+    global enabled
+    enabled = False
+
+
+def reset():
+    """Clear the collected statistics"""
+    for profile in _profiles.values():
+        profile.clear()
+
+
+def get_profile(node) -> NodeProfile:
+    """Profile of a node instance, created on first use"""
+    node_path = node.get_prim_path()
+    profile = _profiles.get(node_path)
+    if profile is None:
+        profile = NodeProfile(node_path, node.get_type_name())
+        _profiles[node_path] = profile
+    return profile
+
+
+def release_profile(profile: NodeProfile):
+    """Forget the profile of a released node, unless its prim path already belongs to another profile"""
+    if _profiles.get(profile.node_path) is profile:
+        del _profiles[profile.node_path]
+
+
+def record(profile: NodeProfile, elapsed_ns: int, pairs: int = 0, records: int = 0, bytes_moved: int = 0):
+    """Add one compute to a profile, dumping the summary when the interval elapsed"""
+    global _last_dump
+    profile.add(elapsed_ns, pairs, records, bytes_moved)
+    if _dump_interval > 0.0:
+        now = time.monotonic()
+        if now - _last_dump >= _dump_interval:
+            _last_dump = now
+            carb.log_info(format_summary())
+
+
+def get_profiles() -> dict:
+    """Summary of every profiled node, by prim path"""
+    return {node_path: profile.summary() for node_path, profile in _profiles.items() if profile.ticks}
+
+
+def format_summary(limit: int = 20) -> str:
+    """Compact text summary of the most expensive nodes"""
+    profiles = sorted(
+        (profile for profile in _profiles.values() if profile.ticks),
+        key=lambda profile: profile.total_ns,
+        reverse=True
+    )
+    lines = [f"More Nodes compute profile ({len(profiles)} nodes)"]
+    for profile in profiles[:limit]:
+        lines.append(
+            f"  {profile.node_path}: ticks={profile.ticks}"
+            f" mean={profile.total_ns / profile.ticks / 1000.0:.1f}us max={profile.max_ns / 1000.0:.1f}us"
+            f" pairs={profile.pairs_processed} records={profile.records_logged} bytes={profile.bytes_moved}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,76 @@
+"""Throttling helpers that keep Logging Nodes cheap in production graphs"""
+
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket allowing at most `rate` acquisitions per second, with bursts of up to one second.
+    A rate of 0 disables the limit.
+    """
+
+    __slots__ = ("rate", "_tokens", "_last_refill")
+
+    def __init__(self, rate: float = 0.0):
+        self.rate = 0.0
+        self._tokens = 0.0
+        self._last_refill = time.monotonic()
+        self.configure(rate)
+
+    def configure(self, rate: float):
+        """Change the rate, refilling the bucket if it changed"""
+        if rate == self.rate:
+            return
+        self.rate = max(0.0, rate)
+        self._tokens = self.rate
+        self._last_refill = time.monotonic()
+
+    def try_acquire(self) -> bool:
+        """Take one token, returns False if the bucket is empty"""
+        if self.rate <= 0.0:
+            return True
+        now = time.monotonic()
+        self._tokens = min(self.rate, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+
+class ThrottleCounters:
+    """Counts the records that were not logged, by reason, between two summaries"""
+
+    DECIMATED = "decimated"
+    FILTERED = "filtered"
+    RATE_LIMITED = "rateLimited"
+    UNCHANGED = "unchanged"
+
+    __slots__ = ("counts", "totals", "_last_summary")
+
+    def __init__(self):
+        self.counts = {self.DECIMATED: 0, self.FILTERED: 0, self.RATE_LIMITED: 0, self.UNCHANGED: 0}
+        self.totals = dict(self.counts)
+        self._last_summary = time.monotonic()
+
+    def add(self, reason: str, count: int = 1):
+        self.counts[reason] += count
+        self.totals[reason] += count
+
+    def take_summary(self, interval: float):
+        """
+        Return the summary text if interval seconds passed since the last one and something was throttled,
+        resetting the counts. Returns None otherwise.
+        """
+        if interval <= 0.0:
+            return None
+        now = time.monotonic()
+        if now - self._last_summary < interval:
+            return None
+        self._last_summary = now
+        if not any(self.counts.values()):
+            return None
+        summary = ", ".join(f"{reason}={count}" for reason, count in self.counts.items())
+        for reason in self.counts:
+            self.counts[reason] = 0
+        return f"throttled {summary} in the last {interval:g}s"
@@ -0,0 +1,201 @@
+"""
+Size-capped, compressed, rotating log files with a time index.
+
+Records are written as independently compressed chunks appended to segment files. Each chunk gets a line in
+index.jsonl with its segment, byte range and time range, so a time range can be read back by decompressing
+only the chunks that overlap it. Segments rotate by size or age, and the oldest segments are deleted once
+the directory grows past its disk budget.
+"""
+
+import json
+import lzma
+import os
+import time
+import zlib
+
+INDEX_NAME = "index.jsonl"
+
+COMPRESSION_ZLIB = "zlib"
+COMPRESSION_LZMA = "lzma"
+
+_EXTENSIONS = {COMPRESSION_ZLIB: ".log.zz", COMPRESSION_LZMA: ".log.xz"}
+_SEGMENT_PREFIX = "segment_"
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == COMPRESSION_LZMA:
+        return lzma.compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == COMPRESSION_LZMA:
+        return lzma.decompress(data)
+    return zlib.decompress(data)
+
+
+def _segment_number(file_name: str):
+    if not file_name.startswith(_SEGMENT_PREFIX):
+        return None
+    number = file_name[len(_SEGMENT_PREFIX):].split(".", 1)[0]
+    return int(number) if number.isdigit() else None
+
+
+class RotatingFileWriter:
+    """
+    LogSink writer producing compressed, rotating segments in a directory.
+    Text is buffered until a chunk holds chunk_bytes or is chunk_seconds old, then compressed and appended.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        compression: str = COMPRESSION_ZLIB,
+        segment_bytes: int = 64 * 1024 * 1024,
+        segment_seconds: float = 0.0,
+        max_total_bytes: int = 1024 * 1024 * 1024,
+        chunk_bytes: int = 256 * 1024,
+        chunk_seconds: float = 1.0,
+    ):
+        self.directory = directory
+        self.compression = compression if compression in _EXTENSIONS else COMPRESSION_ZLIB
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.max_total_bytes = max_total_bytes
+        self.chunk_bytes = chunk_bytes
+        self.chunk_seconds = chunk_seconds
+        os.makedirs(directory, exist_ok=True)
+
+        # Continue the numbering of the segments already in the directory
+        numbers = [number for number in map(_segment_number, os.listdir(directory)) if number is not None]
+        self._next_segment = max(numbers, default=-1) + 1
+        self._segment = None
+        self._segment_name = None
+        self._segment_opened = 0.0
+
+        self._chunk = []
+        self._chunk_size = 0
+        self._chunk_records = 0
+        self._chunk_start_time = None
+        self._chunk_end_time = None
+        self._chunk_opened = 0.0
+
+    def write(self, text: str, batch=None):
+        if not text:
+            return
+        if not self._chunk:
+            self._chunk_opened = time.monotonic()
+        self._chunk.append(text)
+        self._chunk_size += len(text)
+        for item in batch or ():
+            # Log records and aggregated frames both start with their time
+            record_time = item[0]
+            if self._chunk_start_time is None:
+                self._chunk_start_time = record_time
+            self._chunk_end_time = record_time
+            self._chunk_records += 1
+
+        if self._chunk_size >= self.chunk_bytes or time.monotonic() - self._chunk_opened >= self.chunk_seconds:
+            self._write_chunk()
+
+    def close(self):
+        self._write_chunk()
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    def _open_segment(self):
+        if self._segment is not None:
+            self._segment.close()
+        self._segment_name = f"{_SEGMENT_PREFIX}{self._next_segment:06d}{_EXTENSIONS[self.compression]}"
+        self._next_segment += 1
+        self._segment = open(os.path.join(self.directory, self._segment_name), "ab")
+        self._segment_opened = time.monotonic()
+        self._evict()
+
+    def _write_chunk(self):
+        if not self._chunk:
+            return
+        data = _compress("".join(self._chunk).encode("utf-8"), self.compression)
+
+        # === Rotate by size or age ===
+        if (
+            self._segment is None
+            or self._segment.tell() >= self.segment_bytes
+            or (self.segment_seconds > 0.0 and time.monotonic() - self._segment_opened >= self.segment_seconds)
+        ):
+            self._open_segment()
+
+        offset = self._segment.tell()
+        self._segment.write(data)
+        self._segment.flush()
+        entry = {
+            "segment": self._segment_name,
+            "offset": offset,
+            "length": len(data),
+            "compression": self.compression,
+            "start_time": self._chunk_start_time,
+            "end_time": self._chunk_end_time,
+            "records": self._chunk_records,
+        }
+        with open(os.path.join(self.directory, INDEX_NAME), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+        self._chunk = []
+        self._chunk_size = 0
+        self._chunk_records = 0
+        self._chunk_start_time = None
+        self._chunk_end_time = None
+
+    def _evict(self):
+        """Delete the oldest segments until the directory fits the disk budget"""
+        if self.max_total_bytes <= 0:
+            return
+        segments = sorted(
+            (number, file_name)
+            for file_name in os.listdir(self.directory)
+            for number in [_segment_number(file_name)]
+            if number is not None
+        )
+        sizes = {file_name: os.path.getsize(os.path.join(self.directory, file_name)) for _, file_name in segments}
+        total = sum(sizes.values())
+        evicted = set()
+        for _, file_name in segments:
+            if total <= self.max_total_bytes or file_name == self._segment_name:
+                break
+            os.remove(os.path.join(self.directory, file_name))
+            total -= sizes[file_name]
+            evicted.add(file_name)
+
+        if evicted:
+            # Drop the index entries of the deleted segments
+            entries = [entry for entry in read_index(self.directory) if entry["segment"] not in evicted]
+            temporary = os.path.join(self.directory, INDEX_NAME + ".tmp")
+            with open(temporary, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in entries)
+            os.replace(temporary, os.path.join(self.directory, INDEX_NAME))
+
+
+def read_index(directory: str):
+    """Index entries of the chunks written to a directory, oldest first"""
+    path = os.path.join(directory, INDEX_NAME)
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def read_range(directory: str, start_time: float = None, end_time: float = None):
+    """Yield the text of the chunks overlapping a time range, only those chunks are decompressed"""
+    for entry in read_index(directory):
+        if entry["start_time"] is not None:
+            if end_time is not None and entry["start_time"] > end_time:
+                continue
+            if start_time is not None and entry["end_time"] < start_time:
+                continue
+        path = os.path.join(directory, entry["segment"])
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as f:
+            f.seek(entry["offset"])
+            yield _decompress(f.read(entry["length"]), entry["compression"]).decode("utf-8")
@@ -0,0 +1,364 @@
+"""
+Frames of numeric values published in a shared memory segment for other processes.
+
+The segment holds a header, a JSON layout and two slots of slot_bytes each. The writer fills the slot readers
+are not looking at, then publishes it by flipping the active slot inside a seqlock: the sequence number is odd
+while a frame is being written and even once it is published. Readers map the active slot as NumPy views
+without copying, and a frame stays valid until the writer starts overwriting its slot two frames later.
+
+The module only depends on NumPy and the standard library, so processes running without Kit can load it
+from its path with importlib:
+
+    spec = importlib.util.spec_from_file_location("shared_memory", path)
+    shared_memory = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(shared_memory)
+    reader = shared_memory.SharedMemoryReader("more_nodes_World_ActionGraph_SharedMemoryExporter")
+"""
+
+import json
+import os
+import time as _time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+SEGMENT_MAGIC = 0x4D4E5348_4D454D01  # "MNSHMEM" and the format version
+
+# Header fields, one uint64 each
+_MAGIC = 0
+_SEQUENCE = 1
+_FRAME = 2
+_TIME = 3
+_ACTIVE = 4
+_GENERATION = 5
+_LAYOUT_LENGTH = 6
+_SLOT_BYTES = 7
+_CLOSED = 8
+_OWNER = 9
+HEADER_BYTES = 128
+
+# Room for the JSON layout of the values
+LAYOUT_BYTES = 64 * 1024
+
+# Values start on cache line boundaries in their slot
+_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _header_views(buffer):
+    header = np.ndarray((HEADER_BYTES // 8,), dtype=np.uint64, buffer=buffer)
+    time_field = np.ndarray((1,), dtype=np.float64, buffer=buffer, offset=_TIME * 8)
+    return header, time_field
+
+
+def _slot_views(buffer, slot_bytes, entries):
+    """Views on the values of each slot, by slot then entry"""
+    views = []
+    for slot in range(2):
+        base = HEADER_BYTES + LAYOUT_BYTES + slot * slot_bytes
+        views.append([
+            np.ndarray(tuple(entry["shape"]), dtype=np.dtype(entry["dtype"]), buffer=buffer, offset=base + entry["offset"])
+            for entry in entries
+        ])
+    return views
+
+
+def _attach(name):
+    """Open an existing segment without letting this process unlink it when it exits"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 the resource tracker unlinks every segment the process opened
+        segment = shared_memory.SharedMemory(name=name)
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+
+# Names of the segments owned by the writers of this process
+_OWNED_NAMES = set()
+
+
+def _process_alive(pid: int) -> bool:
+    if os.name == "nt":
+        # Named mappings go away with their last handle, one that still exists has a live owner
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _stale_owner(name):
+    """
+    Check that an existing segment was left behind by a writer that is gone: one that was closed, or whose owner
+    process exited. Returns None if it can be reclaimed, the reason to leave it alone otherwise.
+    """
+    if name in _OWNED_NAMES:
+        return "another exporter of this process publishes to it"
+    segment = _attach(name)
+    try:
+        if segment.size < HEADER_BYTES:
+            return "it is not a More Nodes shared memory segment"
+        header, time_field = _header_views(segment.buf)
+        magic, closed, owner = int(header[_MAGIC]), int(header[_CLOSED]), int(header[_OWNER])
+        # The views must be gone before the mapping is closed
+        del header, time_field
+    finally:
+        _close(segment)
+    if magic != SEGMENT_MAGIC:
+        return "it is not a More Nodes shared memory segment"
+    if closed:
+        return None
+    if owner == os.getpid():
+        # Left behind by a writer of this process that was never closed
+        return None
+    return f"the exporter of process {owner} still publishes to it" if _process_alive(owner) else None
+
+
+def _close(segment):
+    try:
+        segment.close()
+    except BufferError:
+        # Views handed out are still alive, the mapping goes away with them
+        pass
+
+
+class SharedMemoryWriter:
+    """
+    Owner of a segment publishing one frame of named values per write() call.
+    The layout is rewritten when the names, dtypes or shapes change. Values that are not numeric
+    or do not fit in a slot are left out and listed in dropped.
+    """
+
+    __slots__ = ("name", "slot_bytes", "dropped", "_segment", "_header", "_time", "_layout_key", "_included", "_views")
+
+    def __init__(self, name: str, slot_bytes: int):
+        self.name = name
+        self.slot_bytes = _align(max(_ALIGNMENT, slot_bytes))
+        size = HEADER_BYTES + LAYOUT_BYTES + 2 * self.slot_bytes
+        try:
+            self._segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # === Only replace a segment left behind by a writer that did not close ===
+            reason = _stale_owner(name)
+            if reason is not None:
+                raise FileExistsError(f"Shared memory segment {name} is in use: {reason}") from None
+            stale = shared_memory.SharedMemory(name=name)
+            stale.unlink()
+            _close(stale)
+            self._segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _OWNED_NAMES.add(name)
+
+        self._header, self._time = _header_views(self._segment.buf)
+        self._header[:] = 0
+        self._header[_SLOT_BYTES] = self.slot_bytes
+        self._header[_OWNER] = os.getpid()
+        self._header[_MAGIC] = SEGMENT_MAGIC
+
+        # (name, reason) of the values left out of the current layout
+        self.dropped = []
+        self._layout_key = None
+        # Positions of the values in the current layout, in write() argument order
+        self._included = []
+        self._views = [[], []]
+
+    @property
+    def frame(self) -> int:
+        return int(self._header[_FRAME])
+
+    def write(self, time: float, names, values):
+        """Publish the values under their names as the next frame"""
+        arrays = [np.asarray(value) for value in values]
+        layout_key = tuple((name, array.dtype.str, array.shape) for name, array in zip(names, arrays))
+
+        # The layout is checked before the sequence goes odd, a layout that does not fit raises here
+        layout = self._plan_layout(layout_key) if layout_key != self._layout_key else None
+
+        header = self._header
+        sequence = int(header[_SEQUENCE])
+        header[_SEQUENCE] = sequence + 1
+        try:
+            if layout is not None:
+                self._write_layout(layout_key, *layout)
+
+            # === Fill the slot readers are not looking at ===
+            target = 1 - int(header[_ACTIVE])
+            for view, position in zip(self._views[target], self._included):
+                np.copyto(view, arrays[position], casting="no")
+
+            header[_ACTIVE] = target
+            header[_FRAME] += 1
+            self._time[0] = time
+        finally:
+            # Even again whatever happened, an odd sequence left behind would invert the parity of every next frame
+            header[_SEQUENCE] = sequence + 2
+
+    def close(self):
+        """Tell the readers the stream ended and remove the segment"""
+        if self._segment is None:
+            return
+        self._header[_CLOSED] = 1
+        self._views = [[], []]
+        self._header = self._time = None
+        _close(self._segment)
+        try:
+            self._segment.unlink()
+        except FileNotFoundError:
+            pass
+        self._segment = None
+        _OWNED_NAMES.discard(self.name)
+
+    def _plan_layout(self, layout_key):
+        """Returns the (entries, included positions, dropped values, encoded layout) of the values"""
+        entries = []
+        included = []
+        dropped = []
+        offset = 0
+        for position, (name, dtype, shape) in enumerate(layout_key):
+            dtype = np.dtype(dtype)
+            if dtype.kind not in "biuf":
+                dropped.append((name, f"values of type {dtype} are not numeric"))
+                continue
+            nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+            if offset + nbytes > self.slot_bytes:
+                dropped.append((name, f"{nbytes} bytes do not fit in the {self.slot_bytes} bytes of a frame"))
+                continue
+            entries.append({"name": name, "dtype": dtype.str, "shape": list(shape), "offset": offset})
+            included.append(position)
+            offset = _align(offset + nbytes)
+
+        layout = json.dumps(entries).encode()
+        if len(layout) > LAYOUT_BYTES:
+            raise ValueError(f"The layout of {len(entries)} values does not fit in {LAYOUT_BYTES} bytes")
+        return entries, included, dropped, layout
+
+    def _write_layout(self, layout_key, entries, included, dropped, layout):
+        self.dropped = dropped
+        self._included = included
+        self._segment.buf[HEADER_BYTES:HEADER_BYTES + len(layout)] = layout
+        self._header[_LAYOUT_LENGTH] = len(layout)
+        self._header[_GENERATION] += 1
+        self._views = _slot_views(self._segment.buf, self.slot_bytes, entries)
+        self._layout_key = layout_key
+
+
+class Frame:
+    """One published frame, values are read-only views on the segment by name"""
+
+    __slots__ = ("frame", "time", "values", "_reader", "_sequence")
+
+    def __init__(self, reader, sequence, frame, time, values):
+        self.frame = frame
+        self.time = time
+        self.values = values
+        self._reader = reader
+        self._sequence = sequence
+
+    def is_valid(self) -> bool:
+        """True while the writer has not started overwriting the slot, check it after using the views"""
+        return self._reader.sequence <= self._sequence + 2
+
+    def copy(self):
+        """Frame holding copies of the values, independent from the segment"""
+        return Frame(None, None, self.frame, self.time, {name: np.array(value) for name, value in self.values.items()})
+
+
+class SharedMemoryReader:
+    """Reader of a segment published by a SharedMemoryWriter, possibly in another process"""
+
+    __slots__ = ("name", "_segment", "_header", "_time", "_generation", "_views")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._segment = _attach(name)
+        self._header, self._time = _header_views(self._segment.buf)
+        if int(self._header[_MAGIC]) != SEGMENT_MAGIC:
+            self.close()
+            raise ValueError(f"{name} is not a More Nodes shared memory segment")
+        self._generation = None
+        self._views = None
+
+    @property
+    def sequence(self) -> int:
+        return int(self._header[_SEQUENCE])
+
+    @property
+    def closed(self) -> bool:
+        """True once the writer ended the stream"""
+        return self._header is None or bool(self._header[_CLOSED])
+
+    def read(self, retries: int = 1000):
+        """Last published frame as views on the segment, None if nothing was published yet"""
+        header = self._header
+        for _ in range(retries):
+            sequence = int(header[_SEQUENCE])
+            if sequence & 1:
+                # A frame is being written, the header is not consistent yet
+                continue
+            if int(header[_GENERATION]) != self._generation and not self._load_layout(sequence):
+                continue
+            frame = int(header[_FRAME])
+            active = int(header[_ACTIVE])
+            time = float(self._time[0])
+            if int(header[_SEQUENCE]) != sequence:
+                continue
+            if frame == 0:
+                return None
+            return Frame(self, sequence, frame, time, self._views[active])
+        return None
+
+    def read_copy(self, retries: int = 1000):
+        """Last published frame with copies of the values, retried until the copies are consistent"""
+        for _ in range(retries):
+            frame = self.read(retries)
+            if frame is None:
+                return None
+            copied = frame.copy()
+            if frame.is_valid():
+                return copied
+        return None
+
+    def wait(self, after_frame: int = 0, timeout: float = None, interval: float = 0.0):
+        """Poll until a frame newer than after_frame is published, None on timeout or once the stream ended"""
+        deadline = None if timeout is None else _time.monotonic() + timeout
+        while True:
+            frame = self.read()
+            if frame is not None and frame.frame > after_frame:
+                return frame
+            if self.closed or (deadline is not None and _time.monotonic() > deadline):
+                return None
+            _time.sleep(interval)
+
+    def close(self):
+        self._views = None
+        self._header = self._time = None
+        if self._segment is not None:
+            _close(self._segment)
+            self._segment = None
+
+    def _load_layout(self, sequence) -> bool:
+        header = self._header
+        generation = int(header[_GENERATION])
+        length = int(header[_LAYOUT_LENGTH])
+        layout = bytes(self._segment.buf[HEADER_BYTES:HEADER_BYTES + length])
+        if int(header[_SEQUENCE]) != sequence:
+            return False
+        entries = json.loads(layout) if length else []
+        slot_views = _slot_views(self._segment.buf, int(header[_SLOT_BYTES]), entries)
+        for views in slot_views:
+            for view in views:
+                view.flags.writeable = False
+        self._views = [
+            {entry["name"]: view for entry, view in zip(entries, views)}
+            for views in slot_views
+        ]
+        self._generation = generation
+        return True
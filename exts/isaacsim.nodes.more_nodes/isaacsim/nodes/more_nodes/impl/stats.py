@@ -0,0 +1,143 @@
+"""Constant-memory streaming statistics, updated element-wise for array signals"""
+
+import numpy as np
+
+# Number of markers of a P-square quantile estimator
+_MARKERS = 5
+
+
+class StreamingStats:
+    """
+    Running statistics of a scalar or array signal.
+    Mean and variance use Welford's update, and each quantile level is tracked with a P-square estimator
+    (Jain and Chlamtac), five markers per element. Memory is O(levels * elements) and every update costs the
+    same whatever the number of samples, reading the quantiles costs nothing.
+    """
+
+    def __init__(self, levels=(0.5, 0.9, 0.99), alpha: float = 0.1):
+        self.levels = np.clip(np.asarray(levels, dtype=np.float64).reshape(-1), 0.0, 1.0)
+        self.alpha = alpha
+        # Desired marker position increments of each level, shared by every element
+        self._increments = np.stack(
+            [np.zeros_like(self.levels), self.levels / 2.0, self.levels, (1.0 + self.levels) / 2.0,
+             np.ones_like(self.levels)]
+        )
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.mean = None
+        self._m2 = None
+        self.minimum = None
+        self.maximum = None
+        self.ewma = None
+        # Marker heights and positions, (markers, levels * elements), and the desired positions, (markers, levels)
+        self._heights = None
+        self._positions = None
+        self._desired = None
+
+    def update(self, value):
+        """Add one sample, an array sample updates every element at once"""
+        sample = np.asarray(value, dtype=np.float64).reshape(-1)
+        if self.mean is None or sample.shape != self.mean.shape:
+            # First sample, or the signal changed shape: start over
+            self.reset()
+            self.mean = np.zeros_like(sample)
+            self._m2 = np.zeros_like(sample)
+            self.minimum = sample.copy()
+            self.maximum = sample.copy()
+            self.ewma = sample.copy()
+            self._heights = np.empty((_MARKERS, len(self.levels) * sample.size), dtype=np.float64)
+
+        self.count += 1
+        delta = sample - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (sample - self.mean)
+        np.minimum(self.minimum, sample, out=self.minimum)
+        np.maximum(self.maximum, sample, out=self.maximum)
+        if self.count > 1:
+            self.ewma += self.alpha * (sample - self.ewma)
+
+        # === Quantile markers ===
+        if len(self.levels) == 0:
+            return
+        # The estimators of every level and element are laid out flat, level after level
+        sample = np.tile(sample, len(self.levels))
+        if self.count <= _MARKERS:
+            # The first samples become the markers
+            self._heights[self.count - 1] = sample
+            if self.count == _MARKERS:
+                self._heights.sort(axis=0)
+                # Marker positions are sample counts, exact in 32 bits up to 2**31 samples
+                self._positions = np.repeat(np.arange(_MARKERS, dtype=np.int32)[:, None], sample.size, axis=1)
+                # 0-based desired positions (0, 2p, 4p, 2 + 2p, 4) after the first five samples
+                self._desired = 4.0 * self._increments
+        else:
+            self._update_markers(sample)
+
+    def _update_markers(self, sample):
+        heights = self._heights
+        positions = self._positions
+
+        # === Cell of the sample, the extreme markers follow the min and max ===
+        np.minimum(heights[0], sample, out=heights[0])
+        np.maximum(heights[-1], sample, out=heights[-1])
+        cell = (sample >= heights[1]).astype(np.int8)
+        cell += sample >= heights[2]
+        cell += sample >= heights[3]
+        for marker in range(1, _MARKERS):
+            positions[marker] += cell < marker
+        self._desired += self._increments
+        levels = len(self.levels)
+
+        # === Move the middle markers that drifted away from their desired position ===
+        for marker in range(1, _MARKERS - 1):
+            # Positions are integers, compared per level with the bounds of the desired position
+            position = positions[marker].reshape(levels, -1)
+            up = (position <= np.floor(self._desired[marker] - 1.0).astype(np.int32)[:, None]).reshape(-1)
+            up &= positions[marker + 1] - positions[marker] > 1
+            down = (position >= np.ceil(self._desired[marker] + 1.0).astype(np.int32)[:, None]).reshape(-1)
+            down &= positions[marker - 1] - positions[marker] < -1
+            moved = np.flatnonzero(up | down)
+            if not len(moved):
+                continue
+
+            # Only the markers that move are gathered, typically a fraction of the elements
+            step = np.where(up[moved], 1.0, -1.0)
+            position = positions[marker, moved].astype(np.float64)
+            previous_gap = positions[marker - 1, moved] - position
+            next_gap = positions[marker + 1, moved] - position
+            height = heights[marker, moved]
+            previous_height = heights[marker - 1, moved]
+            next_height = heights[marker + 1, moved]
+
+            # Piecewise parabolic prediction, linear when it would leave the neighbouring markers
+            parabolic = height + step / (next_gap - previous_gap) * (
+                (step - previous_gap) * (next_height - height) / next_gap
+                + (next_gap - step) * (height - previous_height) / -previous_gap
+            )
+            linear = np.where(
+                step > 0.0,
+                height + (next_height - height) / next_gap,
+                height - (previous_height - height) / previous_gap
+            )
+            inside = (previous_height < parabolic) & (parabolic < next_height)
+            heights[marker, moved] = np.where(inside, parabolic, linear)
+            positions[marker, moved] += step.astype(np.int32)
+
+    @property
+    def variance(self):
+        if self.count < 2:
+            return np.zeros_like(self.mean)
+        return self._m2 / (self.count - 1)
+
+    @property
+    def std_dev(self):
+        return np.sqrt(self.variance)
+
+    def quantiles(self):
+        """Approximate quantiles, one row of elements per level"""
+        elements = self.mean.size
+        if self.count < _MARKERS:
+            return np.quantile(self._heights[:self.count, :elements], self.levels, axis=0)
+        return self._heights[_MARKERS // 2].reshape(len(self.levels), elements)
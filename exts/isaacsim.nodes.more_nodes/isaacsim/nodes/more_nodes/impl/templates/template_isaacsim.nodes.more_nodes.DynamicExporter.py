@@ -9,9 +9,10 @@
 from pathlib import Path
 
 import omni.graph.core as og
-import omni.ui as ui
-from omni.kit.property.usd.custom_layout_helper import CustomLayoutFrame, CustomLayoutGroup, CustomLayoutProperty
-from omni.kit.window.property.templates import HORIZONTAL_SPACING
+
+# omni.ui and the property widget modules are imported by the methods that draw,
+# so loading the template does not pull them in before the panel is shown
+from isaacsim.nodes.more_nodes.impl.extension import get_topology_editor
 
 
 class CustomLayout: 
@@ -19,78 +20,160 @@ class CustomLayout:
         self.enable = True
         self.compute_node_widget = compute_node_widget
         self.controller = og.Controller()
+        self.editor = get_topology_editor()
         self.add_button = None
         self.remove_button = None
         self.node_prim_path = self.compute_node_widget._payload[-1]
         self.node = self.controller.node(self.node_prim_path)
 
+        # Suffixes of the "outputs:output{num}" attributes in increasing order, scanned once
+        # then updated by the add and remove actions, including outputs still waiting for the topology editor
+        self.output_suffixes = self._retrieve_existing_outputs()
+
+        # Number of outputs added or removed per click, created with the controls
+        self.count_model = None
+
+        # Frame holding the property widget of each output by suffix, and the stack receiving the outputs
+        # added after the window was built
+        self.output_rows = {}
+        self.added_stack = None
+
     def _retrieve_existing_outputs(self):
-        # Retrieve all existing attributes of the form "outputs:output{num}"
-        # Also find the largest suffix among all such attributes
-        # Returned largest suffix = -1 if there are no such attributes
-        output_attribs = [attrib for attrib in self.node.get_attributes() if attrib.get_name()[:14] == "outputs:output"]
-        largest_suffix = -1
-        for attrib in output_attribs:
-            largest_suffix = max(largest_suffix, int(attrib.get_name()[14:]))
-        return (output_attribs, largest_suffix)
+        # Retrieve the suffixes of all existing attributes of the form "outputs:output{num}"
+        return sorted(int(name[14:]) for name in self.editor.attribute_names(self.node, "outputs:output"))
+
+    @property
+    def largest_suffix(self):
+        # -1 if there are no such attributes
+        return self.output_suffixes[-1] if self.output_suffixes else -1
+
+    def _click_count(self):
+        return max(1, self.count_model.as_int) if self.count_model is not None else 1
 
     def _on_click_add(self):
-        (_, largest_suffix) = self._retrieve_existing_outputs()
-        self.controller.create_attribute(
-            self.node,
-            f"outputs:output{largest_suffix+1}",
-            og.Type(og.BaseDataType.UINT, 1, 0, og.AttributeRole.EXECUTION),
-            og.AttributePortType.ATTRIBUTE_PORT_TYPE_OUTPUT,
-        )
-        self.compute_node_widget.rebuild_window()
-        self.remove_button.enabled = True
+        for _ in range(self._click_count()):
+            suffix = self.largest_suffix + 1
+            self.output_suffixes.append(suffix)
+            # The row is drawn once the topology editor has created the attribute
+            self.editor.add_attribute(
+                self.node,
+                f"outputs:output{suffix}",
+                og.Type(og.BaseDataType.UINT, 1, 0, og.AttributeRole.EXECUTION),
+                og.AttributePortType.ATTRIBUTE_PORT_TYPE_OUTPUT,
+                on_created=lambda attr, suffix=suffix: self._add_row(suffix, attr),
+            )
+        self.remove_button.enabled = len(self.output_suffixes) > 1
 
     def _on_click_remove(self):
-        (output_attribs, largest_suffix) = self._retrieve_existing_outputs()
-        if not output_attribs:
+        # Keep at least one output
+        for _ in range(min(self._click_count(), len(self.output_suffixes) - 1)):
+            suffix = self.output_suffixes.pop()
+            self.editor.remove_attribute(self.node, f"outputs:output{suffix}")
+            self._remove_row(suffix)
+        self.remove_button.enabled = len(self.output_suffixes) > 1
+
+    # === Output rows, updated one by one instead of rebuilding the window ===
+    def _build_row(self, suffix, build):
+        import omni.ui as ui
+
+        with ui.Frame(height=0) as row:
+            models = build()
+        self.output_rows[suffix] = row
+        return models
+
+    def _output_build_fn(self, stage, attr_name, metadata, property_type, prim_paths, *args):
+        # Same property widget as the default layout, inside a frame that can be hidden when the output is removed
+        from omni.kit.property.usd.usd_property_widget_builder import UsdPropertiesWidgetBuilder
+
+        return self._build_row(
+            int(attr_name[14:]),
+            lambda: UsdPropertiesWidgetBuilder.build(stage, attr_name, metadata, property_type, prim_paths, *args)
+        )
+
+    def _add_row(self, suffix, attr):
+        # Called when the attribute exists, skipped if the output was removed again or the window is not built
+        if self.added_stack is None or suffix not in self.output_suffixes or suffix in self.output_rows:
+            return
+        import omni.usd
+        from omni.kit.property.usd.usd_property_widget_builder import UsdPropertiesWidgetBuilder
+        from pxr import Sdf, Usd
+
+        stage = omni.usd.get_context().get_stage()
+        prop = stage.GetPropertyAtPath(f"{self.node_prim_path}.{attr.get_name()}") if stage else None
+        if not prop:
             return
-        attrib_to_remove = self.node.get_attribute(f"outputs:output{largest_suffix}")
-        self.controller.remove_attribute(attrib_to_remove)
-        self.compute_node_widget.rebuild_window()
-        self.remove_button.enabled = len(output_attribs) > 1
+        with self.added_stack:
+            self._build_row(
+                suffix,
+                lambda: UsdPropertiesWidgetBuilder.build(
+                    stage, prop.GetName(), prop.GetAllMetadata(), Usd.Attribute, [Sdf.Path(self.node_prim_path)]
+                )
+            )
+
+    def _remove_row(self, suffix):
+        row = self.output_rows.pop(suffix, None)
+        if row is not None:
+            row.clear()
+            row.visible = False
+
+    def _added_build_fn(self, *args):
+        import omni.ui as ui
+
+        self.added_stack = ui.VStack(height=0, spacing=4)
 
     def _controls_build_fn(self, *args):
-        (output_attribs, _) = self._retrieve_existing_outputs()
+        import omni.ui as ui
+        from omni.kit.window.property.templates import HORIZONTAL_SPACING
+
+        if self.count_model is None:
+            self.count_model = ui.SimpleIntModel(1)
         icons_path = Path(__file__).absolute().parent.parent.parent.parent.parent.parent.joinpath("icons")
 
         with ui.HStack(height=0, spacing=HORIZONTAL_SPACING):
             ui.Spacer()
+            ui.IntField(
+                model=self.count_model,
+                width=40,
+                height=22,
+                tooltip_fn=lambda: ui.Label("Number of Outputs to Add or Remove"),
+            )
             self.add_button = ui.Button(
                 image_url=f"{icons_path.joinpath('add.svg')}",
                 width=22,
                 height=22,
                 style={"Button": {"background_color": 0x1F2124}},
                 clicked_fn=self._on_click_add,
-                tooltip_fn=lambda: ui.Label("Add New Output"),
+                tooltip_fn=lambda: ui.Label("Add New Outputs"),
             )
             self.remove_button = ui.Button(
                 image_url=f"{icons_path.joinpath('remove.svg')}",
                 width=22,
                 height=22,
                 style={"Button": {"background_color": 0x1F2124}},
-                enabled=(len(output_attribs) > 1),
+                enabled=(len(self.output_suffixes) > 1),
                 clicked_fn=self._on_click_remove,
-                tooltip_fn=lambda: ui.Label("Remove Output"),
+                tooltip_fn=lambda: ui.Label("Remove Outputs"),
             )
 
     def apply(self, props):
         # Called by compute_node_widget to apply UI when selection changes
+        from omni.kit.property.usd.custom_layout_helper import CustomLayoutFrame, CustomLayoutGroup, CustomLayoutProperty
+
         def find_prop(name):
             return next((p for p in props if p.prop_name == name), None)
 
+        # The outputs are drawn from the cached list, the attributes are not scanned again
+        self.output_rows = {}
         frame = CustomLayoutFrame(hide_extra=True)
-        (output_attribs, _) = self._retrieve_existing_outputs()
         with frame:
             with CustomLayoutGroup("Outputs"):
-                for attrib in output_attribs:
-                    prop = find_prop(attrib.get_name())
-                    CustomLayoutProperty(prop.prop_name)
+                for suffix in self.output_suffixes:
+                    prop = find_prop(f"outputs:output{suffix}")
+                    # Outputs still waiting for the topology editor are drawn in the added stack once created
+                    if prop is not None:
+                        CustomLayoutProperty(prop.prop_name, build_fn=self._output_build_fn)
 
+                CustomLayoutProperty(None, None, build_fn=self._added_build_fn)
                 CustomLayoutProperty(None, None, build_fn=self._controls_build_fn)
 
         return frame.apply(props)
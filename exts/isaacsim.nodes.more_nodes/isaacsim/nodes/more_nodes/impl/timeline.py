@@ -0,0 +1,18 @@
+"""Timeline interface shared by every node instance, fetched on first use"""
+
+_timeline = None
+
+
+def get_timeline():
+    """Timeline interface of the running application, looked up once per process"""
+    global _timeline
+    if _timeline is None:
+        import omni.timeline
+
+        _timeline = omni.timeline.get_timeline_interface()
+    return _timeline
+
+
+def get_current_time() -> float:
+    """Current time of the timeline"""
+    return get_timeline().get_current_time()
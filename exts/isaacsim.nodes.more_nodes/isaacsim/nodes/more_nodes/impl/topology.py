@@ -0,0 +1,199 @@
+"""Deferred creation and removal of dynamic attributes, committed in one pass at the end of the frame"""
+
+import omni.graph.core as og
+import carb
+
+from . import diagnostics
+
+
+class _Edit:
+    """Pending edit of one attribute: an optional removal followed by an optional creation"""
+
+    __slots__ = ("remove", "create", "on_created")
+
+    def __init__(self, remove=False, create=None, on_created=None):
+        self.remove = remove
+        # (attr_type, attr_port, attr_extended_type) of the attribute to create, None for a plain removal
+        self.create = create
+        self.on_created = on_created
+
+
+class TopologyEditor:
+    """
+    Queue of the dynamic attribute edits requested during a burst of callbacks, by node.
+    An attribute added then removed before the commit costs nothing, and adding an attribute that
+    already exists with the same type keeps it, even when its removal was pending.
+    When deferred is False, every request is committed right away.
+    """
+
+    def __init__(self, deferred: bool = False):
+        self.deferred = deferred
+        # Prim path -> (node, {attr_name: _Edit}), in request order
+        self._edits = {}
+        # Prim path -> callbacks run once the edits of the node are committed
+        self._on_committed = {}
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._edits) or bool(self._on_committed)
+
+    def add_attribute(
+        self,
+        node,
+        attr_name: str,
+        attr_type,
+        attr_port,
+        attr_extended_type=og.ExtendedAttributeType.REGULAR,
+        on_created=None
+    ):
+        """Request the creation of an attribute, on_created receives its handle once it exists"""
+        edits = self._node_edits(node)
+        edit = edits.get(attr_name)
+        if (edit is None or edit.remove) and node.get_attribute_exists(attr_name):
+            existing = node.get_attribute(attr_name)
+            if self._matches(existing, attr_type, attr_extended_type):
+                # === The attribute already exists, keep it even if it was about to be removed ===
+                edits.pop(attr_name, None)
+                self._drop_if_empty(node)
+                if on_created is not None:
+                    on_created(existing)
+                return
+            # === Replace the existing attribute of another type ===
+            edit = _Edit(remove=True)
+        edits[attr_name] = _Edit(
+            remove=edit is not None and edit.remove,
+            create=(attr_type, attr_port, attr_extended_type),
+            on_created=on_created
+        )
+        self._commit_if_immediate(node)
+
+    def remove_attribute(self, node, attr_name: str):
+        """Request the removal of an attribute, cancelling its pending creation if there is one"""
+        edits = self._node_edits(node)
+        edit = edits.get(attr_name)
+        if edit is not None and not edit.remove:
+            # === The attribute does not exist yet, forget it ===
+            del edits[attr_name]
+            self._drop_if_empty(node)
+            return
+        edits[attr_name] = _Edit(remove=True)
+        self._commit_if_immediate(node)
+
+    def keep_attribute(self, node, attr_name: str):
+        """Cancel the pending removal of an attribute, for instance because it just got connected"""
+        entry = self._edits.get(node.get_prim_path())
+        if entry is not None and entry[1].get(attr_name, _Edit()).remove:
+            del entry[1][attr_name]
+            self._drop_if_empty(node)
+
+    def attribute_names(self, node, prefix: str) -> list:
+        """Names of the attributes with the given prefix, as they will be after the commit"""
+        names = [attr.get_name() for attr in node.get_attributes() if attr.get_name().startswith(prefix)]
+        entry = self._edits.get(node.get_prim_path())
+        if entry is None:
+            return names
+        for attr_name, edit in entry[1].items():
+            if not attr_name.startswith(prefix):
+                continue
+            if edit.remove and attr_name in names:
+                names.remove(attr_name)
+            if edit.create is not None:
+                names.append(attr_name)
+        return names
+
+    def when_committed(self, node, callback):
+        """Run callback() once the pending edits of the node are committed, right away if there are none"""
+        if node.get_prim_path() not in self._edits:
+            callback()
+            return
+        callbacks = self._on_committed.setdefault(node.get_prim_path(), [])
+        if callback not in callbacks:
+            callbacks.append(callback)
+
+    def discard_node(self, node):
+        """Forget the pending edits of a node"""
+        self._edits.pop(node.get_prim_path(), None)
+        self._on_committed.pop(node.get_prim_path(), None)
+
+    def commit_node(self, node):
+        """Apply the pending edits of one node now"""
+        entry = self._edits.pop(node.get_prim_path(), None)
+        callbacks = self._on_committed.pop(node.get_prim_path(), [])
+        if entry is not None:
+            self._apply(*entry)
+        self._run_callbacks(callbacks)
+
+    def commit(self):
+        """Apply every pending edit, called once per frame"""
+        edits, self._edits = self._edits, {}
+        on_committed, self._on_committed = self._on_committed, {}
+        for node, node_edits in edits.values():
+            self._apply(node, node_edits)
+        for callbacks in on_committed.values():
+            self._run_callbacks(callbacks)
+
+    # === Internals ===
+    def _node_edits(self, node) -> dict:
+        entry = self._edits.get(node.get_prim_path())
+        if entry is None:
+            entry = self._edits[node.get_prim_path()] = (node, {})
+        return entry[1]
+
+    def _drop_if_empty(self, node):
+        entry = self._edits.get(node.get_prim_path())
+        if entry is not None and not entry[1]:
+            del self._edits[node.get_prim_path()]
+            self._run_callbacks(self._on_committed.pop(node.get_prim_path(), []))
+
+    def _commit_if_immediate(self, node):
+        if not self.deferred:
+            self.commit_node(node)
+
+    @staticmethod
+    def _matches(attr, attr_type, attr_extended_type) -> bool:
+        if attr_extended_type != og.ExtendedAttributeType.REGULAR:
+            return attr.get_extended_type() == attr_extended_type
+        return attr.get_resolved_type() == attr_type
+
+    @staticmethod
+    def _apply(node, edits):
+        if not node.is_valid():
+            return
+
+        # === Removals first, so that a replaced attribute can be created again ===
+        for attr_name, edit in edits.items():
+            if edit.remove and node.get_attribute_exists(attr_name):
+                try:
+                    node.remove_attribute(attr_name)
+                    if diagnostics.enabled:
+                        diagnostics.count_attribute_edit(node, created=False)
+                except Exception as e:
+                    carb.log_error(f"Error removing {attr_name}: {e}")
+
+        controller = og.Controller()
+        for attr_name, edit in edits.items():
+            if edit.create is None:
+                continue
+            attr_type, attr_port, attr_extended_type = edit.create
+            try:
+                controller.create_attribute(
+                    node,
+                    attr_name=attr_name,
+                    attr_type=attr_type,
+                    attr_port=attr_port,
+                    attr_extended_type=attr_extended_type
+                )
+                if diagnostics.enabled:
+                    diagnostics.count_attribute_edit(node, created=True)
+                if edit.on_created is not None:
+                    edit.on_created(node.get_attribute(attr_name))
+            except Exception as e:
+                carb.log_error(f"Error creating {attr_name}: {e}")
+
+    @staticmethod
+    def _run_callbacks(callbacks):
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                carb.log_error(f"Error after committing attribute edits: {e}")
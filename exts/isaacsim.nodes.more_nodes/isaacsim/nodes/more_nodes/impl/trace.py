@@ -0,0 +1,313 @@
+"""
+Columnar, chunked, append-only trace files for recorded attribute values.
+
+A trace is a directory holding a manifest.json and one sub-directory per chunk.
+Every chunk stores a time.npy column plus one .npy file per recorded attribute:
+  - fixed-shape values (scalars, tuples, matrices) as a (rows, *shape) array
+  - arrays, token arrays included, as the concatenated elements plus a <name>.offsets.npy row index
+  - tokens and strings as a unicode array
+All files are plain .npy files so they can be memory-mapped when read back.
+"""
+
+import bisect
+import json
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import carb
+import numpy as np
+
+TRACE_FORMAT = "isaacsim.nodes.more_nodes.trace"
+TRACE_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+KIND_FIXED = "fixed"
+KIND_RAGGED = "ragged"
+KIND_TEXT = "text"
+
+# Number of memory-mapped chunk files kept open by a reader
+_MAPPED_FILES_LIMIT = 64
+
+_TEXT_BASE_TYPES = ("token", "string", "path")
+
+# Every writer that has not been closed yet, so they can be closed on extension shutdown
+_LIVE_WRITERS = weakref.WeakSet()
+
+
+def column_kind(ogn_type: str) -> str:
+    """Select how a column with the given OGN type name is stored"""
+    if ogn_type.endswith("[]"):
+        return KIND_RAGGED
+    if ogn_type.startswith(_TEXT_BASE_TYPES):
+        return KIND_TEXT
+    return KIND_FIXED
+
+
+def _is_text(ogn_type: str) -> bool:
+    return ogn_type.startswith(_TEXT_BASE_TYPES)
+
+
+class _ChunkBuilder:
+    """Column buffers of the chunk currently being filled"""
+
+    def __init__(self, schema, first_values, capacity):
+        self.schema = schema
+        self.rows = 0
+        self.times = np.empty(capacity, dtype=np.float64)
+        self.columns = {}
+        for (column, ogn_type), value in zip(schema, first_values):
+            kind = column_kind(ogn_type)
+            if kind == KIND_FIXED:
+                value = np.asarray(value)
+                self.columns[column] = np.empty((capacity,) + value.shape, dtype=value.dtype)
+            else:
+                self.columns[column] = []
+
+    def accepts(self, schema, values) -> bool:
+        """Check that a row fits the column layout of this chunk"""
+        if schema != self.schema or self.rows == len(self.times):
+            return False
+        for (column, ogn_type), value in zip(schema, values):
+            buffer = self.columns[column]
+            if isinstance(buffer, np.ndarray):
+                value = np.asarray(value)
+                if value.shape != buffer.shape[1:] or value.dtype != buffer.dtype:
+                    return False
+        return True
+
+    def append(self, time, values):
+        row = self.rows
+        self.times[row] = time
+        for (column, ogn_type), value in zip(self.schema, values):
+            buffer = self.columns[column]
+            if isinstance(buffer, np.ndarray):
+                buffer[row] = value
+            elif column_kind(ogn_type) == KIND_TEXT:
+                buffer.append(value)
+            elif _is_text(ogn_type):
+                # Tokens of every row end up in one unicode array, whatever their length
+                buffer.append(np.array(value, dtype=np.str_))
+            else:
+                # Copy, the value may be a view on a buffer that changes next tick
+                buffer.append(np.array(value))
+        self.rows += 1
+
+
+def _write_chunk(directory, name, builder):
+    """Write the columns of a full chunk under its name, returns its manifest entry"""
+    chunk_dir = os.path.join(directory, name)
+    os.makedirs(chunk_dir, exist_ok=True)
+    rows = builder.rows
+    times = builder.times[:rows]
+    np.save(os.path.join(chunk_dir, "time.npy"), times)
+
+    columns = {}
+    for column, ogn_type in builder.schema:
+        kind = column_kind(ogn_type)
+        buffer = builder.columns[column]
+        if kind == KIND_FIXED:
+            np.save(os.path.join(chunk_dir, f"{column}.npy"), buffer[:rows])
+        elif kind == KIND_TEXT:
+            np.save(os.path.join(chunk_dir, f"{column}.npy"), np.array(buffer, dtype=np.str_))
+        else:
+            offsets = np.zeros(rows + 1, dtype=np.int64)
+            np.cumsum([len(value) for value in buffer], out=offsets[1:])
+            np.save(os.path.join(chunk_dir, f"{column}.npy"), np.concatenate(buffer) if buffer else np.empty(0))
+            np.save(os.path.join(chunk_dir, f"{column}.offsets.npy"), offsets)
+        columns[column] = {"ogn_type": ogn_type, "kind": kind}
+
+    return {
+        "name": name,
+        "rows": rows,
+        "start_time": float(times[0]),
+        "end_time": float(times[-1]),
+        "columns": columns,
+    }
+
+
+def _existing_chunks(path: str) -> list:
+    """Manifest entries of the trace in a directory, refusing a non-empty directory that holds no trace"""
+    manifest_path = os.path.join(path, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        if os.listdir(path):
+            raise ValueError(f"{path} is not empty and holds no More Nodes trace manifest")
+        return []
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != TRACE_FORMAT:
+        raise ValueError(f"{path} is not a More Nodes trace")
+    chunks = manifest["chunks"]
+    # New chunks are numbered after these, a chunk left out of the manifest by a writer that did not
+    # finish is overwritten
+    names = {entry["name"] for entry in chunks}
+    if any(f"chunk_{index:06d}" not in names for index in range(len(chunks))):
+        raise ValueError(f"The chunks of the trace in {path} are not numbered in sequence")
+    return chunks
+
+
+class TraceWriter:
+    """
+    Appends one row per tick to a trace directory, after the chunks already recorded there.
+    Full chunks are written by a background thread, the caller only fills preallocated buffers.
+    """
+
+    def __init__(self, path: str, chunk_rows: int = 1024):
+        self.path = path
+        self.chunk_rows = max(1, chunk_rows)
+        os.makedirs(path, exist_ok=True)
+
+        # === Append to the trace already recorded there ===
+        self._chunks = _existing_chunks(path)
+        self._current = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MoreNodesTrace")
+        self._closed = False
+        _LIVE_WRITERS.add(self)
+
+    def append(self, time: float, columns):
+        """
+        Append a row.
+        columns is a list of (column name, OGN type name, value) for every recorded attribute.
+        """
+        schema = tuple((column, ogn_type) for column, ogn_type, _ in columns)
+        values = [value for _, _, value in columns]
+
+        if self._current is None or not self._current.accepts(schema, values):
+            self._seal()
+            self._current = _ChunkBuilder(schema, values, self.chunk_rows)
+        self._current.append(time, values)
+
+    def close(self):
+        """Write the partial chunk and wait for every pending chunk"""
+        if self._closed:
+            return
+        self._seal()
+        self._executor.shutdown(wait=True)
+        self._closed = True
+        _LIVE_WRITERS.discard(self)
+
+    def _seal(self):
+        """Hand the current chunk over to the background writer"""
+        builder = self._current
+        self._current = None
+        if builder is None or builder.rows == 0:
+            return
+        self._executor.submit(self._write, builder)
+
+    def _write(self, builder):
+        # Numbered once written, a chunk that failed leaves no gap and its number is reused by the next one
+        name = f"chunk_{len(self._chunks):06d}"
+        try:
+            entry = _write_chunk(self.path, name, builder)
+        except Exception as e:
+            carb.log_error(f"Error writing trace chunk {name}, its {builder.rows} rows are lost: {e}")
+            return
+        with self._lock:
+            self._chunks.append(entry)
+            manifest = {"format": TRACE_FORMAT, "version": TRACE_VERSION, "chunks": list(self._chunks)}
+        # Replace atomically so readers never see a partial manifest
+        temporary = os.path.join(self.path, MANIFEST_NAME + ".tmp")
+        try:
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            os.replace(temporary, os.path.join(self.path, MANIFEST_NAME))
+        except Exception as e:
+            # The chunk is listed again by the next manifest written
+            carb.log_error(f"Error writing the trace manifest after chunk {name}: {e}")
+
+
+class TraceReader:
+    """
+    Reads a trace directory, memory-mapping chunk columns on first access.
+    Recorded times are expected to be non-decreasing, as written by a running timeline.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, MANIFEST_NAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != TRACE_FORMAT:
+            raise ValueError(f"{path} is not a More Nodes trace")
+        self.chunks = manifest["chunks"]
+        self._start_times = [chunk["start_time"] for chunk in self.chunks]
+        self._mapped = OrderedDict()
+
+    @property
+    def columns(self):
+        """OGN type name of every column present in the trace"""
+        columns = {}
+        for chunk in self.chunks:
+            for column, info in chunk["columns"].items():
+                columns.setdefault(column, info["ogn_type"])
+        return columns
+
+    def __len__(self):
+        return sum(chunk["rows"] for chunk in self.chunks)
+
+    def _load(self, chunk_index, file_name):
+        key = (chunk_index, file_name)
+        array = self._mapped.get(key)
+        if array is None:
+            chunk_dir = os.path.join(self.path, self.chunks[chunk_index]["name"])
+            array = np.load(os.path.join(chunk_dir, file_name), mmap_mode="r")
+            self._mapped[key] = array
+            if len(self._mapped) > _MAPPED_FILES_LIMIT:
+                self._mapped.popitem(last=False)
+        else:
+            self._mapped.move_to_end(key)
+        return array
+
+    @property
+    def start_time(self):
+        return self._start_times[0] if self.chunks else None
+
+    @property
+    def end_time(self):
+        return self.chunks[-1]["end_time"] if self.chunks else None
+
+    def locate(self, time: float):
+        """
+        Chunk index and row of the last sample recorded at or before time, None before the first sample.
+        Bisects the chunk start times from the manifest, then the memory-mapped time column of one chunk.
+        """
+        chunk_index = bisect.bisect_right(self._start_times, time) - 1
+        if chunk_index < 0:
+            return None
+        row = int(np.searchsorted(self.times(chunk_index), time, side="right")) - 1
+        return chunk_index, row
+
+    def sample_at(self, time: float):
+        """Value of every column recorded in the sample at or before time, as views on the mapped files"""
+        location = self.locate(time)
+        if location is None:
+            return {}
+        chunk_index, row = location
+        return {
+            column: self.value(chunk_index, row, column)
+            for column in self.chunks[chunk_index]["columns"]
+        }
+
+    def times(self, chunk_index):
+        """Memory-mapped time column of a chunk"""
+        return self._load(chunk_index, "time.npy")
+
+    def value(self, chunk_index, row, column):
+        """Value of a column at a row of a chunk, None if the column was not recorded there"""
+        info = self.chunks[chunk_index]["columns"].get(column)
+        if info is None:
+            return None
+        data = self._load(chunk_index, f"{column}.npy")
+        if info["kind"] == KIND_RAGGED:
+            offsets = self._load(chunk_index, f"{column}.offsets.npy")
+            values = data[offsets[row]:offsets[row + 1]]
+            return values.tolist() if _is_text(info["ogn_type"]) else values
+        return data[row]
+
+
+def close_all_traces():
+    """Close every trace writer still open"""
+    for writer in list(_LIVE_WRITERS):
+        writer.close()
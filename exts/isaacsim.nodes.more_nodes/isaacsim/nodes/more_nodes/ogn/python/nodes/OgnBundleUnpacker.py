@@ -0,0 +1,111 @@
+import numpy as np
+import omni.graph.core as og
+import carb
+
+from isaacsim.nodes.more_nodes.impl.extension import get_topology_editor
+
+
+class OgnBundleUnpackerInternalState:
+    """Convenience class for maintaining per-node state information"""
+
+    __slots__ = ("layout", "unpack_plan")
+
+    def __init__(self):
+        """Instantiate the per-node state information"""
+        # (names, types) of the bundle children the unpack plan was built for
+        self.layout = None
+
+        # List of (child, output_attr) pairs, None when it must be rebuilt
+        self.unpack_plan = None
+
+    def build_unpack_plan(self, node, bundle, layout):
+        """
+        Pair every bundle child with its output, queuing the creation of the missing outputs
+        and the removal of the outputs whose child is gone.
+        """
+        names, types = layout
+        editor = get_topology_editor()
+        wanted = set()
+        unpack_plan = self.unpack_plan = []
+        self.layout = layout
+
+        def pair(child, output_attr):
+            # The output may exist after the layout changed again
+            if self.unpack_plan is unpack_plan:
+                unpack_plan.append((child, output_attr))
+
+        for name, child_type in zip(names, types):
+            attr_name = f"outputs:{name}"
+            wanted.add(attr_name)
+            child = bundle.attribute_by_name(name)
+            # Existing outputs of the same type are paired right away, the others once they are created
+            editor.add_attribute(
+                node,
+                attr_name,
+                child_type,
+                og.AttributePortType.ATTRIBUTE_PORT_TYPE_OUTPUT,
+                on_created=lambda output_attr, child=child: pair(child, output_attr)
+            )
+
+        for output_attr in node.get_attributes():
+            attr_name = output_attr.get_name()
+            if (
+                output_attr.is_dynamic()
+                and attr_name.startswith("outputs:")
+                and attr_name not in wanted
+            ):
+                editor.remove_attribute(node, attr_name)
+
+        return unpack_plan
+
+
+class OgnBundleUnpacker:
+    """
+    The Ogn node class that unpacks a bundle onto its outputs.
+    """
+
+    @staticmethod
+    def internal_state():
+        """Returns an object that contains per-node state information"""
+        return OgnBundleUnpackerInternalState()
+
+    @staticmethod
+    def release(node):
+        """
+        Release the node
+        """
+        try:
+            get_topology_editor().discard_node(node)
+        except Exception as e:
+            carb.log_error(f"Error releasing OgnBundleUnpacker: {e}")
+            raise
+
+    @staticmethod
+    def compute(db) -> bool:
+        try:
+            state = db.per_instance_state
+            bundle = db.inputs.bundle
+            if not bundle.valid:
+                return False
+
+            # === Child handles are looked up again only when the bundle layout changes ===
+            layout = (bundle.attribute_names, bundle.attribute_types)
+            unpack_plan = state.unpack_plan
+            if unpack_plan is None or layout != state.layout:
+                unpack_plan = state.build_unpack_plan(db.abi_node, bundle, layout)
+
+            for child, output_attr in unpack_plan:
+                value = child.value
+                if isinstance(value, np.ndarray) and output_attr.get_resolved_type().array_depth:
+                    # Reserving the same element count keeps the output buffer allocated across ticks
+                    target = output_attr.get_attribute_data().get(reserved_element_count=value.shape[0])
+                    np.copyto(target, value)
+                else:
+                    output_attr.set(value)
+
+            db.outputs.execOut = og.ExecutionAttributeState.ENABLED
+            return True
+
+        except Exception as e:
+            carb.log_error(f"Error in BundleUnpacker compute: {e}")
+            return False
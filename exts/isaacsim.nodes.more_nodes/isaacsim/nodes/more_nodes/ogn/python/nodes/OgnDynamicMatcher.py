@@ -12,16 +12,149 @@ Collection of OmniGraph tutorials:
   https://docs.omniverse.nvidia.com/kit/docs/omni.graph.tutorials/latest/Overview.html
 """
 
+import time
+
+import numpy as np
 import omni.graph.core as og
 import carb
 
+from isaacsim.nodes.more_nodes.impl import profiling
+from isaacsim.nodes.more_nodes.impl.change_detection import UNSET, fingerprint, has_changed
+from isaacsim.nodes.more_nodes.impl.dynamic_inputs import (
+    DynamicInputIndex,
+    connect_dynamic_input,
+    create_dynamic_input,
+    create_paired_output,
+    ensure_free_input,
+    remove_extra_inputs,
+    remove_free_input,
+    resolve_from_upstream,
+)
+from isaacsim.nodes.more_nodes.impl.extension import get_topology_editor
+from isaacsim.nodes.more_nodes.ogn.OgnDynamicMatcherDatabase import OgnDynamicMatcherDatabase
+
+_NODE_TYPE_NAME = "isaacsim.nodes.more_nodes.DynamicMatcher"
+_OUTPUT_PREFIX = "outputs:data"
+
+# Base types written into the stacked output, converted to double
+_STACKABLE_TYPES = frozenset((
+    og.BaseDataType.UCHAR,
+    og.BaseDataType.INT,
+    og.BaseDataType.UINT,
+    og.BaseDataType.INT64,
+    og.BaseDataType.UINT64,
+    og.BaseDataType.HALF,
+    og.BaseDataType.FLOAT,
+    og.BaseDataType.DOUBLE,
+))
+
+
+class OgnDynamicMatcherInternalState:
+    """Convenience class for maintaining per-node state information"""
+
+    __slots__ = (
+        "data_inputs",
+        "data_outputs",
+        "copy_plan",
+        "bundle_children",
+        "stackable",
+        "stack_indices",
+        "stack_offsets",
+        "stack_output",
+        "bytes_copied",
+        "bytes_copied_total",
+        "fingerprints",
+        "copies_skipped",
+        "copies_skipped_total",
+        "profile",
+    )
+
+    def __init__(self):
+        """Instantiate the per-node state information"""
+        # Index of the inputs:dataN attributes, updated by the connection callbacks
+        self.data_inputs = DynamicInputIndex("inputs:data")
+
+        # (output_attr, same_type) paired with each connected input, by suffix, set once the output exists
+        self.data_outputs = {}
+
+        # List of (input_attr, output_attr, same_type) entries, None when it must be rebuilt
+        self.copy_plan = None
+
+        # Child attribute of the packed output bundle for each copy plan entry, None when it must be rebuilt
+        self.bundle_children = None
+
+        # Whether each copy plan entry is of a numeric type, and the positions of those entries
+        self.stackable = []
+        self.stack_indices = []
 
-# class OgnDynamicMatcherInternalState:
-#     """Convenience class for maintaining per-node state information"""
+        # Start of each stacked entry in the stacked output then the total, None when the layout must be written again
+        self.stack_offsets = None
+        # Handle of outputs:stacked, looked up by the first stacked compute and dropped once stacking is turned off
+        self.stack_output = None
+
+        # Array bytes copied during the last compute and since the node was created
+        self.bytes_copied = 0
+        self.bytes_copied_total = 0
+
+        # Fingerprint of the last copied value of each copy plan entry
+        self.fingerprints = []
+
+        # Pairs left untouched during the last compute and since the node was created
+        self.copies_skipped = 0
+        self.copies_skipped_total = 0
+
+        # Compute statistics, only created while profiling is enabled
+        self.profile = None
+
+    def invalidate(self):
+        """Drop the copy plan so it is rebuilt on the next compute"""
+        self.copy_plan = None
+        self.bundle_children = None
+        self.stack_offsets = None
+
+    def pair_output(self, suffix, output_attr):
+        """Register the output of a connected input once it exists, the types were resolved at connect time"""
+        input_attr = self.data_inputs.get(suffix)
+        if input_attr is None:
+            return
+        self.data_outputs[suffix] = (output_attr, input_attr.get_resolved_type() == output_attr.get_resolved_type())
+        self.invalidate()
+
+    def build_copy_plan(self):
+        """Pair every connected inputs:dataN with its outputs:dataN, ordered by suffix"""
+        data_outputs = self.data_outputs
+        self.copy_plan = [
+            (input_attr, *data_outputs[suffix])
+            for suffix, input_attr in zip(self.data_inputs.connected_suffixes, self.data_inputs.connected_attributes)
+            if suffix in data_outputs
+        ]
+        self.reset_fingerprints()
+        self.stackable = [
+            OgnDynamicMatcherInternalState.is_stackable(input_attr.get_resolved_type())
+            for input_attr, _, _ in self.copy_plan
+        ]
+        self.stack_indices = [index for index, stackable in enumerate(self.stackable) if stackable]
+        return self.copy_plan
+
+    def reset_fingerprints(self):
+        """Forget the last copied values, every entry is written again by the next compute"""
+        self.fingerprints = [UNSET] * len(self.copy_plan) if self.copy_plan is not None else []
+
+    @staticmethod
+    def is_stackable(attr_type) -> bool:
+        """True for numeric scalars, tuples, matrices and arrays of them"""
+        return attr_type.base_type in _STACKABLE_TYPES and attr_type.array_depth <= 1
 
-#     def __init__(self):
-#         """Instantiate the per-node state information"""
-#         status = False
+    def build_bundle_children(self, bundle):
+        """Lay out one child per copy plan entry in the output bundle, named like the input without its port"""
+        bundle.clear()
+        self.bundle_children = [
+            bundle.insert((input_attr.get_resolved_type(), input_attr.get_name()[len("inputs:"):]))
+            for input_attr, _, _ in self.copy_plan
+        ]
+        # The new children hold default values, every entry is written again
+        self.reset_fingerprints()
+        return self.bundle_children
 
 
 class OgnDynamicMatcher:
@@ -29,89 +162,318 @@ class OgnDynamicMatcher:
     Node that processes dynamic inputs and passes data to outputs
     """
 
+    @staticmethod
+    def internal_state():
+        """Returns an object that contains per-node state information"""
+        return OgnDynamicMatcherInternalState()
+
     @staticmethod
     def compute(db) -> bool:
         """
-        Main computation function that processes dynamic inputs
+        Main computation function that copies each dynamic input to its output
         """
+        profile_start = time.perf_counter_ns() if profiling.enabled else 0
         try:
-            # Process dynamic inputs using the pattern dataX
+            state = db.per_instance_state
+
+            # === Pair the attributes only when the topology changed ===
+            copy_plan = state.copy_plan
+            if copy_plan is None:
+                copy_plan = state.build_copy_plan()
+
+            passthrough = db.inputs.passthrough
+            only_on_change = db.inputs.onlyOnChange
+
+            # === Bundle children are created once and reused until the topology changes ===
+            pack_bundle = db.inputs.packBundle
+            bundle_children = state.bundle_children
+            if pack_bundle:
+                bundle = db.outputs.bundle
+                if bundle_children is None or bundle.size != len(bundle_children):
+                    bundle_children = state.build_bundle_children(bundle)
+            elif bundle_children is not None:
+                db.outputs.bundle.clear()
+                state.bundle_children = None
+                # The outputs:dataN were not written while packing, refresh them
+                state.reset_fingerprints()
+
             processed_count = 0
-            
-            # Loop through potential dynamic inputs with pattern inputs:dataX
-            for i in range(100):  # Support up to 100 dynamic inputs
-                input_name = f"data{i}"
-                
-                # Check if this dynamic input exists
-                if hasattr(db.inputs, input_name):
-                    try:
-                        # Get the input value
-                        input_value = getattr(db.inputs, input_name)
-                        
-                        # Check if corresponding output exists
-                        output_name = f"data{i}"
-                        if hasattr(db.outputs, output_name):
-                            # Copy input to output
-                            setattr(db.outputs, output_name, input_value)
-                            processed_count += 1
-                            
-                    except Exception as e:
-                        carb.log_warn(f"Failed to process data{i}: {e}")
-                        continue
-                else:
-                    # If we hit a gap in numbering, we can stop
-                    if processed_count == 0 and i > 10:  # Allow some gaps early on
-                        break
-            
-            # Access dynamic attributes directly from the database
-            try:
-                dynamic_inputs = db.getDynamicInputs()
-                dynamic_outputs = db.getDynamicOutputs()
-                
-                # Process each dynamic input
-                for input_attr in dynamic_inputs:
-                    input_name = input_attr().name().getText()
-                    
-                    # Skip if not following our pattern
-                    if not input_name.startswith("inputs:data"):
-                        continue
-                    
-                    # Extract the suffix (e.g., "0" from "inputs:data0")
-                    suffix = input_name[12:]  # Remove "inputs:data"
-                    output_name = f"outputs:data{suffix}"
-                    
-                    # Find corresponding output
-                    for output_attr in dynamic_outputs:
-                        if output_attr().name().getText() == output_name:
-                            try:
-                                # Get input data and copy to output
-                                input_data = input_attr.get()
-                                output_attr.set(input_data)
-                                processed_count += 1
-                            except Exception as e:
-                                carb.log_warn(f"Failed to copy {input_name} to {output_name}: {e}")
-                            break
-                            
-            except Exception as e:
-                carb.log_info(f"Dynamic attribute processing not available: {e}")
-            
+            skipped_count = 0
+            bytes_copied = 0
+
+            # === Numeric inputs go one after the other into the stacked output ===
+            stack = db.inputs.stack and not pack_bundle
+            if stack:
+                processed_count, skipped_count, bytes_copied = OgnDynamicMatcher._stack(db, state, only_on_change)
+            else:
+                state.stack_offsets = None
+                if state.stack_output is not None:
+                    OgnDynamicMatcher._clear_stack(db, state)
+            stackable = state.stackable
+            # Read after the mode changes above, which may have reset them
+            fingerprints = state.fingerprints
+
+            for index, (input_attr, output_attr, same_type) in enumerate(copy_plan):
+                if stack and stackable[index]:
+                    continue
+                try:
+                    in_place = passthrough and same_type and not pack_bundle
+                    if in_place:
+                        # The attribute data of an input is a read-only view on the Fabric buffer
+                        value = input_attr.get_attribute_data().get()
+                    else:
+                        value = input_attr.get()
+
+                    if only_on_change:
+                        current = fingerprint(value)
+                        if not has_changed(fingerprints[index], current):
+                            skipped_count += 1
+                            continue
+                        fingerprints[index] = current
+
+                    if pack_bundle:
+                        bundle_children[index].value = value
+                        if isinstance(value, np.ndarray):
+                            bytes_copied += 2 * value.nbytes
+                    elif in_place:
+                        bytes_copied += OgnDynamicMatcher._copy_in_place(value, output_attr)
+                    else:
+                        output_attr.set(value)
+                        if isinstance(value, np.ndarray):
+                            # get() materializes the array and set() copies it again
+                            bytes_copied += 2 * value.nbytes
+                    processed_count += 1
+                except Exception as e:
+                    # The handle is most likely stale (attribute removed), rebuild next tick
+                    carb.log_warn(f"Failed to copy {input_attr.get_name()} to {output_attr.get_name()}: {e}")
+                    state.invalidate()
+
+            state.bytes_copied = bytes_copied
+            state.bytes_copied_total += bytes_copied
+            db.outputs.bytesCopied = bytes_copied
+
+            state.copies_skipped = skipped_count
+            state.copies_skipped_total += skipped_count
+            db.outputs.copiesSkipped = skipped_count
+
             # Trigger execution output
             db.outputs.execOut = og.ExecutionAttributeState.ENABLED
-            
-            if processed_count > 0:
-                carb.log_info(f"DynamicMatcher processed {processed_count} input/output pairs")
-            
+
+            if profile_start:
+                if state.profile is None:
+                    state.profile = profiling.get_profile(db.abi_node)
+                profiling.record(
+                    state.profile,
+                    time.perf_counter_ns() - profile_start,
+                    pairs=processed_count,
+                    bytes_moved=bytes_copied
+                )
+
             return True
-            
+
         except Exception as e:
             carb.log_error(f"Error in DynamicMatcher compute: {e}")
             return False
 
+    @staticmethod
+    def _clear_stack(db, state):
+        """Empty the stacked output and its layout once stacking is turned off, so nothing stale is left downstream"""
+        state.stack_output.get_attribute_data().get(reserved_element_count=0)
+        db.outputs.stackOffsets = []
+        db.outputs.stackNames = []
+        state.stack_output = None
+        # The outputs:dataN of the stacked inputs were not written while stacking, refresh them
+        state.reset_fingerprints()
+
+    @staticmethod
+    def _stack(db, state, only_on_change):
+        """
+        Write the stackable inputs into the stacked output buffer, reused until the layout changes.
+        The offsets and names are written only when the layout changes.
+        Returns the (processed, skipped, bytes copied) counts.
+        """
+        copy_plan = state.copy_plan
+        stack_indices = state.stack_indices
+        # The attribute data of an input is a read-only view on the Fabric buffer
+        values = [copy_plan[index][0].get_attribute_data().get() for index in stack_indices]
+
+        # === Lay out the inputs again only when an element count changed ===
+        offsets = state.stack_offsets
+        relayout = offsets is None or any(
+            (value.size if isinstance(value, np.ndarray) else 1) != stop - start
+            for value, start, stop in zip(values, offsets, offsets[1:])
+        )
+        if relayout:
+            offsets = [0]
+            for value in values:
+                offsets.append(offsets[-1] + (value.size if isinstance(value, np.ndarray) else 1))
+            state.stack_offsets = offsets
+            db.outputs.stackOffsets = offsets
+            db.outputs.stackNames = [copy_plan[index][0].get_name()[len("inputs:"):] for index in stack_indices]
+
+        if state.stack_output is None:
+            # Stacking was just turned on, the stacked output is empty
+            state.stack_output = db.abi_node.get_attribute("outputs:stacked")
+            state.reset_fingerprints()
+        # Reserving the same element count keeps the output buffer allocated across ticks
+        target = state.stack_output.get_attribute_data().get(reserved_element_count=offsets[-1])
+
+        processed_count = 0
+        skipped_count = 0
+        bytes_copied = 0
+        fingerprints = state.fingerprints
+        for index, value, start, stop in zip(stack_indices, values, offsets, offsets[1:]):
+            if only_on_change:
+                current = fingerprint(value)
+                # A new layout may come with a new buffer, every input is written again
+                if not relayout and not has_changed(fingerprints[index], current):
+                    skipped_count += 1
+                    continue
+                fingerprints[index] = current
+
+            if isinstance(value, np.ndarray):
+                target[start:stop] = value.reshape(-1)
+            else:
+                target[start] = value
+            processed_count += 1
+            bytes_copied += (stop - start) * target.itemsize
+        return processed_count, skipped_count, bytes_copied
+
+    @staticmethod
+    def _copy_in_place(source, output_attr) -> int:
+        """
+        Forward the input data into the output buffer without an intermediate copy.
+        Returns the number of array bytes copied.
+        """
+        if not isinstance(source, np.ndarray):
+            output_attr.set(source)
+            return 0
+
+        # Reserving the same element count keeps the output buffer allocated across ticks
+        target = output_attr.get_attribute_data().get(reserved_element_count=source.shape[0])
+        if np.shares_memory(source, target):
+            return 0
+
+        np.copyto(target, source)
+        return source.nbytes
+
     @staticmethod
     def initialize(graph_context, node):
         """
         Initialize the node
         """
+        try:
+            node.register_on_connected_callback(
+                OgnDynamicMatcher.on_connected_callback
+            )
+            node.register_on_disconnected_callback(
+                OgnDynamicMatcher.on_disconnected_callback
+            )
+
+            # === Index the inputs saved with the node and pair their outputs ===
+            state = OgnDynamicMatcherDatabase.per_node_internal_state(node)
+            data_inputs = state.data_inputs
+            data_inputs.rebuild(node)
+            for suffix in data_inputs.connected_suffixes:
+                output_name = f"{_OUTPUT_PREFIX}{suffix}"
+                if node.get_attribute_exists(output_name):
+                    state.pair_output(suffix, node.get_attribute(output_name))
+
+            # === Keep a single free input after the biggest connected input ===
+            remove_extra_inputs(node, data_inputs)
+            ensure_free_input(node, data_inputs)
+        except Exception as e:
+            carb.log_error(f"Error initializing DynamicMatcher: {e}")
+            raise
         carb.log_info("DynamicMatcher node initialized")
-        pass
 
+    @staticmethod
+    def release(node):
+        """
+        Release the node
+        """
+        try:
+            state = OgnDynamicMatcherDatabase.per_node_internal_state(node)
+            if state.profile is not None:
+                profiling.release_profile(state.profile)
+                state.profile = None
+
+            remove_free_input(node, state.data_inputs)
+            get_topology_editor().commit_node(node)
+        except Exception as e:
+            carb.log_error(f"Error releasing DynamicMatcher: {e}")
+            raise
+
+    @staticmethod
+    def _get_state(attr):
+        """Internal state of the DynamicMatcher owning the attribute, None for other nodes"""
+        node = attr.get_node()
+        if node.get_type_name() != _NODE_TYPE_NAME:
+            return None
+        return OgnDynamicMatcherDatabase.per_node_internal_state(node)
+
+    @staticmethod
+    def on_connected_callback(upstream_attr, downstream_attr):
+        """
+        Callback when an attribute is connected.
+        Resolves the input to the upstream type and creates its output with that type,
+        so compute never has to inspect types.
+        """
+        try:
+            state = OgnDynamicMatcher._get_state(downstream_attr)
+            if state is None:
+                return
+
+            data_inputs = state.data_inputs
+            suffix = data_inputs.suffix_of(downstream_attr.get_name())
+            if suffix is None:
+                return
+
+            # === Resolve the type ===
+            resolve_from_upstream(upstream_attr, downstream_attr)
+            node = downstream_attr.get_node()
+            connect_dynamic_input(node, data_inputs, suffix, downstream_attr)
+            state.data_outputs.pop(suffix, None)
+            state.invalidate()
+
+            # === Create the paired output with the concrete upstream type ===
+            create_paired_output(
+                node,
+                upstream_attr,
+                f"{_OUTPUT_PREFIX}{suffix}",
+                on_created=lambda output_attr: state.pair_output(suffix, output_attr)
+            )
+
+            # === Create a new input attribute for extra data input ===
+            if suffix == data_inputs.last_suffix:
+                create_dynamic_input(node, data_inputs, suffix + 1)
+        except Exception as e:
+            carb.log_error(f"Error in DynamicMatcher on_connected_callback: {e}")
+            raise
+
+    @staticmethod
+    def on_disconnected_callback(upstream_attr, downstream_attr):
+        """
+        Callback when an attribute is disconnected.
+        Removes the paired output and the extra free inputs.
+        """
+        try:
+            state = OgnDynamicMatcher._get_state(downstream_attr)
+            if state is None:
+                return
+
+            data_inputs = state.data_inputs
+            suffix = data_inputs.suffix_of(downstream_attr.get_name())
+            if suffix is None:
+                return
+
+            node = downstream_attr.get_node()
+            data_inputs.set_connected(suffix, None)
+            state.data_outputs.pop(suffix, None)
+            state.invalidate()
+
+            get_topology_editor().remove_attribute(node, f"{_OUTPUT_PREFIX}{suffix}")
+            remove_extra_inputs(node, data_inputs)
+        except Exception as e:
+            carb.log_error(f"Error in DynamicMatcher on_disconnected_callback: {e}")
+            raise
@@ -1,27 +1,187 @@
-import omni
+import time
+
+import numpy as np
 import omni.graph.core as og
 import carb
 
+from isaacsim.nodes.more_nodes.impl import profiling
+from isaacsim.nodes.more_nodes.impl.change_detection import UNSET, fingerprint, has_changed
+from isaacsim.nodes.more_nodes.impl.dynamic_inputs import (
+    DynamicInputIndex,
+    connect_dynamic_input,
+    create_dynamic_input,
+    ensure_free_input,
+    remove_extra_inputs,
+    remove_free_input,
+    resolve_from_upstream,
+)
+from isaacsim.nodes.more_nodes.impl.formatter import ValueFormatter
+from isaacsim.nodes.more_nodes.impl.extension import get_log_aggregator, get_topology_editor
+from isaacsim.nodes.more_nodes.impl.log_sink import SINK_GLOBAL, SINK_ROTATING_FILE, LogRecord, create_sink
+from isaacsim.nodes.more_nodes.impl.rate_limit import ThrottleCounters, TokenBucket
+from isaacsim.nodes.more_nodes.impl.timeline import get_current_time
+from isaacsim.nodes.more_nodes.ogn.OgnLoggingNodeDatabase import OgnLoggingNodeDatabase
+
+_NODE_TYPE_NAME = "isaacsim.nodes.more_nodes.LoggingNode"
+
+
 class OgnLoggingNodeInternalState:
     """Convenience class for maintaining per-node state information"""
 
+    # Hundreds of instances can live in one stage, keep them small
+    __slots__ = (
+        "history",
+        "data_inputs",
+        "_sink",
+        "_sink_config",
+        "_channel",
+        "_recorder",
+        "_recorder_config",
+        "tick_count",
+        "token_bucket",
+        "throttled",
+        "last_logged",
+        "_filter_expression",
+        "_predicate",
+        "filter_failed",
+        "profile",
+        "formatter",
+        "value_formatters",
+    )
+
     def __init__(self):
         """Instantiate the per-node state information"""
-        self.history = {}
-        self.input_count = 1
-
-        self._timeline = omni.timeline.get_timeline_interface()
+        # Ring buffers of the recent input values, only created while the history is enabled
+        self.history = None
+
+        # Index of the inputs:dataInN attributes, updated by the connection callbacks
+        self.data_inputs = DynamicInputIndex("inputs:dataIn")
+
+        self._sink = None
+        self._sink_config = None
+        self._channel = None
+
+        self._recorder = None
+        self._recorder_config = None
+
+        # === Throttling ===
+        self.tick_count = 0
+        self.token_bucket = TokenBucket()
+        self.throttled = ThrottleCounters()
+        # Fingerprint of the last logged value of each input, by attribute name
+        self.last_logged = {}
+
+        # === Filter expression, compiled when it changes ===
+        self._filter_expression = ""
+        self._predicate = None
+        self.filter_failed = False
+
+        # Compute statistics, only created while profiling is enabled
+        self.profile = None
+
+        # === Formatting ===
+        self.formatter = ValueFormatter()
+        # Formatting function of each connected input, by attribute name, cleared on reconnection
+        self.value_formatters = {}
     
     def get_current_time(self):
-        """Get the current time from the timeline"""
-        return self._timeline.get_current_time()
+        """Get the current time from the timeline shared by every node"""
+        return get_current_time()
+
+    def get_sink(self, kind, target, capacity, overflow_policy, **options):
+        """Get the log sink, recreating it when its configuration changed. None if it cannot be created."""
+        config = (kind, target, capacity, overflow_policy, tuple(sorted(options.items())))
+        if config != self._sink_config:
+            self.close_sink()
+            # A failed configuration is kept so that it is only reported once, until it changes
+            self._sink_config = config
+            try:
+                self._sink = create_sink(kind, target, capacity, overflow_policy, **options)
+            except Exception as e:
+                carb.log_warn(f"Logging Node cannot open the '{kind}' sink '{target}': {e}")
+        return self._sink
+
+    def get_predicate(self, expression):
+        """Get the compiled filter, None when there is no valid filter"""
+        if expression != self._filter_expression:
+            self._filter_expression = expression
+            self._predicate = None
+            self.filter_failed = False
+            if expression.strip():
+                # The expression compiler is only loaded by the nodes that have a filter
+                from isaacsim.nodes.more_nodes.impl.predicate import CompiledPredicate, PredicateError
+
+                try:
+                    self._predicate = CompiledPredicate(expression)
+                except PredicateError as e:
+                    carb.log_error(f"Logging Node filter ignored: {e}")
+        return self._predicate
+
+    def get_channel(self, node, level):
+        """Get the channel to the global aggregator, recreating it when the level or the aggregator changed"""
+        if self._sink_config is not None:
+            # === Switched back from a sink of its own ===
+            self.close_sink()
+        channel = self._channel
+        # The aggregator is closed and replaced when the extension shuts down or reloads
+        if channel is None or channel.level_name != level or channel.closed:
+            self._channel = get_log_aggregator().channel(node.get_prim_path(), level)
+        return self._channel
+
+    def close_sink(self):
+        """Flush and close the log sink"""
+        if self._sink is not None:
+            self._sink.close()
+        self._sink = None
+        self._sink_config = None
+
+    def get_recorder(self, path, chunk_rows):
+        """Get the trace writer, reopening it when its configuration changed. None if it cannot be opened."""
+        config = (path, chunk_rows)
+        if config != self._recorder_config:
+            from isaacsim.nodes.more_nodes.impl.trace import TraceWriter
+
+            self.close_recorder()
+            # A failed configuration is kept so that it is only reported once, until it changes
+            self._recorder_config = config
+            try:
+                self._recorder = TraceWriter(path, chunk_rows)
+            except Exception as e:
+                carb.log_warn(f"Logging Node cannot record to '{path}': {e}")
+        return self._recorder
+
+    def get_history(self, node, capacity, max_bytes):
+        """Get the input history, creating it on first use"""
+        if self.history is None:
+            from isaacsim.nodes.more_nodes.impl.history import SignalHistory
+
+            self.history = SignalHistory(node.get_prim_path(), capacity, max_bytes)
+        else:
+            self.history.configure(capacity, max_bytes)
+        return self.history
+
+    def close_history(self):
+        """Drop the input history and its memory"""
+        if self.history is not None:
+            self.history.close()
+        self.history = None
+
+    @property
+    def has_recorder(self) -> bool:
+        return self._recorder_config is not None
+
+    def close_recorder(self):
+        """Write the pending trace chunks and close the trace"""
+        if self._recorder is not None:
+            self._recorder.close()
+        self._recorder = None
+        self._recorder_config = None
 
 
 class OgnLoggingNode:
     """
     The Ogn node class that logs messages to the console.
     """
-    _INPUT_COUNT = 1
 
     @staticmethod
     def initialize(graph_context: og.GraphContext, node: og.Node):
@@ -36,33 +196,15 @@ class OgnLoggingNode:
                 OgnLoggingNode.on_disconnected_callback
             )
 
-            # === Remove until the biggest connected input ===
-            data_input_attributes_list = sorted(
-                (
-                    attr for attr in node.get_attributes()
-                    if attr.get_name().startswith("inputs:dataIn")
-                ),
-                key=lambda attr: int(attr.get_name().replace("inputs:dataIn", "")),
-                reverse=True
-            )
+            # === Index the inputs saved with the node ===
+            data_inputs = OgnLoggingNodeDatabase.per_node_internal_state(node).data_inputs
+            data_inputs.rebuild(node)
 
-            for attr in data_input_attributes_list:
-                if attr.get_upstream_connection_count() == 0:
-                    node.remove_attribute(attr.get_name())
-                    break
+            # === Remove until the biggest connected input ===
+            remove_extra_inputs(node, data_inputs)
 
-            # === Create the first input attribute if it does not exist ===
-            if not any(
-                attr.get_name().startswith("inputs:dataIn")
-                for attr in node.get_attributes()
-            ):
-                og.Controller().create_attribute(
-                    node,
-                    attr_name="inputs:dataIn0",
-                    attr_type=og.Type(og.BaseDataType.UNKNOWN),
-                    attr_port=og.AttributePortType.ATTRIBUTE_PORT_TYPE_INPUT,
-                    attr_extended_type=og.ExtendedAttributeType.ANY
-                )
+            # === Create a free input after the biggest connected input ===
+            ensure_free_input(node, data_inputs)
         except Exception as e:
             carb.log_error(f"Error initializing OgnLoggingNode: {e}")
             raise
@@ -74,46 +216,49 @@ class OgnLoggingNode:
         especially the input count.
         """
         try:
-            # === Remove until the biggest connected input ===
-            data_input_attributes_list = sorted(
-                (
-                    attr for attr in node.get_attributes()
-                    if attr.get_name().startswith("inputs:dataIn")
-                ),
-                key=lambda attr: int(attr.get_name().replace("inputs:dataIn", "")),
-                reverse=True
-            )
-
-            for attr in data_input_attributes_list:
-                if attr.get_upstream_connection_count() == 0:
-                    node.remove_attribute(attr.get_name())
-                    break
+            # === Write out the records still waiting in the sink and the trace ===
+            state = OgnLoggingNodeDatabase.per_node_internal_state(node)
+            state.close_sink()
+            state.close_recorder()
+            state.close_history()
+            if state.profile is not None:
+                profiling.release_profile(state.profile)
+                state.profile = None
+
+            # === Remove the free input after the biggest connected input ===
+            # The node is going away, its edits cannot wait for the end of the frame
+            remove_free_input(node, state.data_inputs)
+            get_topology_editor().commit_node(node)
         except Exception as e:
             carb.log_error(f"Error releasing OgnLoggingNode: {e}")
             raise
 
+    @staticmethod
+    def _get_state(attr):
+        """Internal state of the LoggingNode owning the attribute, None for other nodes"""
+        node = attr.get_node()
+        if node.get_type_name() != _NODE_TYPE_NAME:
+            return None
+        return OgnLoggingNodeDatabase.per_node_internal_state(node)
+
     @staticmethod
     def on_connected_callback(upstream_attr, downstream_attr):
         """
         Callback when an attribute is connected.
         This function mainly control the number of inputs.
         """
-
-        # FIXME: Problem if the downstream node is not the OgnLoggingNode
-        # but it has the name of inputs:dataIn.
-        if not downstream_attr.get_name().startswith("inputs:dataIn"):
+        state = OgnLoggingNode._get_state(downstream_attr)
+        if state is None:
             return
 
-        # === Set basic variables ===
-        node = downstream_attr.get_node()
-        attributes = node.get_attributes()
+        data_inputs = state.data_inputs
+        suffix = data_inputs.suffix_of(downstream_attr.get_name())
+        if suffix is None:
+            return
 
         # === Resolve the type ===
         try:
-            if downstream_attr.get_resolved_type().base_type == og.BaseDataType.UNKNOWN:
-                upstream_resolved_type = upstream_attr.get_resolved_type()
-                if upstream_resolved_type.base_type != og.BaseDataType.UNKNOWN:
-                    downstream_attr.set_resolved_type(upstream_resolved_type)
+            resolve_from_upstream(upstream_attr, downstream_attr)
 
         except Exception as e:
             carb.log_error(f"Error in on_connected_callback: {e}")
@@ -121,31 +266,11 @@ class OgnLoggingNode:
 
         # === Create a new input attribute for extra data input ===
         try:
-            # For readability, do not split the name by "dataIn" directly
-            # current_index = int(downstream_attr.get_name()[13:])
-            attribute_name = downstream_attr.get_name()
-            current_index = int(attribute_name.replace("inputs:dataIn", ""))
+            connect_dynamic_input(downstream_attr.get_node(), data_inputs, suffix, downstream_attr)
+            state.value_formatters.pop(downstream_attr.get_name(), None)
 
-            if current_index != OgnLoggingNode._INPUT_COUNT-1:
-                return
-
-            # FIXME: The connected line is not visible in the UI
-            # until we change the window and back again.
-            # Create the first input attribute
-            # node.create_attribute(
-            #     attributeName="inputs:dataIn0",
-            #     attributeType=og.Type(og.BaseDataType.UNKNOWN),
-            #     portType=og.AttributePortType.ATTRIBUTE_PORT_TYPE_INPUT,
-            #     extendedType=og.ExtendedAttributeType.ANY
-            # )
-            og.Controller().create_attribute(
-                node,
-                attr_name=f"inputs:dataIn{OgnLoggingNode._INPUT_COUNT}",
-                attr_type=og.Type(og.BaseDataType.UNKNOWN),
-                attr_port=og.AttributePortType.ATTRIBUTE_PORT_TYPE_INPUT,
-                attr_extended_type=og.ExtendedAttributeType.ANY
-            )
-            OgnLoggingNode._INPUT_COUNT += 1
+            if suffix == data_inputs.last_suffix:
+                create_dynamic_input(downstream_attr.get_node(), data_inputs, suffix + 1)
 
         except Exception as e:
             carb.log_error(f"Error in on_connected_callback: {e}")
@@ -158,25 +283,47 @@ class OgnLoggingNode:
         This function mainly control the number of inputs.
         """
         try:
-            if not downstream_attr.get_name().startswith("inputs:dataIn"):
+            state = OgnLoggingNode._get_state(downstream_attr)
+            if state is None:
                 return
 
-            node = downstream_attr.get_node()
-            attributes = node.get_attributes()
-
-            attribute_name = downstream_attr.get_name()
-            current_index = int(attribute_name.replace("inputs:dataIn", ""))
-
-            if current_index == 0:
+            data_inputs = state.data_inputs
+            suffix = data_inputs.suffix_of(downstream_attr.get_name())
+            if suffix is None:
                 return
 
-            if current_index == OgnLoggingNode._INPUT_COUNT - 2:
-                OgnLoggingNode._INPUT_COUNT -= 1
-                node.remove_attribute(f"inputs:dataIn{current_index}")
+            data_inputs.set_connected(suffix, None)
+            state.value_formatters.pop(downstream_attr.get_name(), None)
+            if state.history is not None:
+                state.history.forget(downstream_attr.get_name()[len("inputs:"):])
+            remove_extra_inputs(downstream_attr.get_node(), data_inputs)
         except Exception as e:
             carb.log_error(f"Error in on_disconnected_callback: {e}")
             raise
 
+    @staticmethod
+    def _evaluate_filter(state, predicate, current_time) -> bool:
+        """Evaluate the filter with the values of the inputs it references"""
+        from isaacsim.nodes.more_nodes.impl.predicate import TIME_VARIABLE
+
+        variables = {}
+        for name in predicate.variables:
+            if name == TIME_VARIABLE:
+                variables[name] = current_time
+                continue
+            suffix = int(name[len("dataIn"):])
+            if not state.data_inputs.is_connected(suffix):
+                return False
+            variables[name] = state.data_inputs.get(suffix).get()
+
+        try:
+            return predicate(variables)
+        except Exception as e:
+            if not state.filter_failed:
+                carb.log_warn(f"Logging Node filter '{predicate.expression}' failed: {e}")
+                state.filter_failed = True
+            return False
+
     @staticmethod
     def on_value_changed_callback(attr) -> None:
         pass
@@ -188,26 +335,145 @@ class OgnLoggingNode:
 
     @staticmethod
     def compute(db) -> bool:
+        profile_start = time.perf_counter_ns() if profiling.enabled else 0
         state = db.per_instance_state
+        records_logged = 0
+        bytes_moved = 0
 
         exec_in = db.inputs.execIn
         verbosity = db.inputs.verbosity
 
-        node = db.abi_node
-        context = db.abi_context
-
-        # Get the input attributes
-        data_input_attributes = [
-            attr for attr in node.get_attributes()
-            if attr.get_name().startswith("inputs:dataIn")
-        ]
+        # Only the connected inputs, kept up to date by the connection callbacks
+        connected_attributes = state.data_inputs.connected_attributes
 
         if verbosity:
-            for attr in data_input_attributes:
-                if attr.get_upstream_connection_count() == 0:
+            # Compute only enqueues, formatting and I/O happen on the sink thread
+            logged_attributes = connected_attributes
+            if db.inputs.sink == SINK_GLOBAL:
+                # The aggregator reads the timeline once per frame for every Logging Node
+                sink = state.get_channel(db.abi_node, db.inputs.level)
+                current_time = sink.frame_time()
+                if not sink.enabled:
+                    logged_attributes = []
+            else:
+                sink_kind = db.inputs.sink
+                options = {}
+                if sink_kind == SINK_ROTATING_FILE:
+                    options = {
+                        "compression": db.inputs.compression,
+                        "segment_bytes": db.inputs.rotateBytes,
+                        "segment_seconds": db.inputs.rotateSeconds,
+                        "max_total_bytes": db.inputs.maxDiskBytes,
+                    }
+                sink = state.get_sink(
+                    sink_kind,
+                    db.inputs.sinkTarget,
+                    db.inputs.bufferSize,
+                    db.inputs.overflowPolicy,
+                    **options
+                )
+                current_time = state.get_current_time()
+                if sink is None:
+                    logged_attributes = []
+            log_on_change = db.inputs.logOnChange
+            state.token_bucket.configure(db.inputs.maxRecordsPerSecond)
+            formatter = state.formatter
+            if formatter.configure(
+                db.inputs.arrayPreview,
+                db.inputs.maxValueLength,
+                db.inputs.hashArrays,
+                db.inputs.summarizeArrays
+            ):
+                state.value_formatters = {}
+            value_formatters = state.value_formatters
+
+            # === Every Nth tick decimation ===
+            state.tick_count += 1
+            if (state.tick_count - 1) % max(1, db.inputs.decimation) != 0:
+                state.throttled.add(ThrottleCounters.DECIMATED, len(logged_attributes))
+                logged_attributes = []
+
+            # === Filter expression ===
+            predicate = state.get_predicate(db.inputs.filter)
+            if (
+                predicate is not None
+                and logged_attributes
+                and not OgnLoggingNode._evaluate_filter(state, predicate, current_time)
+            ):
+                state.throttled.add(ThrottleCounters.FILTERED, len(logged_attributes))
+                logged_attributes = []
+
+            for attr in logged_attributes:
+                attr_name = attr.get_name()
+                value = attr.get()
+
+                # === Log on change ===
+                if log_on_change:
+                    current = fingerprint(value)
+                    if not has_changed(state.last_logged.get(attr_name, UNSET), current):
+                        state.throttled.add(ThrottleCounters.UNCHANGED)
+                        continue
+
+                # === Maximum records per second ===
+                if not state.token_bucket.try_acquire():
+                    state.throttled.add(ThrottleCounters.RATE_LIMITED)
                     continue
-                print(f"[Logging Node at {state.get_current_time()}] {attr.get_name()}: {attr.get()}")
-        
+
+                if log_on_change:
+                    state.last_logged[attr_name] = current
+                if isinstance(value, np.ndarray):
+                    # The array may be a view on a buffer that changes before it is written
+                    value = value.copy()
+                    bytes_moved += value.nbytes
+                # The formatting function is picked once per resolved type and runs on the sink thread
+                value_formatter = value_formatters.get(attr_name)
+                if value_formatter is None:
+                    value_formatter = formatter.for_type(attr.get_resolved_type().get_ogn_type_name())
+                    value_formatters[attr_name] = value_formatter
+                sink.submit(LogRecord(current_time, attr_name, value, value_formatter))
+                records_logged += 1
+
+            summary = state.throttled.take_summary(db.inputs.summaryInterval)
+            if summary is not None and sink is not None:
+                sink.submit(LogRecord(current_time, "summary", summary))
+
+        if db.inputs.history:
+            # Values are copied into preallocated rings, queryable through get_signal_history()
+            history = state.get_history(db.abi_node, db.inputs.historySize, db.inputs.historyMaxBytes)
+            history_time = state.get_current_time()
+            for attr in connected_attributes:
+                history.record(attr.get_name()[len("inputs:"):], history_time, attr.get())
+        elif state.history is not None:
+            state.close_history()
+
+        if db.inputs.record and db.inputs.recordPath:
+            # Values are stored as binary columns, nothing goes through str()
+            recorder = state.get_recorder(db.inputs.recordPath, db.inputs.recordChunkSize)
+            if recorder is not None:
+                recorder.append(
+                    state.get_current_time(),
+                    [
+                        (
+                            attr.get_name().replace("inputs:", ""),
+                            attr.get_resolved_type().get_ogn_type_name(),
+                            attr.get()
+                        )
+                        for attr in connected_attributes
+                    ]
+                )
+        elif state.has_recorder:
+            # === Recording stopped, write out the partial chunk and the manifest ===
+            state.close_recorder()
+
+        if profile_start:
+            if state.profile is None:
+                state.profile = profiling.get_profile(db.abi_node)
+            profiling.record(
+                state.profile,
+                time.perf_counter_ns() - profile_start,
+                records=records_logged,
+                bytes_moved=bytes_moved
+            )
 
 
         if exec_in == og.ExecutionAttributeState.DISABLED:
@@ -0,0 +1,211 @@
+import omni.graph.core as og
+import carb
+
+from isaacsim.nodes.more_nodes.impl.dynamic_inputs import (
+    DynamicInputIndex,
+    connect_dynamic_input,
+    create_dynamic_input,
+    ensure_free_input,
+    remove_extra_inputs,
+    remove_free_input,
+    resolve_from_upstream,
+)
+from isaacsim.nodes.more_nodes.impl.extension import get_topology_editor
+from isaacsim.nodes.more_nodes.impl.timeline import get_current_time
+from isaacsim.nodes.more_nodes.ogn.OgnSharedMemoryExporterDatabase import OgnSharedMemoryExporterDatabase
+
+_NODE_TYPE_NAME = "isaacsim.nodes.more_nodes.SharedMemoryExporter"
+
+
+class OgnSharedMemoryExporterInternalState:
+    """Convenience class for maintaining per-node state information"""
+
+    __slots__ = ("data_inputs", "names", "writer", "writer_config", "warned")
+
+    def __init__(self):
+        """Instantiate the per-node state information"""
+        # Index of the inputs:dataInN attributes, updated by the connection callbacks
+        self.data_inputs = DynamicInputIndex("inputs:dataIn")
+
+        # Published name of each connected input, None when it must be rebuilt
+        self.names = None
+
+        self.writer = None
+        self.writer_config = None
+
+        # Names already warned about because they are left out of the frames
+        self.warned = set()
+
+    def get_writer(self, name, frame_bytes):
+        """Get the segment writer, recreating the segment when its configuration changed. None if it is in use."""
+        config = (name, frame_bytes)
+        if config != self.writer_config:
+            from isaacsim.nodes.more_nodes.impl.shared_memory import SharedMemoryWriter
+
+            self.close_writer()
+            # A segment that cannot be created is reported once, until the configuration changes
+            self.writer_config = config
+            self.warned = set()
+            try:
+                self.writer = SharedMemoryWriter(name, frame_bytes)
+            except FileExistsError as e:
+                carb.log_error(f"SharedMemoryExporter is inactive: {e}")
+        return self.writer
+
+    def close_writer(self):
+        """Remove the segment, the readers see the stream as closed"""
+        if self.writer is not None:
+            self.writer.close()
+        self.writer = None
+        self.writer_config = None
+
+    def build_names(self):
+        """Name every connected input without its port, like dataIn0"""
+        prefix_length = len("inputs:")
+        self.names = [attr.get_name()[prefix_length:] for attr in self.data_inputs.connected_attributes]
+        return self.names
+
+
+class OgnSharedMemoryExporter:
+    """
+    The Ogn node class that publishes its inputs in a shared memory segment.
+    """
+
+    @staticmethod
+    def internal_state():
+        """Returns an object that contains per-node state information"""
+        return OgnSharedMemoryExporterInternalState()
+
+    @staticmethod
+    def default_segment_name(node) -> str:
+        """Segment name derived from the node path"""
+        return "more_nodes" + node.get_prim_path().replace("/", "_")
+
+    @staticmethod
+    def initialize(graph_context: og.GraphContext, node: og.Node):
+        """
+        Initialize the node
+        """
+        try:
+            node.register_on_connected_callback(
+                OgnSharedMemoryExporter.on_connected_callback
+            )
+            node.register_on_disconnected_callback(
+                OgnSharedMemoryExporter.on_disconnected_callback
+            )
+
+            # === Index the inputs saved with the node ===
+            data_inputs = OgnSharedMemoryExporterDatabase.per_node_internal_state(node).data_inputs
+            data_inputs.rebuild(node)
+
+            # === Keep a single free input after the biggest connected input ===
+            remove_extra_inputs(node, data_inputs)
+            ensure_free_input(node, data_inputs)
+        except Exception as e:
+            carb.log_error(f"Error initializing SharedMemoryExporter: {e}")
+            raise
+
+    @staticmethod
+    def release(node):
+        """
+        Release the node
+        """
+        try:
+            state = OgnSharedMemoryExporterDatabase.per_node_internal_state(node)
+            state.close_writer()
+            remove_free_input(node, state.data_inputs)
+            get_topology_editor().commit_node(node)
+        except Exception as e:
+            carb.log_error(f"Error releasing SharedMemoryExporter: {e}")
+            raise
+
+    @staticmethod
+    def _get_state(attr):
+        """Internal state of the SharedMemoryExporter owning the attribute, None for other nodes"""
+        node = attr.get_node()
+        if node.get_type_name() != _NODE_TYPE_NAME:
+            return None
+        return OgnSharedMemoryExporterDatabase.per_node_internal_state(node)
+
+    @staticmethod
+    def on_connected_callback(upstream_attr, downstream_attr):
+        """
+        Callback when an attribute is connected.
+        Resolves the input to the upstream type and creates a new free input.
+        """
+        try:
+            state = OgnSharedMemoryExporter._get_state(downstream_attr)
+            if state is None:
+                return
+
+            data_inputs = state.data_inputs
+            suffix = data_inputs.suffix_of(downstream_attr.get_name())
+            if suffix is None:
+                return
+
+            resolve_from_upstream(upstream_attr, downstream_attr)
+            node = downstream_attr.get_node()
+            connect_dynamic_input(node, data_inputs, suffix, downstream_attr)
+            state.names = None
+
+            if suffix == data_inputs.last_suffix:
+                create_dynamic_input(node, data_inputs, suffix + 1)
+        except Exception as e:
+            carb.log_error(f"Error in SharedMemoryExporter on_connected_callback: {e}")
+            raise
+
+    @staticmethod
+    def on_disconnected_callback(upstream_attr, downstream_attr):
+        """
+        Callback when an attribute is disconnected.
+        Removes the extra free inputs, the input is left out of the next frames.
+        """
+        try:
+            state = OgnSharedMemoryExporter._get_state(downstream_attr)
+            if state is None:
+                return
+
+            data_inputs = state.data_inputs
+            suffix = data_inputs.suffix_of(downstream_attr.get_name())
+            if suffix is None:
+                return
+
+            data_inputs.set_connected(suffix, None)
+            state.names = None
+            remove_extra_inputs(downstream_attr.get_node(), data_inputs)
+        except Exception as e:
+            carb.log_error(f"Error in SharedMemoryExporter on_disconnected_callback: {e}")
+            raise
+
+    @staticmethod
+    def compute(db) -> bool:
+        try:
+            state = db.per_instance_state
+            segment_name = db.inputs.segmentName or OgnSharedMemoryExporter.default_segment_name(db.abi_node)
+            writer = state.get_writer(segment_name, db.inputs.frameBytes)
+            if writer is None:
+                return False
+
+            names = state.names
+            if names is None:
+                names = state.build_names()
+            writer.write(
+                get_current_time(),
+                names,
+                [attr.get() for attr in state.data_inputs.connected_attributes]
+            )
+
+            # === Warn once about the values left out of the frames ===
+            for name, reason in writer.dropped:
+                if name not in state.warned:
+                    state.warned.add(name)
+                    carb.log_warn(f"SharedMemoryExporter {segment_name} does not publish {name}: {reason}")
+
+            db.outputs.segmentName = segment_name
+            db.outputs.frame = writer.frame
+            db.outputs.execOut = og.ExecutionAttributeState.ENABLED
+            return True
+
+        except Exception as e:
+            carb.log_error(f"Error in SharedMemoryExporter compute: {e}")
+            return False
@@ -0,0 +1,235 @@
+import omni.graph.core as og
+import carb
+
+from isaacsim.nodes.more_nodes.impl.dynamic_inputs import (
+    DynamicInputIndex,
+    connect_dynamic_input,
+    create_dynamic_input,
+    ensure_free_input,
+    remove_extra_inputs,
+    remove_free_input,
+    resolve_from_upstream,
+)
+from isaacsim.nodes.more_nodes.impl.extension import get_topology_editor
+from isaacsim.nodes.more_nodes.impl.stats import StreamingStats
+from isaacsim.nodes.more_nodes.ogn.OgnStreamingStatsDatabase import OgnStreamingStatsDatabase
+
+_NODE_TYPE_NAME = "isaacsim.nodes.more_nodes.StreamingStats"
+
+# Statistics written for each connected input, as outputs:<name>N of type double[]
+_STAT_OUTPUTS = ("mean", "stdDev", "min", "max", "ewma", "quantiles")
+
+
+class OgnStreamingStatsInternalState:
+    """Convenience class for maintaining per-node state information"""
+
+    __slots__ = ("data_inputs", "stats", "outputs", "settings", "tick_count", "unsupported")
+
+    def __init__(self):
+        """Instantiate the per-node state information"""
+        # Index of the inputs:dataInN attributes, updated by the connection callbacks
+        self.data_inputs = DynamicInputIndex("inputs:dataIn")
+
+        # Statistics and output handles of each connected input, by suffix
+        self.stats = {}
+        self.outputs = {}
+
+        self.settings = None
+        self.tick_count = 0
+        # Suffixes whose values cannot be converted to numbers, warned about once
+        self.unsupported = set()
+
+    def configure(self, levels, alpha):
+        """Apply the settings, the statistics restart when the quantile levels change"""
+        levels = tuple(levels)
+        if self.settings is not None and self.settings[0] != levels:
+            self.stats = {}
+        self.settings = (levels, alpha)
+        for stats in self.stats.values():
+            stats.alpha = alpha
+
+    def get_stats(self, suffix):
+        stats = self.stats.get(suffix)
+        if stats is None:
+            levels, alpha = self.settings
+            stats = StreamingStats(levels, alpha)
+            self.stats[suffix] = stats
+        return stats
+
+    def forget(self, suffix):
+        """Drop everything kept for a disconnected input"""
+        self.stats.pop(suffix, None)
+        self.outputs.pop(suffix, None)
+        self.unsupported.discard(suffix)
+
+
+class OgnStreamingStats:
+    """
+    The Ogn node class that keeps streaming statistics of its inputs.
+    """
+
+    @staticmethod
+    def internal_state():
+        """Returns an object that contains per-node state information"""
+        return OgnStreamingStatsInternalState()
+
+    @staticmethod
+    def initialize(graph_context: og.GraphContext, node: og.Node):
+        """
+        Initialize the node
+        """
+        try:
+            node.register_on_connected_callback(
+                OgnStreamingStats.on_connected_callback
+            )
+            node.register_on_disconnected_callback(
+                OgnStreamingStats.on_disconnected_callback
+            )
+
+            # === Index the inputs saved with the node ===
+            data_inputs = OgnStreamingStatsDatabase.per_node_internal_state(node).data_inputs
+            data_inputs.rebuild(node)
+
+            # === Keep a single free input after the biggest connected input ===
+            remove_extra_inputs(node, data_inputs)
+            ensure_free_input(node, data_inputs)
+        except Exception as e:
+            carb.log_error(f"Error initializing OgnStreamingStats: {e}")
+            raise
+
+    @staticmethod
+    def release(node):
+        """
+        Release the node
+        """
+        try:
+            remove_free_input(node, OgnStreamingStatsDatabase.per_node_internal_state(node).data_inputs)
+            get_topology_editor().commit_node(node)
+        except Exception as e:
+            carb.log_error(f"Error releasing OgnStreamingStats: {e}")
+            raise
+
+    @staticmethod
+    def _get_state(attr):
+        """Internal state of the StreamingStats node owning the attribute, None for other nodes"""
+        node = attr.get_node()
+        if node.get_type_name() != _NODE_TYPE_NAME:
+            return None
+        return OgnStreamingStatsDatabase.per_node_internal_state(node)
+
+    @staticmethod
+    def on_connected_callback(upstream_attr, downstream_attr):
+        """
+        Callback when an attribute is connected.
+        Creates the statistics outputs of the input and a new free input.
+        """
+        try:
+            state = OgnStreamingStats._get_state(downstream_attr)
+            if state is None:
+                return
+
+            data_inputs = state.data_inputs
+            suffix = data_inputs.suffix_of(downstream_attr.get_name())
+            if suffix is None:
+                return
+
+            resolve_from_upstream(upstream_attr, downstream_attr)
+            node = downstream_attr.get_node()
+            connect_dynamic_input(node, data_inputs, suffix, downstream_attr)
+            state.forget(suffix)
+
+            # === Create the statistics outputs of the input ===
+            editor = get_topology_editor()
+            for stat in _STAT_OUTPUTS:
+                editor.add_attribute(
+                    node,
+                    f"outputs:{stat}{suffix}",
+                    og.Type(og.BaseDataType.DOUBLE, 1, 1),
+                    og.AttributePortType.ATTRIBUTE_PORT_TYPE_OUTPUT
+                )
+
+            if suffix == data_inputs.last_suffix:
+                create_dynamic_input(node, data_inputs, suffix + 1)
+        except Exception as e:
+            carb.log_error(f"Error in on_connected_callback: {e}")
+            raise
+
+    @staticmethod
+    def on_disconnected_callback(upstream_attr, downstream_attr):
+        """
+        Callback when an attribute is disconnected.
+        Removes the statistics outputs of the input and the extra free inputs.
+        """
+        try:
+            state = OgnStreamingStats._get_state(downstream_attr)
+            if state is None:
+                return
+
+            data_inputs = state.data_inputs
+            suffix = data_inputs.suffix_of(downstream_attr.get_name())
+            if suffix is None:
+                return
+
+            data_inputs.set_connected(suffix, None)
+            state.forget(suffix)
+
+            node = downstream_attr.get_node()
+            editor = get_topology_editor()
+            for stat in _STAT_OUTPUTS:
+                editor.remove_attribute(node, f"outputs:{stat}{suffix}")
+
+            remove_extra_inputs(node, data_inputs)
+        except Exception as e:
+            carb.log_error(f"Error in on_disconnected_callback: {e}")
+            raise
+
+    @staticmethod
+    def compute(db) -> bool:
+        try:
+            state = db.per_instance_state
+            state.configure(db.inputs.quantileLevels, db.inputs.ewmaAlpha)
+            if db.inputs.reset:
+                state.stats = {}
+
+            state.tick_count += 1
+            emit = (state.tick_count - 1) % max(1, db.inputs.emitInterval) == 0
+
+            data_inputs = state.data_inputs
+            for suffix, attr in zip(data_inputs.connected_suffixes, data_inputs.connected_attributes):
+                if suffix in state.unsupported:
+                    continue
+
+                stats = state.get_stats(suffix)
+                try:
+                    stats.update(attr.get())
+                except (TypeError, ValueError) as e:
+                    carb.log_warn(f"StreamingStats cannot use {attr.get_name()}: {e}")
+                    state.unsupported.add(suffix)
+                    continue
+
+                if not emit:
+                    continue
+
+                # === Write the statistics outputs ===
+                outputs = state.outputs.get(suffix)
+                if outputs is None:
+                    if not db.abi_node.get_attribute_exists(f"outputs:{_STAT_OUTPUTS[-1]}{suffix}"):
+                        # The outputs are created at the end of the frame the input got connected
+                        continue
+                    outputs = [db.abi_node.get_attribute(f"outputs:{stat}{suffix}") for stat in _STAT_OUTPUTS]
+                    state.outputs[suffix] = outputs
+                mean_attr, std_dev_attr, min_attr, max_attr, ewma_attr, quantiles_attr = outputs
+                mean_attr.set(stats.mean)
+                std_dev_attr.set(stats.std_dev)
+                min_attr.set(stats.minimum)
+                max_attr.set(stats.maximum)
+                ewma_attr.set(stats.ewma)
+                if len(stats.levels):
+                    quantiles_attr.set(stats.quantiles().reshape(-1))
+
+            db.outputs.execOut = og.ExecutionAttributeState.ENABLED
+            return True
+
+        except Exception as e:
+            carb.log_error(f"Error in StreamingStats compute: {e}")
+            return False
@@ -0,0 +1,247 @@
+import numpy as np
+import omni.graph.core as og
+import carb
+
+from isaacsim.nodes.more_nodes.impl.dynamic_inputs import (
+    DynamicInputIndex,
+    connect_dynamic_input,
+    create_dynamic_input,
+    create_paired_output,
+    ensure_free_input,
+    remove_extra_inputs,
+    remove_free_input,
+    resolve_from_upstream,
+)
+from isaacsim.nodes.more_nodes.impl.extension import get_topology_editor
+from isaacsim.nodes.more_nodes.impl.history import RingBuffer
+from isaacsim.nodes.more_nodes.impl.timeline import get_current_time
+from isaacsim.nodes.more_nodes.ogn.OgnSynchronizerDatabase import OgnSynchronizerDatabase
+
+_NODE_TYPE_NAME = "isaacsim.nodes.more_nodes.Synchronizer"
+_OUTPUT_PREFIX = "outputs:data"
+
+
+class OgnSynchronizerInternalState:
+    """Convenience class for maintaining per-node state information"""
+
+    __slots__ = ("data_inputs", "data_outputs", "buffer_size", "rings", "unsupported")
+
+    def __init__(self):
+        """Instantiate the per-node state information"""
+        # Index of the inputs:dataN attributes, updated by the connection callbacks
+        self.data_inputs = DynamicInputIndex("inputs:data")
+
+        # Output paired with each connected input, by suffix, set once the output exists
+        self.data_outputs = {}
+
+        # Ring buffer of the timestamped samples of each input, by suffix, created on the first sample
+        self.buffer_size = None
+        self.rings = {}
+
+        # Suffixes whose values are not numeric, passed through instead of being buffered
+        self.unsupported = set()
+
+    def configure(self, buffer_size):
+        """Apply the buffer size, the buffered samples are dropped when it changed"""
+        if buffer_size != self.buffer_size:
+            self.buffer_size = buffer_size
+            self.rings = {}
+
+    def pair_output(self, suffix, output_attr):
+        """Register the output of a connected input once it exists"""
+        if self.data_inputs.get(suffix) is not None:
+            self.data_outputs[suffix] = output_attr
+
+    def forget(self, suffix):
+        """Drop everything kept for an input whose connection changed"""
+        self.data_outputs.pop(suffix, None)
+        self.rings.pop(suffix, None)
+        self.unsupported.discard(suffix)
+
+    def record(self, suffix, time, value) -> bool:
+        """Buffer a new sample, returns False if the input values are not numeric"""
+        ring = self.rings.get(suffix)
+        if ring is None or (isinstance(value, np.ndarray) and value.shape != ring.shape):
+            # === The ring is created on the first sample and again when the shape changes ===
+            array = np.asarray(value)
+            if array.dtype.kind not in "biuf":
+                self.unsupported.add(suffix)
+                return False
+            ring = self.rings[suffix] = RingBuffer(self.buffer_size, array.shape, array.dtype)
+        if time == ring.last_time:
+            # Same time as the last sample (paused timeline or repeated timestamp), keep only the newest value
+            ring.replace_last(value)
+        else:
+            ring.append(time, value)
+        return True
+
+
+class OgnSynchronizer:
+    """
+    Node that aligns its dynamic inputs on a common timestamp
+    """
+
+    @staticmethod
+    def internal_state():
+        """Returns an object that contains per-node state information"""
+        return OgnSynchronizerInternalState()
+
+    @staticmethod
+    def compute(db) -> bool:
+        """
+        Buffer the value of every input as a sample and write every output at the sample time
+        """
+        try:
+            state = db.per_instance_state
+            state.configure(max(2, db.inputs.bufferSize))
+
+            current_time = get_current_time()
+            sample_time = current_time - db.inputs.delay
+            interpolate = db.inputs.interpolation == "linear"
+            timestamps = db.inputs.timestamps
+
+            ready = True
+            data_inputs = state.data_inputs
+            data_outputs = state.data_outputs
+            connected = zip(data_inputs.connected_suffixes, data_inputs.connected_attributes)
+            for position, (suffix, input_attr) in enumerate(connected):
+                output_attr = data_outputs.get(suffix)
+                if output_attr is None:
+                    # The output is created at the end of the frame the input got connected
+                    ready = False
+                    continue
+
+                # === Every tick is a sample, stamped with the upstream time when one is given ===
+                # A value that did not change is still a sample, a held value followed by a step must not
+                # be interpolated as a ramp
+                value = input_attr.get()
+                time = float(timestamps[position]) if position < len(timestamps) else current_time
+                if not state.record(suffix, time, value):
+                    output_attr.set(value)
+                    continue
+
+                # === Write the value at the sample time ===
+                ring = state.rings.get(suffix)
+                aligned = ring.sample_at(sample_time, interpolate) if ring is not None else None
+                if aligned is None:
+                    ready = False
+                    continue
+                output_attr.set(aligned)
+
+            db.outputs.sampleTime = sample_time
+            db.outputs.ready = ready
+            db.outputs.execOut = og.ExecutionAttributeState.ENABLED
+            return True
+
+        except Exception as e:
+            carb.log_error(f"Error in Synchronizer compute: {e}")
+            return False
+
+    @staticmethod
+    def initialize(graph_context, node):
+        """
+        Initialize the node
+        """
+        try:
+            node.register_on_connected_callback(
+                OgnSynchronizer.on_connected_callback
+            )
+            node.register_on_disconnected_callback(
+                OgnSynchronizer.on_disconnected_callback
+            )
+
+            # === Index the inputs saved with the node and pair their outputs ===
+            state = OgnSynchronizerDatabase.per_node_internal_state(node)
+            data_inputs = state.data_inputs
+            data_inputs.rebuild(node)
+            for suffix in data_inputs.connected_suffixes:
+                output_name = f"{_OUTPUT_PREFIX}{suffix}"
+                if node.get_attribute_exists(output_name):
+                    state.pair_output(suffix, node.get_attribute(output_name))
+
+            # === Keep a single free input after the biggest connected input ===
+            remove_extra_inputs(node, data_inputs)
+            ensure_free_input(node, data_inputs)
+        except Exception as e:
+            carb.log_error(f"Error initializing Synchronizer: {e}")
+            raise
+
+    @staticmethod
+    def release(node):
+        """
+        Release the node
+        """
+        try:
+            remove_free_input(node, OgnSynchronizerDatabase.per_node_internal_state(node).data_inputs)
+            get_topology_editor().commit_node(node)
+        except Exception as e:
+            carb.log_error(f"Error releasing Synchronizer: {e}")
+            raise
+
+    @staticmethod
+    def _get_state(attr):
+        """Internal state of the Synchronizer owning the attribute, None for other nodes"""
+        node = attr.get_node()
+        if node.get_type_name() != _NODE_TYPE_NAME:
+            return None
+        return OgnSynchronizerDatabase.per_node_internal_state(node)
+
+    @staticmethod
+    def on_connected_callback(upstream_attr, downstream_attr):
+        """
+        Callback when an attribute is connected.
+        Resolves the input to the upstream type and creates its output with that type.
+        """
+        try:
+            state = OgnSynchronizer._get_state(downstream_attr)
+            if state is None:
+                return
+
+            data_inputs = state.data_inputs
+            suffix = data_inputs.suffix_of(downstream_attr.get_name())
+            if suffix is None:
+                return
+
+            resolve_from_upstream(upstream_attr, downstream_attr)
+            node = downstream_attr.get_node()
+            connect_dynamic_input(node, data_inputs, suffix, downstream_attr)
+            state.forget(suffix)
+
+            create_paired_output(
+                node,
+                upstream_attr,
+                f"{_OUTPUT_PREFIX}{suffix}",
+                on_created=lambda output_attr: state.pair_output(suffix, output_attr)
+            )
+
+            if suffix == data_inputs.last_suffix:
+                create_dynamic_input(node, data_inputs, suffix + 1)
+        except Exception as e:
+            carb.log_error(f"Error in Synchronizer on_connected_callback: {e}")
+            raise
+
+    @staticmethod
+    def on_disconnected_callback(upstream_attr, downstream_attr):
+        """
+        Callback when an attribute is disconnected.
+        Removes the paired output, the buffered samples and the extra free inputs.
+        """
+        try:
+            state = OgnSynchronizer._get_state(downstream_attr)
+            if state is None:
+                return
+
+            data_inputs = state.data_inputs
+            suffix = data_inputs.suffix_of(downstream_attr.get_name())
+            if suffix is None:
+                return
+
+            node = downstream_attr.get_node()
+            data_inputs.set_connected(suffix, None)
+            state.forget(suffix)
+
+            get_topology_editor().remove_attribute(node, f"{_OUTPUT_PREFIX}{suffix}")
+            remove_extra_inputs(node, data_inputs)
+        except Exception as e:
+            carb.log_error(f"Error in Synchronizer on_disconnected_callback: {e}")
+            raise
@@ -0,0 +1,151 @@
+import omni.graph.core as og
+import carb
+
+from isaacsim.nodes.more_nodes.impl.timeline import get_current_time
+from isaacsim.nodes.more_nodes.ogn.OgnTraceReplayDatabase import OgnTraceReplayDatabase
+
+
+class OgnTraceReplayInternalState:
+    """Convenience class for maintaining per-node state information"""
+
+    __slots__ = ("reader", "reader_path", "output_plan")
+
+    def __init__(self):
+        """Instantiate the per-node state information"""
+        self.reader = None
+        self.reader_path = None
+
+        # List of (column, output_attr) pairs, None when it must be rebuilt
+        self.output_plan = None
+
+    def get_current_time(self):
+        """Get the current time from the timeline shared by every node"""
+        return get_current_time()
+
+    def open(self, path):
+        """
+        Open a trace, nothing is read until a sample is requested.
+        A trace that cannot be opened is reported once and only retried when the path changes.
+        """
+        self.reader = None
+        self.reader_path = path
+        self.output_plan = None
+        if path:
+            from isaacsim.nodes.more_nodes.impl.trace import TraceReader
+
+            try:
+                self.reader = TraceReader(path)
+            except Exception as e:
+                carb.log_warn(f"TraceReplay cannot open the trace '{path}': {e}")
+
+    def build_output_plan(self, node):
+        """Pair every trace column with its existing output"""
+        self.output_plan = []
+        if self.reader is None:
+            return self.output_plan
+        for column in self.reader.columns:
+            attr_name = f"outputs:{column}"
+            if node.get_attribute_exists(attr_name):
+                self.output_plan.append((column, node.get_attribute(attr_name)))
+        return self.output_plan
+
+
+class OgnTraceReplay:
+    """
+    The Ogn node class that replays a recorded trace onto its outputs.
+    """
+
+    @staticmethod
+    def internal_state():
+        """Returns an object that contains per-node state information"""
+        return OgnTraceReplayInternalState()
+
+    @staticmethod
+    def initialize(graph_context: og.GraphContext, node: og.Node):
+        """
+        Initialize the node
+        """
+        try:
+            path_attr = node.get_attribute("inputs:tracePath")
+            path_attr.register_value_changed_callback(
+                OgnTraceReplay.on_value_changed_callback
+            )
+
+            # === Open the trace saved with the node ===
+            if path_attr.get():
+                OgnTraceReplay.on_value_changed_callback(path_attr)
+        except Exception as e:
+            carb.log_error(f"Error initializing OgnTraceReplay: {e}")
+            raise
+
+    @staticmethod
+    def on_value_changed_callback(attr) -> None:
+        """
+        Callback when the trace path changes.
+        Opens the trace and creates one output per recorded column.
+        """
+        try:
+            node = attr.get_node()
+            state = OgnTraceReplayDatabase.per_node_internal_state(node)
+            state.open(attr.get())
+            columns = state.reader.columns if state.reader is not None else {}
+
+            # === Remove the outputs of the previous trace ===
+            for output_attr in node.get_attributes():
+                attr_name = output_attr.get_name()
+                if (
+                    output_attr.is_dynamic()
+                    and attr_name.startswith("outputs:")
+                    and attr_name[len("outputs:"):] not in columns
+                ):
+                    node.remove_attribute(attr_name)
+
+            # === Create an output with the recorded type for each column ===
+            for column, ogn_type in columns.items():
+                attr_name = f"outputs:{column}"
+                if node.get_attribute_exists(attr_name):
+                    continue
+                og.Controller().create_attribute(
+                    node,
+                    attr_name=attr_name,
+                    attr_type=og.AttributeType.type_from_ogn_type_name(ogn_type),
+                    attr_port=og.AttributePortType.ATTRIBUTE_PORT_TYPE_OUTPUT
+                )
+            state.output_plan = None
+        except Exception as e:
+            carb.log_error(f"Error opening trace in OgnTraceReplay: {e}")
+
+    @staticmethod
+    def compute(db) -> bool:
+        try:
+            state = db.per_instance_state
+
+            trace_path = db.inputs.tracePath
+            if trace_path != state.reader_path:
+                state.open(trace_path)
+
+            if state.reader is None:
+                return False
+
+            output_plan = state.output_plan
+            if output_plan is None:
+                output_plan = state.build_output_plan(db.abi_node)
+
+            # === Seek the sample for the current time ===
+            location = state.reader.locate(state.get_current_time() + db.inputs.timeOffset)
+            if location is None:
+                return False
+
+            chunk_index, row = location
+            for column, output_attr in output_plan:
+                value = state.reader.value(chunk_index, row, column)
+                if value is not None:
+                    output_attr.set(value)
+
+            db.outputs.sampleTime = float(state.reader.times(chunk_index)[row])
+            db.outputs.execOut = og.ExecutionAttributeState.ENABLED
+            return True
+
+        except Exception as e:
+            carb.log_error(f"Error in TraceReplay compute: {e}")
+            return False